@@ -0,0 +1,488 @@
+import asyncio
+import http.server
+import importlib.util
+import json
+import os
+import threading
+import time
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "fuzzer", os.path.join(os.path.dirname(__file__), "tst_1759732713798.py"))
+fuzzer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fuzzer)
+
+
+# -- GA ------------------------------------------------------------------------
+
+def test_ga_population_fitness_tracks_fitness_function():
+    crashes = [{"input": {"age": -7, "rating": 0, "role": "admin;"}},
+               {"input": {"age": 3, "permissions": ["read"] * 3}},
+               {"input": "raw, not an object"}]
+    candidates = [{"age": -i, "rating": 1, "role": "x" * i, "permissions": ["read"] * i, "extra": None}
+                  if i % 2 else {"username": "u" * i, "age": i}
+                  for i in range(50)]
+
+    population = fuzzer.GAPopulation(max_size=1000)
+    keys = population.add_many(candidates)
+    # The crash window moves one crash at a time, then past the first five
+    for n in range(len(crashes) + 1):
+        population.update_crashes(crashes[:n])
+        assert [population.fitness(key) for key in keys] == [
+            fuzzer.fitness_function(candidate, crashes[:n]) for candidate in candidates]
+    more = crashes + [{"input": {"username": "a"}}] * 5
+    population.update_crashes(more)
+    assert [population.fitness(key) for key in keys] == [
+        fuzzer.fitness_function(candidate, more) for candidate in candidates]
+
+
+def test_ga_population_ranks_and_evicts_by_seed_score():
+    population = fuzzer.GAPopulation(max_size=3)
+    seeds = [{"a": 1}, {"a": -1, "b": ";"}, {"a": 0}, {"a": 1, "b": 2}]
+    population.add_many(seeds + seeds[:1])
+    assert len(population) == 3 and population.hits == 1
+    ranked = [population.individuals[key]["data"] for key in population.elite(3)]
+    assert ranked == sorted(seeds, key=fuzzer.seed_score, reverse=True)[:3]
+
+
+# -- CrashIndex ----------------------------------------------------------------
+
+def traceback_output(line, message="CRASH: Buffer overflow detected!"):
+    return ("Traceback (most recent call last):\n"
+            '  File "<string>", line 9, in <module>\n'
+            '  File "/tmp/a/vulnerable_parser.py", line 3, in parse\n'
+            f'  File "/tmp/a/vulnerable_parser.py", line {line}, in check\n'
+            f"Exception: {message}\n")
+
+
+def test_crash_index_buckets_by_trace_and_keeps_the_smallest_reproducer():
+    index = fuzzer.CrashIndex()
+    sig, status = index.add({"a": 1}, "xxxx", traceback_output(12), 1)
+    assert status == "new" and sig == index.signature(traceback_output(12))[0]
+    # Same exception type and frames, other message: same bug
+    assert index.add({"a": 2}, "xxxxxx", traceback_output(12, "CRASH: other text"), 2) == (sig, "")
+    assert index.add({"a": 3}, "xx", traceback_output(12), 3) == (sig, "smaller")
+    assert index.add({"a": 4}, "x", traceback_output(13), 4)[1] == "new"
+
+    bucket = index.buckets[sig]
+    assert bucket["hits"] == 3 and bucket["first_input"] == {"a": 1} and bucket["input"] == {"a": 3}
+    assert bucket["frames"] == ["vulnerable_parser.py:parse:3", "vulnerable_parser.py:check:12"]
+    assert len(index) == 2 and index.total_hits == 4
+    assert not index.update_reproducer(sig, {"a": 5}, "yy", "") and index.update_reproducer(sig, {}, "y", "")
+
+
+def test_crash_index_without_traceback_masks_numbers():
+    index = fuzzer.CrashIndex()
+    assert index.signature("CRASH: age -5 < 0\n")[0] == index.signature("CRASH: age -71 < 0\n")[0]
+    hangs = fuzzer.HangIndex()
+    assert hangs.signature(traceback_output(12))[0] == hangs.signature(traceback_output(40))[0]
+
+
+def test_crash_index_merges_worker_updates():
+    worker, hub = fuzzer.CrashIndex(), fuzzer.CrashIndex()
+    hub.add({"a": 1}, "xxxx", traceback_output(12), 1)
+    worker.add({"a": 2}, "xx", traceback_output(12), 5)
+    worker.add({"a": 3}, "xxx", traceback_output(13), 6)
+    worker.add({"a": 3}, "xxx", traceback_output(13), 7)
+
+    new = hub.merge(worker.drain_updates())
+    assert new == [worker.signature(traceback_output(13))[0]]
+    assert hub.total_hits == 4 and hub.buckets[new[0]]["hits"] == 2
+    assert hub.entries()[0]["input"] == {"a": 2} and worker.drain_updates() == []
+
+
+# -- Targets -------------------------------------------------------------------
+
+def test_make_target_rejects_argv_delivery_for_python_targets(monkeypatch):
+    monkeypatch.setattr(fuzzer, "TARGET_COMMAND", None)
+    monkeypatch.setattr(fuzzer, "EXECUTION_MODE", "subprocess")
+    monkeypatch.setattr(fuzzer, "INPUT_DELIVERY", "argv")
+    with pytest.raises(ValueError, match="INPUT_DELIVERY"):
+        fuzzer.make_target()
+
+    # An external command gets the input as its argument if it asks for that
+    monkeypatch.setattr(fuzzer, "TARGET_COMMAND", ["cat", "@@"])
+    monkeypatch.setattr(fuzzer, "TARGET_DELIVERY", "argv")
+    assert fuzzer.make_target().mode == "argv"
+
+
+# -- CorpusStore ---------------------------------------------------------------
+
+def test_corpus_store_dedups_and_reads_like_a_list():
+    corpus = fuzzer.CorpusStore([{"x": 1}, {"x": 2}, {"x": 1}])
+    assert len(corpus) == 2
+    assert list(corpus) == [{"x": 1}, {"x": 2}]
+    assert corpus[-1] == {"x": 2} and corpus[:1] == [{"x": 1}]
+    assert not corpus.add({"x": 2})
+    assert corpus.find('{"x": 2}') == 1 and corpus.find('{"x": 3}') is None
+
+
+def test_corpus_store_replace_with_a_known_entry_keeps_positions():
+    corpus = fuzzer.CorpusStore([{"x": 1}, {"x": 2}, {"x": 3}])
+    assert not corpus.replace(0, {"x": 3})
+    assert list(corpus) == [{"x": 1}, {"x": 2}, {"x": 3}]
+
+    assert corpus.replace(0, {"x": 0})
+    assert list(corpus) == [{"x": 0}, {"x": 2}, {"x": 3}]
+    assert corpus.find('{"x": 1}') is None
+
+
+def test_corpus_store_layers_on_a_shared_base():
+    base = fuzzer.CorpusStore([{"seed": 1}, {"seed": 2}]).share()
+    with pytest.raises(ValueError):
+        base.add({"seed": 3})
+
+    corpus = fuzzer.CorpusStore(base=base)
+    assert not corpus.add({"seed": 1})
+    assert corpus.add({"found": 1}, exec_time=0.5, found_new=True)
+    assert list(corpus) == [{"seed": 1}, {"seed": 2}, {"found": 1}]
+    assert corpus.found_count() == 1 and len(base) == 2
+
+
+def test_corpus_store_retain_compacts_and_keeps_metadata():
+    corpus = fuzzer.CorpusStore([{"x": i} for i in range(100)])
+    corpus.picked(7, 2)
+    corpus.COMPACT_SLACK = 0
+    corpus.retain([7, 3])
+    assert list(corpus) == [{"x": 7}, {"x": 3}]
+    assert corpus.slots == 2  # Compacted: dead slots dropped
+    assert corpus.export()[0]["hits"] == 1 and corpus.export()[0]["finds"] == 2
+    assert corpus.add({"x": 50}) and not corpus.add({"x": 7})
+
+
+def test_power_scheduler_stays_in_range_after_replace():
+    corpus = fuzzer.CorpusStore([{"x": i} for i in range(3)])
+    scheduler = fuzzer.PowerScheduler()
+    scheduler.choose(corpus)
+    corpus.replace(0, {"x": 2})
+    corpus.replace(1, {"x": -1})
+    scheduler.report(corpus, 1)
+    assert len(scheduler.tree) == len(corpus) == 3
+    assert all(0 <= scheduler.choose(corpus) < len(corpus) for _ in range(200))
+
+
+# -- SumTree / PowerScheduler --------------------------------------------------
+
+def test_sum_tree_totals_and_finds_by_cumulative_weight():
+    tree = fuzzer.SumTree()
+    weights = [0.5, 2.0, 0.0, 1.5, 3.0, 1.0, 0.25]
+    for weight in weights:
+        tree.append(weight)
+    assert tree.total() == pytest.approx(sum(weights))
+    bounds = [sum(weights[:i]) for i in range(len(weights) + 1)]
+    for i, weight in enumerate(weights):
+        if weight:
+            assert tree.find(bounds[i]) == i and tree.find(bounds[i + 1] - 1e-9) == i
+
+    tree.update(1, 0.0)
+    tree.update(2, 4.0)
+    assert tree.total() == pytest.approx(sum(weights) + 2.0)
+    assert tree.find(0.6) == 2 and tree.find(4.49) == 2 and tree.find(4.51) == 3
+
+
+def test_power_scheduler_favours_fast_small_productive_entries():
+    corpus = fuzzer.CorpusStore()
+    corpus.add({"fast": 1}, exec_time=0.001, found_new=True)
+    corpus.add({"slow": "x" * 500}, exec_time=0.1)
+    corpus.picked(0, 3)
+    scheduler = fuzzer.PowerScheduler()
+    assert sum(scheduler.choose(corpus) for _ in range(500)) < 50
+
+    # Picked over and over without finds, an entry's energy decays
+    before = scheduler.energy(corpus, corpus.slot(1))
+    for _ in range(15):
+        corpus.picked(1, 0)
+    assert scheduler.energy(corpus, corpus.slot(1)) == pytest.approx(before / 4)
+
+    corpus.retain([1])
+    scheduler.rebuild(corpus)
+    assert len(scheduler.tree) == 1 and scheduler.choose(corpus) == 0
+
+
+# -- CampaignStore -------------------------------------------------------------
+
+def checkpoint(store, corpus, tests=10):
+    store.checkpoint(tests, corpus, fuzzer.CrashIndex(), fuzzer.HangIndex(), fuzzer.CoverageTracker())
+
+
+def test_campaign_store_resumes_live_entries_only(tmp_path):
+    store = fuzzer.CampaignStore(str(tmp_path))
+    store.reset()
+    store.open()
+    corpus = fuzzer.CorpusStore([{"seed": 1}])
+    for i in range(3):
+        entry = {"found": i}
+        corpus.add(entry, found_new=True)
+        store.add_entry(json.dumps(entry), frozenset({(i, 1)}))
+    corpus.picked(1, 1)
+    corpus.retain([0, 1, 3])  # {"found": 1} distilled away
+    checkpoint(store, corpus)
+    store.add_entry(json.dumps({"late": 1}), None)  # After the checkpoint
+    store.close()
+
+    loaded = fuzzer.CampaignStore(str(tmp_path))
+    assert loaded.load() and loaded.tests == 10
+    assert [json.loads(content) for content in loaded.contents] == [
+        {"seed": 1}, {"found": 0}, {"found": 2}, {"late": 1}]
+    assert loaded.features == [None, frozenset({(0, 1)}), frozenset({(2, 1)}), None]
+    assert loaded.meta[1]["hits"] == 1 and loaded.meta[1]["new"] and loaded.meta[3] is None
+
+
+def test_campaign_store_ignores_a_torn_last_line_and_compacts(tmp_path):
+    store = fuzzer.CampaignStore(str(tmp_path))
+    store.reset()
+    store.open()
+    corpus = fuzzer.CorpusStore([{"x": i} for i in range(200)])
+    checkpoint(store, corpus)
+    corpus.retain([5, 7])
+    checkpoint(store, corpus)  # Mostly dead: rewritten into the next generation
+    assert store.generation == 1
+    store.entries_file.write(b'{"content": "{\\"torn')
+    store.close()
+
+    loaded = fuzzer.CampaignStore(str(tmp_path))
+    assert loaded.load()
+    assert [json.loads(content) for content in loaded.contents] == [{"x": 5}, {"x": 7}]
+    assert not os.path.exists(store.entries_path(0))
+
+    loaded.open()  # Cuts the torn line off before appending
+    assert loaded.add_entry(json.dumps({"x": 8}), None) and not loaded.add_entry(json.dumps({"x": 5}), None)
+    loaded.close()
+    assert len(fuzzer.CampaignStore._read_log(loaded.entries_path(1))) == 3
+
+
+# -- FuzzerStats ----------------------------------------------------------------
+
+def test_fuzzer_stats_books_worker_restarts_as_startup(tmp_path):
+    stats = fuzzer.FuzzerStats(str(tmp_path / "GA"), "GA")
+    stats.lap("startup")
+    time.sleep(0.05)
+    exec_time = stats.lap("exec")
+    stats.shift("exec", "startup", 0.03)
+    assert stats.times["exec"] == pytest.approx(exec_time - 0.03)
+    assert stats.times["startup"] >= 0.03
+
+    corpus = fuzzer.CorpusStore([{"x": 1}])
+    summary = stats.update(1, corpus, fuzzer.CrashIndex(), fuzzer.HangIndex(), fuzzer.CoverageTracker())
+    stats.close()
+    assert [phase for phase in fuzzer.STATS_PHASES if f"time_{phase}" in summary] == list(fuzzer.STATS_PHASES)
+    assert "time_startup" in (tmp_path / "GA" / "fuzzer_stats").read_text()
+    header, row = (tmp_path / "GA" / "plot_data").read_text().splitlines()
+    assert header == "# " + ", ".join(fuzzer.PLOT_FIELDS) and row.split(", ")[1] == "1"
+
+
+# -- AsyncHTTPPool / LLMMutationBackend (stub Ollama) --------------------------
+
+class StubOllama(http.server.ThreadingHTTPServer):
+    """
+    Answers POSTs with reply(request) -> (status, body dict).  chunked sends
+    the body chunk-encoded; drop_idle closes every connection after its reply
+    without saying so, like a server timing out an idle keep-alive connection.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, reply):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.reply = reply
+        self.chunked = False
+        self.drop_idle = False
+        self.requests = []
+        self.connections = 0
+        threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(request)
+        status, reply = self.server.reply(request)
+        body = json.dumps(reply).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(body), 7):
+                piece = body[i:i + 7]
+                self.wfile.write(b"%x;ext=1\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        self.close_connection = self.server.drop_idle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_ollama():
+    servers = []
+
+    def start(reply):
+        servers.append(StubOllama(reply))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def echo(request):
+    return 200, {"echo": request}
+
+
+def post_all(pool, payloads):
+    async def run():
+        return [await pool.post_json("/api/generate", payload) for payload in payloads]
+
+    try:
+        return asyncio.run(run())
+    finally:
+        pool.close()
+
+
+def test_http_pool_reads_chunked_replies_over_one_keep_alive_connection(stub_ollama):
+    server = stub_ollama(echo)
+    server.chunked = True
+    payloads = [{"prompt": "x" * n} for n in (1, 100, 5000)]
+    assert post_all(fuzzer.AsyncHTTPPool(server.url, size=1, timeout=5), payloads) == [
+        {"echo": payload} for payload in payloads]
+    assert server.connections == 1
+
+
+def test_http_pool_retries_once_when_an_idle_connection_was_dropped(stub_ollama):
+    server = stub_ollama(echo)
+    server.drop_idle = True
+    payloads = [{"n": 1}, {"n": 2}]
+    assert post_all(fuzzer.AsyncHTTPPool(server.url, size=1, timeout=5), payloads) == [
+        {"echo": payload} for payload in payloads]
+    assert server.requests == payloads and server.connections == 2
+
+
+def test_http_pool_raises_on_error_status(stub_ollama):
+    server = stub_ollama(lambda request: (500, {"error": "model not found"}))
+    with pytest.raises(ConnectionError):
+        post_all(fuzzer.AsyncHTTPPool(server.url, size=1, timeout=5), [{}])
+
+
+def ollama_patches(request):
+    """Ollama reply with one patch per numbered input of the prompt: {"tag": that input's "id"}."""
+
+    parents = [json.loads(line.partition(": ")[2]) for line in request["prompt"].splitlines()
+               if line.startswith("Input ")]
+    mutations = {str(i): [{"tag": parent["id"]}] for i, parent in enumerate(parents)}
+    return 200, {"response": json.dumps({"mutations": mutations})}
+
+
+@pytest.fixture
+def backend(stub_ollama, monkeypatch):
+    monkeypatch.setattr(fuzzer, "LLM_BATCH_WAIT", 0.2)
+    monkeypatch.setattr(fuzzer, "LLM_CACHE_SIZE", 2)
+    server = stub_ollama(ollama_patches)
+    backend = fuzzer.LLMMutationBackend(server.url, model="stub")
+    backend.server = server
+    yield backend
+    backend.close()
+
+
+def parent(i):
+    return {"id": i, f"field{i}": "x"}  # A distinct shape per i
+
+
+def test_llm_backend_batches_queued_parents_into_one_prompt(backend):
+    for i in range(3):
+        assert len(list(backend.mutate(parent(i), batch_size=4))) == 4  # Simulated while fetching
+        backend.prefetch(parent(i))  # Already in flight: not queued twice
+    wait_until(lambda: not backend.in_flight)
+
+    assert len(backend.server.requests) == 1 and backend.server.requests[0]["model"] == "stub"
+    assert backend.stats == {"hits": 0, "misses": 3, "requests": 1, "failures": 0}
+    assert [fuzzer.input_shape(parent(i)) in backend.cache for i in range(3)] == [False, True, True]
+    assert list(backend.mutate(parent(2), batch_size=3)) == [dict(parent(2), tag=2)] * 3
+    assert backend.stats["hits"] == 1
+
+
+def test_llm_backend_evicts_the_least_recently_used_shape(backend):
+    for i in range(2):
+        backend.prefetch(parent(i))
+    wait_until(lambda: len(backend.cache) == 2)
+    list(backend.mutate(parent(0), batch_size=1))  # Parent 1's shape is now the oldest
+
+    backend.prefetch(parent(2))
+    wait_until(lambda: fuzzer.input_shape(parent(2)) in backend.cache)
+    assert list(backend.cache) == [fuzzer.input_shape(parent(0)), fuzzer.input_shape(parent(2))]
+
+
+def test_llm_backend_backs_off_after_a_failed_request(backend):
+    backend.server.reply = lambda request: (500, {"error": "overloaded"})
+    backend.prefetch(parent(0))
+    wait_until(lambda: backend.stats["failures"] == 1)
+    wait_until(lambda: not backend.in_flight)
+    assert backend.backoff_until > time.time()
+
+    backend.server.reply = ollama_patches
+    backend.prefetch(parent(1))  # Dropped during the backoff
+    time.sleep(0.3)
+    assert len(backend.server.requests) == 1 and not backend.cache
+
+    backend.backoff_until = 0.0
+    backend.prefetch(parent(1))
+    wait_until(lambda: backend.cache)
+    assert len(backend.server.requests) == 2
+
+
+# -- Benchmarks ----------------------------------------------------------------
+
+def bench_results(best_ns, noise, reference_ns, all_bugs=None, execs_per_sec=1000.0):
+    return {"micro": {"op": {"best_ns": best_ns, "noise": noise, "reference_ns": reference_ns}},
+            "macro": {"GA": {"execs_per_sec": execs_per_sec, "noise": 0.0, "first_crash": None,
+                             "all_bugs": all_bugs}}}
+
+
+def test_compare_benchmarks_scales_tolerance_with_measured_noise():
+    baseline = bench_results(1000.0, 0.01, 5e5)
+    assert fuzzer.compare_benchmarks(bench_results(1040.0, 0.01, 5e5), baseline) == []
+    assert len(fuzzer.compare_benchmarks(bench_results(1100.0, 0.01, 5e5), baseline)) == 1
+    # Rounds 10% apart: a 25% slowdown is within 3x that
+    assert fuzzer.compare_benchmarks(bench_results(1250.0, 0.10, 5e5), baseline) == []
+    # The whole machine ran 40% slower, as timed by the reference workload
+    assert fuzzer.compare_benchmarks(bench_results(1400.0, 0.01, 7e5), baseline) == []
+
+
+def test_compare_benchmarks_only_trusts_milestones_the_median_run_reached():
+    def results(all_bugs):
+        return bench_results(1000.0, 0.0, 1.0, all_bugs)
+
+    reached = {"tests": 300, "seconds": 0.1, "noise": 0.1}
+    slower = {"tests": 900, "seconds": 0.5, "noise": 0.1}
+    assert fuzzer.compare_benchmarks(results(None), results(reached)) == [
+        "GA all_bugs: reached at test 300 -> never"]
+    assert fuzzer.compare_benchmarks(results(None), results(dict(reached, noise=None))) == []
+    assert fuzzer.compare_benchmarks(results(slower), results(reached)) == [
+        "GA all_bugs: test 300 -> 900 (0.1s -> 0.5s)"]
+    # Same test, slower machine: that's the execs/sec figure's business
+    assert fuzzer.compare_benchmarks(results(dict(reached, seconds=0.5)), results(reached)) == []
+    assert fuzzer.compare_benchmarks(results(dict(slower, noise=None)), results(reached)) == []
@@ -14,19 +14,108 @@ Just run this code! It uses simulated LLM by default.
 import sys
 import json
 import random
-import copy
 import subprocess
 import os
+import re
+import marshal
+import math
 import time
-from typing import List, Tuple
+import hashlib
+import itertools
+import threading
+import ast
+import asyncio
+import array
+import base64
+import bisect
+import collections
+import contextlib
+import importlib
+import importlib.util
+import io
+import signal
+import statistics
+import traceback
+import urllib.parse
+import urllib.request
+import select
+import struct
+import tempfile
+import queue
+import multiprocessing
+import zlib
+from typing import List, Tuple, Optional, Callable, Iterator
 
 # ============================================================================
 # CONFIGURATION - CHANGE THESE SETTINGS
 # ============================================================================
 
 USE_REAL_LLM = False  # 👈 CHANGE THIS TO True IF YOU INSTALLED OLLAMA
+OLLAMA_URL = "http://localhost:11434"  # 👈 Ollama HTTP API (or a local stub server)
+OLLAMA_MODEL = "llama3"  # 👈 Any model you have pulled with `ollama pull`
 TESTS_PER_METHOD = 30  # 👈 30 = Quick demo (~2 min), 100 = Full demo (~8 min)
 VERBOSE_MODE = True  # 👈 True = Show all details, False = Show only key results
+EXECUTION_MODE = "persistent"  # 👈 "persistent" = import target once, "forkserver" = ... and fork per test, "subprocess" = new Python per test, "inprocess" = call it directly
+INPUT_DELIVERY = "stdin"  # 👈 Subprocess mode input: "stdin", "file" (one reused tmpfs file) or "memfd"
+TARGET_MODULE = "vulnerable_parser"  # 👈 Python target: a module in the working directory (or on sys.path) ...
+TARGET_FUNCTION = "check_user_role"  # ... and its function that takes one input string
+TARGET_COMMAND = None  # 👈 External target instead, e.g. ["./parser", "@@"] (@@ = the input file; no @@ = stdin)
+TARGET_DELIVERY = None  # External target input: "stdin", "file", "memfd", "argv" (None = its preferred one)
+TARGET_CRASH_DETECTION = "exit"  # External target crashes: "exit" = non-zero exit or signal, "signal" = signal only
+SEED_DIR = None  # 👈 Directory of *.json seeds for your own target (None = the built-in seeds)
+NUM_WORKERS = 1  # 👈 >1 = spread each campaign across this many CPU cores
+SYNC_INTERVAL = 25  # Tests between corpus syncs when NUM_WORKERS > 1
+EXEC_TIMEOUT_MAX = 2  # Seconds per exec before calibration, and the most calibration may pick
+EXEC_TIMEOUT_MIN = 0.25  # Least calibration may pick (absorbs scheduling jitter)
+TIMEOUT_P99_FACTOR = 5  # 👈 Exec timeout = this x the p99 exec time of the seed corpus
+CALIBRATION_RUNS = 3  # Times each seed is run to measure exec time
+HANG_CONFIRM_FACTOR = 4  # Suspected hangs are re-run with this x the timeout before counting
+CRASH_TOP_FRAMES = 3  # Innermost stack frames that identify a unique crash
+MINIMIZE_CRASHES = True  # 👈 Shrink new crash reproducers in the background
+MINIMIZE_MAX_EXECS = 300  # Exec budget per crash when minimizing
+CAMPAIGN_DIR = os.path.join("test_files", "campaigns")  # Durable per-method campaign state
+RESUME_CAMPAIGNS = False  # 👈 True = continue each method from its last checkpoint instead of starting over
+CHECKPOINT_INTERVAL = 100  # Tests between atomic checkpoints of the campaign state
+IMPORT_QUEUE_FROM = None  # 👈 Campaign directory whose queue entries that add coverage are imported at start
+STATS_INTERVAL = 1  # Seconds between fuzzer_stats / plot_data updates in each campaign directory
+CMIN_INTERVAL = 100  # 👈 Distill the campaign corpus every N tests (0 = never)
+SCHEDULER = "power"  # 👈 Parent selection: "power" = energy-based, "uniform" = random.choice
+MUTATION_BATCH_SIZE = None  # Mutants pulled per parent (None = each mutator's default)
+LLM_BATCH_PARENTS = 4  # Parents sent to the LLM in one prompt
+LLM_BATCH_WAIT = 0.05  # Seconds to wait for more parents before sending a batch
+LLM_POOL_SIZE = 4  # Concurrent keep-alive connections to Ollama
+LLM_TIMEOUT = 60  # Seconds per LLM request
+LLM_CACHE_SIZE = 256  # Input shapes with cached LLM suggestions (LRU)
+LLM_SUGGESTIONS = 8  # Edits requested per parent
+GA_POPULATION_SIZE = 1000  # Individuals the GA keeps (with memoized scores) across generations
+GA_ELITE_SIZE = 10  # Top-ranked individuals bred each generation
+GA_TOPOLOGY = "ring"  # 👈 Island migration when NUM_WORKERS > 1: "ring", "star" or "full"
+GA_MIGRATION_INTERVAL = 50  # Tests an island runs between migrations
+GA_MIGRANTS = 3  # Best individuals an island sends per migration
+STRUCT_MAX_NODES = 2000  # Structure-aware mutator: nodes before growing operators back off
+STRUCT_MAX_DEPTH = 32  # ... and maximum nesting depth it creates
+OPERATOR_SCHEDULING = "mopt"  # 👈 Mutation operator choice: "mopt" = adaptive (MOpt-style), "uniform" = random.choice
+MOPT_PERIOD = 50  # Mutants between swarm updates of the operator probabilities
+MOPT_INERTIA = 0.5  # Swarm velocity inertia
+MOPT_MIN_PROB = 0.02  # Floor for any operator's probability
+AUTO_DICTIONARY = True  # 👈 Feed every mutator magic values read off the target (compared strings/numbers, looked-up keys)
+CMPLOG = True  # 👈 ... and learn more from its comparisons at run time (persistent / forkserver modes)
+DICTIONARY_PROBABILITY = 0.3  # How often a mutator takes a dictionary token over its built-in values
+BENCH_SEED = 1234  # RNG seed of every benchmark (python <this file> bench)
+BENCH_REPEATS = 7  # Timed repeats per micro-benchmark (the median and best are reported)
+BENCH_MACRO_TESTS = 3000  # Tests per method in the end-to-end benchmarks
+BENCH_MACRO_REPEATS = 3  # Campaigns per method in the end-to-end benchmarks (the quickest is reported)
+BENCH_REGRESSION_THRESHOLD = 0.05  # Least micro-benchmark slowdown vs the baseline that counts as a regression
+BENCH_MACRO_THRESHOLD = 0.25  # ... and the same for the (noisier) end-to-end numbers
+BENCH_NOISE_FACTOR = 3.0  # Both are raised per benchmark to this many times the noise measured for it
+EXPERIMENT_TRIALS = 10  # 👈 Independent trials per method (python <this file> experiment)
+EXPERIMENT_TESTS = 1000  # 👈 Tests per trial
+EXPERIMENT_METHODS = ("Traditional", "LLM", "GA", "Structured")  # Methods compared
+EXPERIMENT_PROCESSES = None  # Trials run at once (None = one per CPU core)
+EXPERIMENT_SEED = 1  # Trial i of every method is seeded with EXPERIMENT_SEED + i
+EXPERIMENT_SAMPLES = 20  # Points on each coverage-over-time curve
+EXPERIMENT_CONFIDENCE = 0.95  # Confidence interval level; 1 - this is the significance level
+EXPERIMENT_BOOTSTRAP = 1000  # Bootstrap resamples per confidence interval
 
 print("=" * 60)
 print("FUZZER CONFIGURATION")
@@ -34,6 +123,8 @@ print("=" * 60)
 print(f"LLM Mode: {'REAL (Ollama)' if USE_REAL_LLM else 'SIMULATED (Pattern-based)'}")
 print(f"Tests per method: {TESTS_PER_METHOD}")
 print(f"Verbose output: {VERBOSE_MODE}")
+print(f"Execution mode: {EXECUTION_MODE}")
+print(f"Workers: {NUM_WORKERS}")
 print("=" * 60 + "\n")
 
 
@@ -133,15 +224,55 @@ def create_seed_files():
     return [f"test_files/seed_{i}.json" for i in range(len(seeds))]
 
 
+def find_seed_files() -> List[str]:
+    """The *.json seeds in SEED_DIR, or the built-in seeds (created first)."""
+
+    if SEED_DIR is None:
+        return create_seed_files()
+    return [os.path.join(SEED_DIR, name) for name in sorted(os.listdir(SEED_DIR)) if name.endswith(".json")]
+
+
 # ============================================================================
 # PART 3: COVERAGE TRACKER
 # ============================================================================
 
+MAP_SIZE = 1 << 16  # Edge bitmap slots (like AFL's shared-memory map)
+
+# AFL-style hit-count buckets: 1, 2, 3, 4-7, 8-15, 16-31, 32-127, 128+ -> one bit each
+COUNT_CLASS = bytes(
+    0 if n == 0 else 1 if n == 1 else 2 if n == 2 else 4 if n == 3 else
+    8 if n < 8 else 16 if n < 16 else 32 if n < 32 else 64 if n < 128 else 128
+    for n in range(256)
+)
+
+
 class CoverageTracker:
-    """Tracks which types of bugs we've discovered."""
+    """Tracks which types of bugs we've discovered and which code edges we've hit."""
 
     def __init__(self):
         self.covered_bugs = set()
+        self.virgin_bits = bytearray(MAP_SIZE)  # Hit-count buckets seen so far per edge
+        self.edges_seen = 0
+
+    def analyze_trace(self, trace) -> bool:
+        """
+        Fold one execution's edge trace [(edge, hits), ...] into the bitmap.
+        Returns True if it hit a new edge or a new hit-count bucket of a known edge.
+        """
+
+        virgin = self.virgin_bits
+        found_new = False
+
+        for edge, hits in trace:
+            bucket = COUNT_CLASS[hits] if hits < 256 else 128
+            seen = virgin[edge]
+            if bucket & ~seen:
+                if not seen:
+                    self.edges_seen += 1
+                virgin[edge] = seen | bucket
+                found_new = True
+
+        return found_new
 
     def analyze_output(self, output):
         """Identify which bug type from crash output."""
@@ -160,56 +291,908 @@ class CoverageTracker:
         """Return how many unique bug types we've found (out of 5 total)."""
         return len(self.covered_bugs)
 
+    def get_edge_count(self):
+        """Return how many distinct code edges we've hit."""
+        return self.edges_seen
+
+    def merge(self, other_bugs, other_bits=None):
+        """Fold in bug types (and edge bitmap) found by another worker."""
+        self.covered_bugs |= set(other_bugs)
+
+        if other_bits is not None:
+            merged = int.from_bytes(self.virgin_bits, "little") | int.from_bytes(other_bits, "little")
+            self.virgin_bits = bytearray(merged.to_bytes(MAP_SIZE, "little"))
+            self.edges_seen = MAP_SIZE - self.virgin_bits.count(0)
+
+
+TRACEBACK_FRAME = re.compile(r'File "([^"]+)", line (\d+), in (\S+)')
+EXCEPTION_LINE = re.compile(r'^([A-Za-z_][\w.]*)(?::|$)')
+
+
+class CrashIndex:
+    """
+    Buckets crashes by stack-trace signature (exception type + top-N frames).
+
+    Each bucket keeps only its first reproducer, its smallest reproducer and a
+    hit counter, so memory stays flat no matter how many times a bug re-triggers.
+    """
+
+    def __init__(self, top_frames: int = CRASH_TOP_FRAMES):
+        self.top_frames = top_frames
+        self.buckets = {}  # signature -> bucket dict
+        self.total_hits = 0
+        self.pending = {}  # signature -> hits since the last drain_updates()
+
+    def signature(self, output: str) -> Tuple[str, str, List[str]]:
+        """Normalize a crash output into (signature, exception, frames)."""
+
+        # Frames from the persistent harness itself ("<string>") aren't part of the bug
+        frames = [f"{os.path.basename(path)}:{func}:{line}"
+                  for path, line, func in TRACEBACK_FRAME.findall(output)
+                  if path != "<string>"]
+        frames = frames[-self.top_frames:]
+
+        exception = ""
+        if frames:
+            for line in reversed(output.strip().splitlines()):
+                match = EXCEPTION_LINE.match(line)
+                if match:
+                    exception = match.group(1)
+                    break
+        else:
+            # No traceback (timeouts, dead workers): use the message with numbers masked
+            crash_lines = [line for line in output.splitlines() if "CRASH" in line]
+            exception = re.sub(r"\d+", "N", crash_lines[0] if crash_lines else output.strip()[:200])
+
+        digest = hashlib.sha1("|".join([exception] + frames).encode("utf-8")).hexdigest()[:16]
+        return digest, exception, frames
+
+    def add(self, crash_input: dict, content: str, output: str, test_number: int) -> Tuple[str, str]:
+        """
+        Record one crash. Returns (signature, status) where status is
+        "new" for a new bucket, "smaller" for a smaller reproducer, or "" for a duplicate.
+        """
+
+        sig, exception, frames = self.signature(output)
+        self.total_hits += 1
+        self.pending[sig] = self.pending.get(sig, 0) + 1
+
+        bucket = self.buckets.get(sig)
+        if bucket is None:
+            self.buckets[sig] = {
+                "signature": sig,
+                "exception": exception,
+                "frames": frames,
+                "hits": 1,
+                "first_test": test_number,
+                "first_input": crash_input,
+                "test_number": test_number,
+                "input": crash_input,
+                "size": len(content),
+                "output": output
+            }
+            return sig, "new"
+
+        bucket["hits"] += 1
+        if len(content) < bucket["size"]:
+            bucket.update(test_number=test_number, input=crash_input, size=len(content), output=output)
+            return sig, "smaller"
+        return sig, ""
+
+    def update_reproducer(self, sig: str, crash_input: dict, content: str, output: str) -> bool:
+        """Replace a bucket's smallest reproducer (e.g. after minimization). Returns True if it was smaller."""
+
+        bucket = self.buckets.get(sig)
+        if bucket is None or len(content) >= bucket["size"]:
+            return False
+        bucket.update(input=crash_input, size=len(content), output=output)
+        return True
+
+    def entries(self) -> List[dict]:
+        """Buckets in discovery order (each has an 'input' like the old crash dicts)."""
+        return list(self.buckets.values())
+
+    def drain_updates(self) -> List[dict]:
+        """Buckets touched since the last call, with 'new_hits' set to the hits since then."""
+
+        updates = []
+        for sig, hits in self.pending.items():
+            update = dict(self.buckets[sig])
+            update["new_hits"] = hits
+            updates.append(update)
+        self.pending = {}
+        return updates
+
+    def merge(self, updates: List[dict]) -> List[str]:
+        """Fold in drain_updates() from another worker. Returns the signatures that were new."""
+
+        new_buckets = []
+        for update in updates:
+            hits = update.pop("new_hits")
+            self.total_hits += hits
+            bucket = self.buckets.get(update["signature"])
+
+            if bucket is None:
+                update["hits"] = hits
+                self.buckets[update["signature"]] = update
+                new_buckets.append(update["signature"])
+                continue
+
+            bucket["hits"] += hits
+            if update["size"] < bucket["size"]:
+                bucket.update(test_number=update["test_number"], input=update["input"],
+                              size=update["size"], output=update["output"])
+
+        return new_buckets
+
+    def __len__(self):
+        return len(self.buckets)
+
+
+class HangIndex(CrashIndex):
+    """
+    Buckets confirmed hangs like CrashIndex buckets crashes.
+
+    A hang's traceback shows wherever the timer happened to interrupt the
+    loop, so frames are compared by function only (line numbers masked).
+    """
+
+    def signature(self, output: str) -> Tuple[str, str, List[str]]:
+        return super().signature(re.sub(r'(File "[^"]+"), line \d+,', r'\1, line 0,', output))
+
 
 # ============================================================================
 # PART 4: TRADITIONAL MUTATIONS
 # ============================================================================
 
-def traditional_mutate(json_data: dict) -> List[dict]:
-    """Create mutations using traditional fuzzing techniques."""
+# Inputs are treated as immutable values: every mutator builds a NEW top-level
+# dict with dict(parent) and only ever reassigns keys, so unchanged values
+# (long strings, permission lists, ...) are shared with the parent instead of
+# deep-copied. Never mutate a nested value of an input in place.
+#
+# Mutator protocol: mutate(parent, batch_size=N) is a generator that yields up
+# to N mutants lazily. The fuzz loop pulls one mutant at a time and stops as
+# soon as it reaches max_tests, so leftover mutants are never built.
+
+FIELD_NAMES = ["test", "data", "permissions", "rating", "extra"]  # Extra keys mutators may add
+
+
+# ----------------------------------------------------------------------------
+# Dictionary
+# ----------------------------------------------------------------------------
+# Magic values a mutator would only hit by luck - the 1000 in len(x) > 1000,
+# the key in "rating" in data, the ";" in ";" in role - are read off the target
+# instead (AFL's -x dictionaries / autodictionary, and CMPLOG/RedQueen at run
+# time).  Every mutator draws from the shared `dictionary` some of the time.
+
+def literal(node):
+    """Value of a constant AST node (negative numbers included), else None."""
+
+    if isinstance(node, ast.Constant):
+        return node.value
+    if (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant)
+            and isinstance(node.operand.value, (int, float))):
+        return -node.operand.value
+    return None
+
+
+def is_len_call(node) -> bool:
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "len"
+
+
+def looked_up_key(node) -> Optional[str]:
+    """"k" of data.get("k") or data["k"] (None for anything else)."""
+
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("get", "pop", "setdefault") and node.args):
+        key = literal(node.args[0])
+    elif isinstance(node, ast.Subscript):
+        key = literal(node.slice)
+    else:
+        return None
+    return key if isinstance(key, str) else None
+
+
+def is_dunder_name(node) -> bool:
+    """__name__ and friends: if __name__ == "__main__" says nothing about inputs."""
+    return isinstance(node, ast.Name) and node.id.startswith("__")
+
+
+def is_main_guard(node) -> bool:
+    """A top-level if __name__ == "__main__": block (the script entry point never sees a fuzzed input)."""
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and any(map(is_dunder_name, [node.test.left] + node.test.comparators)))
+
+
+def input_values(value) -> set:
+    """Every string and number in a JSON value (keys included), for input-to-state matching."""
+
+    found, stack = set(), [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            found.update(node.keys())
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, (str, int, float)) and not isinstance(node, bool):
+            found.add(node)
+    return found
+
+
+class Dictionary:
+    """
+    Weighted magic tokens of the target, in five pools:
+
+    - "keys"     names it looks up in an object (data.get("k"), data["k"], "k" in data)
+    - "strings"  strings it compares with or searches for
+    - "numbers"  numbers it compares with, plus their neighbours (for < and <=)
+    - "lengths"  numbers it compares a len() with, plus their neighbours
+    - "fields"   (key, value) pairs: the value a looked-up key is compared with,
+                 since a magic value only counts under its own key
+
+    A token's weight is the number of times it was seen: in the source
+    (learn_source), in bytecode constants when there is no source
+    (learn_code) and in compare logs of real runs (learn_compares).
+    """
+
+    KINDS = ("keys", "strings", "numbers", "lengths", "fields")
+    MAX_STRING = 64  # Longer string constants are messages and docstrings, not magic values
+    MAX_LENGTH = 1 << 16
+
+    def __init__(self):
+        self.tokens = {kind: collections.Counter() for kind in self.KINDS}
+        self.cache = {}  # kind -> (tokens, cumulative weights) for random.choices
+
+    def __len__(self):
+        return sum(len(tokens) for tokens in self.tokens.values())
+
+    def summary(self) -> str:
+        return ", ".join(f"{len(self.tokens[kind])} {kind}" for kind in self.KINDS)
+
+    def add(self, kind: str, token, weight: int = 1):
+        key = None
+        if kind == "fields":
+            key, token = token
+            if not isinstance(key, str) or not 0 < len(key) <= self.MAX_STRING:
+                return
+        if isinstance(token, str) and kind in ("keys", "strings", "fields"):
+            values = [token] if 0 < len(token) <= self.MAX_STRING else []
+        elif (isinstance(token, (int, float)) and not isinstance(token, bool) and math.isfinite(token)
+              and kind in ("numbers", "lengths", "fields")):
+            values = [token - 1, token, token + 1] if isinstance(token, int) else [token]
+            if kind == "lengths":
+                values = [value for value in values if 0 <= value <= self.MAX_LENGTH]
+        else:
+            return
+        for value in values:
+            self.tokens[kind][value if key is None else (key, value)] += weight
+        self.cache.pop(kind, None)
+
+    def pick(self, kind: str):
+        """A weighted random token of this kind ("values" = a string or number), or None if there is none."""
+
+        if kind == "values":
+            kinds = [kind for kind in ("strings", "numbers") if self.tokens[kind]]
+            if not kinds:
+                return None
+            kind = random.choice(kinds)
+        if kind not in self.cache:
+            tokens = self.tokens[kind]
+            self.cache[kind] = (list(tokens), list(itertools.accumulate(tokens.values())))
+        tokens, weights = self.cache[kind]
+        return random.choices(tokens, cum_weights=weights)[0] if tokens else None
+
+    def learn_source(self, source: str):
+        """Comparison operands and looked-up keys in Python source."""
+
+        body = [node for node in ast.parse(source).body if not is_main_guard(node)]
+        for node in itertools.chain.from_iterable(map(ast.walk, body)):
+            if isinstance(node, ast.Compare):
+                operands = [node.left] + node.comparators
+                for op, left, right in zip(node.ops, operands, operands[1:]):
+                    self._learn_compare(op, left, right)
+            elif isinstance(node, (ast.Call, ast.Subscript)):
+                self.add("keys", looked_up_key(node))
+
+    def _learn_compare(self, op, left, right):
+        if is_dunder_name(left) or is_dunder_name(right):
+            return
+        for side, other in ((left, right), (right, left)):
+            elements = side.elts if isinstance(side, (ast.Tuple, ast.List, ast.Set)) else [side]
+            key = looked_up_key(other)
+            for value in map(literal, elements):
+                if value is None:
+                    continue
+                if key is not None:
+                    self.add("fields", (key, value))
+                if is_len_call(other):
+                    self.add("lengths", value)
+                elif isinstance(value, str):
+                    self.add("strings", value)
+                    if isinstance(op, (ast.In, ast.NotIn)) and side is left:
+                        self.add("keys", value)  # "k" in data may be a key lookup as well
+                else:
+                    self.add("numbers", value)
+
+    def learn_code(self, code):
+        """Constants of a code object and the functions nested in it (no source needed)."""
+
+        for const in code.co_consts:
+            if hasattr(const, "co_consts"):
+                self.learn_code(const)
+            elif isinstance(const, str):
+                self.add("strings", const)
+            elif isinstance(const, (int, float)):
+                self.add("numbers", const)
+
+    def learn_compares(self, compares: List[list], data, weight: int = 2):
+        """
+        Compare log of one run ([kind, left, right] per comparison, see the
+        module worker).  Input-to-state: an operand that occurs in the input
+        came from it, so only the other side is learned - and if it is the
+        value of a top-level key, as a field of that key.
+        """
+
+        seen = input_values(data)
+        keys_of = {}  # Top-level scalar value -> its key
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                    keys_of.setdefault(value, key)
+        for kind, left, right in compares:
+            if kind == "key":
+                self.add("keys", left, weight)
+                continue
+            for value, other in ((left, right), (right, left)):
+                if value is None or value in seen:
+                    continue
+                if kind == "len":
+                    self.add("lengths", value, weight)
+                    continue
+                self.add("strings" if isinstance(value, str) else "numbers", value, weight)
+                if other in keys_of:
+                    self.add("fields", (keys_of[other], value), weight)
+
+
+dictionary = Dictionary()  # Filled by ComparativeFuzzer.build_dictionary()
+
+
+def dictionary_pick(kind: str):
+    """A dictionary token DICTIONARY_PROBABILITY of the time (None the rest of it, or if there is none)."""
+
+    if AUTO_DICTIONARY and random.random() < DICTIONARY_PROBABILITY:
+        return dictionary.pick(kind)
+    return None
+
+
+def dictionary_choice(kind: str, fallback: list):
+    """dictionary_pick, falling back to random.choice(fallback)."""
+
+    token = dictionary_pick(kind)
+    return random.choice(fallback) if token is None else token
+
+
+TRADITIONAL_OPERATORS = ["flip_value", "add_field", "delete_field", "multiply_value", "insert_special_chars"]
+
 
-    mutations = []
+def apply_traditional(json_data: dict, mutation_type: str) -> dict:
+    """One traditional mutation of json_data (a new dict, see above)."""
 
-    for _ in range(10):
-        mutated = copy.deepcopy(json_data)
+    mutated = dict(json_data)
 
-        mutation_type = random.choice([
-            "flip_value", "add_field", "delete_field",
-            "multiply_value", "insert_special_chars"
-        ])
+    if mutation_type == "flip_value" and mutated:
+        key = random.choice(list(mutated.keys()))
+        if isinstance(mutated[key], str):
+            mutated[key] = dictionary_choice("strings", [mutated[key] + suffix for suffix in ["!", "@", "#", ";;;", "|||"]])
+        elif isinstance(mutated[key], int):
+            mutated[key] = dictionary_choice("numbers", [mutated[key] * factor for factor in [-1, 0, 100, 1000]])
 
-        if mutation_type == "flip_value" and mutated:
-            key = random.choice(list(mutated.keys()))
+    elif mutation_type == "add_field":
+        field = dictionary_pick("fields")
+        if field is not None:
+            new_key, new_value = field
+        else:
+            new_key = dictionary_choice("keys", FIELD_NAMES)
+            new_value = dictionary_choice("values", [0, -1, 999, "", "test", ["a", "b", "c"]])
+        mutated[new_key] = new_value
+
+    elif mutation_type == "delete_field" and mutated:
+        key_to_delete = random.choice(list(mutated.keys()))
+        del mutated[key_to_delete]
+
+    elif mutation_type == "multiply_value":
+        for key in mutated:
             if isinstance(mutated[key], str):
-                mutated[key] = mutated[key] + random.choice(["!", "@", "#", ";;;", "|||"])
+                length = dictionary_pick("lengths")
+                if length is None:
+                    mutated[key] = mutated[key] * random.randint(100, 500)
+                else:
+                    mutated[key] = ((mutated[key] or "A") * length)[:length]
             elif isinstance(mutated[key], int):
-                mutated[key] = mutated[key] * random.choice([-1, 0, 100, 1000])
+                mutated[key] = mutated[key] * random.randint(-100, 1000)
 
-        elif mutation_type == "add_field":
-            new_key = random.choice(["test", "data", "permissions", "rating", "extra"])
-            new_value = random.choice([0, -1, 999, "", "test", ["a", "b", "c"]])
-            mutated[new_key] = new_value
+    elif mutation_type == "insert_special_chars":
+        special_chars = [";", "|", "&", "\x00", "\n", "\r", "$()", "&&"]
+        for key in mutated:
+            if isinstance(mutated[key], str):
+                mutated[key] = mutated[key] + dictionary_choice("strings", special_chars)
 
-        elif mutation_type == "delete_field" and mutated:
-            key_to_delete = random.choice(list(mutated.keys()))
-            del mutated[key_to_delete]
+    return mutated
 
-        elif mutation_type == "multiply_value":
-            for key in mutated:
-                if isinstance(mutated[key], str):
-                    mutated[key] = mutated[key] * random.randint(100, 500)
-                elif isinstance(mutated[key], int):
-                    mutated[key] = mutated[key] * random.randint(-100, 1000)
 
-        elif mutation_type == "insert_special_chars":
-            special_chars = [";", "|", "&", "\x00", "\n", "\r", "$()", "&&"]
-            for key in mutated:
-                if isinstance(mutated[key], str):
-                    mutated[key] = mutated[key] + random.choice(special_chars)
+def traditional_mutate(json_data: dict, batch_size: int = 10) -> Iterator[dict]:
+    """Create mutations using traditional fuzzing techniques."""
+
+    for _ in range(batch_size):
+        yield apply_traditional(json_data, random.choice(TRADITIONAL_OPERATORS))
+
+
+# ----------------------------------------------------------------------------
+# Operator scheduling
+# ----------------------------------------------------------------------------
+
+class OperatorStats:
+    """
+    Uses and finds (new coverage or crash buckets) per mutation operator.
+
+    A mutator records the operator behind each mutant it yields; the fuzz loop
+    then credits the outcome of running it.  drain()/merge() move the counts
+    from parallel workers to the parent, like CrashIndex.
+    """
+
+    def __init__(self):
+        self.uses = collections.Counter()
+        self.finds = collections.Counter()
+        self.pending = []
+        self.last = None
+
+    def record(self, op: str):
+        self.last = op
+        self.uses[op] += 1
+        self.pending.append((op, 0))
+
+    def credit(self, found: bool):
+        if found and self.last is not None:
+            self.finds[self.last] += 1
+            self.pending.append((self.last, 1))
+
+    def drain(self) -> List[tuple]:
+        pending, self.pending = self.pending, []
+        return pending
+
+    def merge(self, pending: List[tuple]):
+        for op, found in pending:
+            if found:
+                self.finds[op] += 1
+            else:
+                self.uses[op] += 1
+
+    def summary(self) -> dict:
+        """op -> {"uses", "finds", "yield"} (finds per use)."""
+        return {op: {"uses": uses, "finds": self.finds[op], "yield": self.finds[op] / uses}
+                for op, uses in self.uses.most_common()}
+
+
+class MOptSchedule:
+    """
+    MOpt-style adaptive choice between mutation operators.
+
+    Operators are drawn from a probability vector that a particle-swarm step
+    moves every MOPT_PERIOD uses: toward the vector that gave each operator
+    its best efficiency (finds / uses) in a period so far (local best), and
+    toward each operator's share of all finds (global best).  Probabilities
+    stay above MOPT_MIN_PROB so an operator can recover from a bad start.
+    """
+
+    def __init__(self, operators: List[str], period: int = MOPT_PERIOD):
+        self.operators = list(operators)
+        self.period = period
+        uniform = 1.0 / len(self.operators)
+        self.position = {op: uniform for op in self.operators}
+        self.velocity = {op: 0.0 for op in self.operators}
+        self.local_best = dict(self.position)
+        self.best_efficiency = {op: 0.0 for op in self.operators}
+        self.total_finds = {op: 0 for op in self.operators}
+        self.uses = {op: 0 for op in self.operators}
+        self.finds = {op: 0 for op in self.operators}
+        self.used = 0
+
+    def choose(self) -> str:
+        return random.choices(self.operators, weights=[self.position[op] for op in self.operators])[0]
+
+    def report(self, op: str, found: bool):
+        """Outcome of one mutant made with op."""
+
+        self.uses[op] += 1
+        if found:
+            self.finds[op] += 1
+            self.total_finds[op] += 1
+        self.used += 1
+        if self.used >= self.period:
+            self.update()
+
+    def update(self):
+        """One swarm step, then start a new period."""
+
+        for op in self.operators:
+            if self.uses[op]:
+                efficiency = self.finds[op] / self.uses[op]
+                if efficiency > self.best_efficiency[op]:
+                    self.best_efficiency[op] = efficiency
+                    self.local_best[op] = self.position[op]
+
+        all_finds = sum(self.total_finds.values())
+        for op in self.operators:
+            global_best = self.total_finds[op] / all_finds if all_finds else 1.0 / len(self.operators)
+            self.velocity[op] = (MOPT_INERTIA * self.velocity[op]
+                                 + random.random() * (self.local_best[op] - self.position[op])
+                                 + random.random() * (global_best - self.position[op]))
+            self.position[op] = min(max(self.position[op] + self.velocity[op], MOPT_MIN_PROB), 1.0)
+
+        total = sum(self.position.values())
+        for op in self.operators:
+            self.position[op] /= total
+
+        self.uses = {op: 0 for op in self.operators}
+        self.finds = {op: 0 for op in self.operators}
+        self.used = 0
+
+    def probabilities(self) -> dict:
+        return dict(self.position)
+
+
+def make_operator_schedule(operators: List[str]) -> Optional[MOptSchedule]:
+    """MOptSchedule per OPERATOR_SCHEDULING ("mopt"), or None for uniform choice."""
+    return MOptSchedule(operators) if OPERATOR_SCHEDULING == "mopt" else None
+
+
+class TraditionalMutator:
+    """
+    traditional_mutate with per-operator yield tracking and (by default)
+    MOpt scheduling - one instance per campaign, so each learns on its own.
+    """
+
+    def __init__(self):
+        self.stats = OperatorStats()
+        self.schedule = make_operator_schedule(TRADITIONAL_OPERATORS)
+
+    def __call__(self, json_data: dict, batch_size: int = 10) -> Iterator[dict]:
+        for _ in range(batch_size):
+            op = self.schedule.choose() if self.schedule else random.choice(TRADITIONAL_OPERATORS)
+            self.stats.record(op)
+            yield apply_traditional(json_data, op)
+
+    def credit(self, found: bool):
+        """Outcome of running the last mutant yielded."""
+        self.stats.credit(found)
+        if self.schedule is not None:
+            self.schedule.report(self.stats.last, found)
+
+
+# ----------------------------------------------------------------------------
+# Structure-aware mutations
+# ----------------------------------------------------------------------------
+# StructuredMutator treats an input as the JSON value tree it is (objects,
+# arrays, nested to any depth) rather than a flat dict.  Nodes are addressed
+# by paths (tuples of keys / indices) and edited copy-on-write: only the
+# containers along the edited path are rebuilt, the rest is shared (see above).
+#
+# Two operators work on the serialized text instead and yield RawInput: byte
+# havoc, and near-valid JSON that reaches the target's JSONDecodeError branch.
+# Raw inputs are executed and triaged like any other, but only ones that still
+# decode to an object can become corpus parents.
+
+class RawInput(str):
+    """An already-serialized test case (possibly invalid JSON)."""
+
+
+def serialize_input(mutant) -> Tuple[Optional[dict], str]:
+    """(input as a dict or None if it isn't a JSON object, content to execute)."""
+
+    if isinstance(mutant, RawInput):
+        try:
+            data = json.loads(mutant)
+        except ValueError:
+            data = None
+        return (data if isinstance(data, dict) else None), str(mutant)
+    return (mutant if isinstance(mutant, dict) else None), json.dumps(mutant)
+
+
+def json_paths(value, max_nodes: int = STRUCT_MAX_NODES) -> List[tuple]:
+    """Paths to every node of a JSON value (root first), up to max_nodes of them."""
+
+    paths = []
+    stack = [((), value)]
+    while stack and len(paths) < max_nodes:
+        path, node = stack.pop()
+        paths.append(path)
+        if isinstance(node, dict):
+            stack.extend((path + (key,), child) for key, child in node.items())
+        elif isinstance(node, list):
+            stack.extend((path + (i,), child) for i, child in enumerate(node))
+    return paths
+
+
+def get_at(value, path: tuple):
+    for step in path:
+        value = value[step]
+    return value
+
+
+def set_at(value, path: tuple, new):
+    """Copy of value with the node at path replaced (containers off the path are shared)."""
+
+    if not path:
+        return new
+    copy = dict(value) if isinstance(value, dict) else list(value)
+    copy[path[0]] = set_at(value[path[0]], path[1:], new) if len(path) > 1 else new
+    return copy
+
+
+def delete_at(value, path: tuple):
+    """Copy of value without the node at path (path must not be the root)."""
+
+    parent = get_at(value, path[:-1])
+    if isinstance(parent, dict):
+        smaller = {k: v for k, v in parent.items() if k != path[-1]}
+    else:
+        smaller = parent[:path[-1]] + parent[path[-1] + 1:]
+    return set_at(value, path[:-1], smaller)
+
+
+BOUNDARY_NUMBERS = [0, -1, 1, 2**7, 2**8, 2**15 - 1, 2**16, 2**31 - 1, -2**31, 2**32, 2**63 - 1, -2**63,
+                    2**64, 10**100, -10**100, 0.0, -0.0, 0.5, -1e-9, 1e308, -1e308, 5e-324,
+                    float("inf"), float("-inf"), float("nan")]
+NAN_LIKE_STRINGS = ["NaN", "nan", "Infinity", "-Infinity", "1e999", "-0", "0x10", "1_000", "0.0", " 1", "+1", ""]
+UNICODE_EDGES = ["\u0000", "\u202e", "\ufeff", "\u200b", "\ud800", "\udfff", "\uffff", "\U0001f600",
+                 "\u00e9", "\u0130", "\uff1b", "\uff5c", "\uff06", "\u00a0", "\u2028", "\\", "\"", "\x7f"]
+STRING_LENGTHS = [0, 1, 99, 100, 101, 999, 1000, 1001, 4096]
+ARRAY_LENGTHS = [0, 1, 50, 51, 100, 101, 256]
+JSON_TOKENS = [b"{", b"}", b"[", b"]", b",", b":", b"\"", b"\\", b"null", b"true", b"-", b"0", b"1e999",
+               b"NaN", b"\\u0000", b"\\ud800", b"\xef\xbb\xbf", b"\xff", b" ", b"\n"]
+
 
-        mutations.append(mutated)
+class StructuredMutator:
+    """
+    Structure-aware JSON mutator (the mutator protocol of PART 4, plus credit()).
+
+    Besides node-level edits it splices subtrees within an input (recursive
+    splicing) and across inputs (subtree crossover with donors: earlier parents
+    and mutants that found something), and runs byte-level havoc on the
+    serialized form.  Each operator's yield is tracked in self.stats.
+    """
 
-    return mutations
+    OPERATORS = ["replace_value", "boundary_number", "unicode_string", "add_key", "delete_node",
+                 "nest", "grow_array", "splice", "crossover", "havoc", "near_valid"]
+
+    def __init__(self, max_donors: int = 200):
+        self.max_donors = max_donors
+        self.donors = []
+        self.donor_keys = set()
+        self.keys = set(FIELD_NAMES)
+        self.stats = OperatorStats()
+        self.schedule = make_operator_schedule(self.OPERATORS)
+        self.last_mutant = None
+
+    def __call__(self, json_data: dict, batch_size: int = 10) -> Iterator:
+        self.remember(json_data)
+        paths = json_paths(json_data)
+
+        for _ in range(batch_size):
+            op = self.schedule.choose() if self.schedule else random.choice(self.OPERATORS)
+            mutant = getattr(self, op)(json_data, paths)
+            self.stats.record(op)
+            self.last_mutant = mutant
+            yield mutant
+
+    def credit(self, found: bool):
+        """Outcome of running the last mutant yielded."""
+        self.stats.credit(found)
+        if self.schedule is not None:
+            self.schedule.report(self.stats.last, found)
+        if found and isinstance(self.last_mutant, dict):
+            self.remember(self.last_mutant)
+
+    def remember(self, donor: dict):
+        if id(donor) in self.donor_keys:
+            return
+        self.donor_keys.add(id(donor))
+        self.donors.append(donor)
+        for path in json_paths(donor):
+            if path and isinstance(path[-1], str):
+                self.keys.add(path[-1])
+        if len(self.donors) > self.max_donors:
+            self.donor_keys.discard(id(self.donors.pop(0)))
+
+    # -- value grammar --------------------------------------------------------
+
+    def random_string(self) -> str:
+        token = dictionary_pick("strings")
+        if token is not None:
+            return token
+        kind = random.random()
+        if kind < 0.3:
+            return random.choice(UNICODE_EDGES) * random.choice(STRING_LENGTHS[1:4])
+        if kind < 0.5:
+            return random.choice(NAN_LIKE_STRINGS)
+        base = random.choice(["a", "admin", "user", ";", "|", "&", "\u00e9"])
+        length = dictionary_pick("lengths")
+        if length is not None:
+            return (base * length)[:length]
+        return (base * random.choice(STRING_LENGTHS))[:4096]
+
+    def random_value(self, depth: int = 0):
+        kind = random.choice(["null", "bool", "number", "string", "string", "array", "object"])
+        if depth >= 2 and kind in ("array", "object"):
+            kind = "number"
+        if kind == "null":
+            return None
+        if kind == "bool":
+            return random.choice([True, False])
+        if kind == "number":
+            return dictionary_choice("numbers", BOUNDARY_NUMBERS)
+        if kind == "string":
+            return self.random_string()
+        if kind == "array":
+            return [self.random_value(depth + 1) for _ in range(random.randint(0, 3))]
+        keys = list(self.keys) or ["a"]
+        return {random.choice(keys): self.random_value(depth + 1) for _ in range(random.randint(0, 3))}
+
+    @staticmethod
+    def nodes_of(value, paths: List[tuple], *types) -> List[tuple]:
+        """Paths whose node is one of types (bools are not numbers here)."""
+        return [path for path in paths
+                if isinstance(get_at(value, path), types) and not isinstance(get_at(value, path), bool)]
+
+    def grows(self, paths: List[tuple]) -> bool:
+        """Growing operators back off once an input gets big."""
+        return len(paths) < STRUCT_MAX_NODES // 2
+
+    # -- tree operators -------------------------------------------------------
+
+    def replace_value(self, value, paths):
+        return set_at(value, random.choice(paths[1:] or paths), self.random_value())
+
+    def boundary_number(self, value, paths):
+        targets = self.nodes_of(value, paths, int, float) or paths[1:] or paths
+        path = random.choice(targets)
+        number = dictionary_choice("numbers", BOUNDARY_NUMBERS + NAN_LIKE_STRINGS[:5])
+        node = get_at(value, path)
+        if isinstance(node, (int, float)) and not isinstance(node, bool) and random.random() < 0.3:
+            number = node + random.choice([-1, 1]) if math.isfinite(node) else -node
+        return set_at(value, path, number)
+
+    def unicode_string(self, value, paths):
+        targets = self.nodes_of(value, paths, str) or paths[1:] or paths
+        path = random.choice(targets)
+        token = dictionary_pick("strings")
+        if token is not None:
+            return set_at(value, path, token)  # Compared with == as often as searched for with in
+        node = get_at(value, path)
+        edge = random.choice(UNICODE_EDGES + SPECIAL_CHARS)
+        if isinstance(node, str) and node:
+            at = random.randint(0, len(node))
+            return set_at(value, path, node[:at] + edge + node[at:])
+        return set_at(value, path, edge)
+
+    def add_key(self, value, paths):
+        objects = self.nodes_of(value, paths, dict)
+        if not objects:
+            return self.replace_value(value, paths)
+        path = random.choice(objects)
+        extended = dict(get_at(value, path))
+        field = dictionary_pick("fields")
+        if field is not None:
+            extended[field[0]] = field[1]
+            return set_at(value, path, extended)
+        key = dictionary_pick("keys")
+        if key is None:
+            key = random.choice(list(self.keys)) if self.keys and random.random() < 0.8 else self.random_string()[:16]
+        extended[key] = self.random_value()
+        return set_at(value, path, extended)
+
+    def delete_node(self, value, paths):
+        if len(paths) < 2:
+            return self.add_key(value, paths)
+        return delete_at(value, random.choice(paths[1:]))
+
+    def nest(self, value, paths):
+        path = random.choice(paths[1:] or paths)
+        if len(path) >= STRUCT_MAX_DEPTH:
+            return self.replace_value(value, paths)
+        node = get_at(value, path)
+        wrapped = [node] if random.random() < 0.5 else {random.choice(list(self.keys) or ["a"]): node}
+        return set_at(value, path, wrapped)
+
+    def grow_array(self, value, paths):
+        if not self.grows(paths):
+            return self.delete_node(value, paths)
+        arrays = self.nodes_of(value, paths, list)
+        if arrays:
+            path = random.choice(arrays)
+            items = get_at(value, path) or [self.random_value(1)]
+        else:
+            path = random.choice(paths[1:] or paths)
+            items = [get_at(value, path)]
+        length = dictionary_choice("lengths", ARRAY_LENGTHS)
+        # Repeating the same (immutable) elements shares them instead of copying
+        return set_at(value, path, [items[i % len(items)] for i in range(length)])
+
+    def splice(self, value, paths):
+        """Recursive splicing: a subtree of this input replaces another of its nodes (possibly an ancestor's child)."""
+        if not self.grows(paths):
+            return self.delete_node(value, paths)
+        source = get_at(value, random.choice(paths))
+        target = random.choice(paths[1:] or paths)
+        if len(target) >= STRUCT_MAX_DEPTH:
+            return self.replace_value(value, paths)
+        return set_at(value, target, source)
+
+    def crossover(self, value, paths):
+        """Subtree crossover: a random subtree of a donor replaces a node of this input."""
+        donor = random.choice(self.donors) if self.donors else value
+        if not self.grows(paths) or donor is value:
+            return self.splice(value, paths) if self.grows(paths) else self.delete_node(value, paths)
+        donor_paths = json_paths(donor)
+        source = get_at(donor, random.choice(donor_paths[1:] or donor_paths))
+        target = random.choice(paths[1:] or paths)
+        if random.random() < 0.5 and target and self.keys and isinstance(get_at(value, target[:-1]), dict):
+            # Graft under the donor's key name, so whole fields move across
+            return set_at(value, target[:-1] + (random.choice(list(self.keys)),), source)
+        return set_at(value, target, source)
+
+    # -- serialized-form operators --------------------------------------------
+
+    def havoc(self, value, paths):
+        """AFL-style stacked byte edits on the serialized input."""
+
+        data = bytearray(json.dumps(value, ensure_ascii=random.random() < 0.5).encode("utf-8", "surrogatepass"))
+        for _ in range(1 << random.randint(0, 3)):
+            op = random.randint(0, 5)
+            at = random.randint(0, len(data))
+            if op == 0 and data:
+                data[min(at, len(data) - 1)] ^= 1 << random.randint(0, 7)
+            elif op == 1 and data:
+                data[min(at, len(data) - 1)] = random.randint(0, 255)
+            elif op == 2:
+                token = dictionary_pick("strings")
+                data[at:at] = random.choice(JSON_TOKENS) if token is None else token.encode("utf-8", "surrogatepass")
+            elif op == 3 and data:
+                del data[at:at + random.randint(1, 8)]
+            elif op == 4 and data:
+                start = random.randint(0, len(data) - 1)
+                data[at:at] = data[start:start + random.randint(1, 32)]
+            elif op == 5 and data:
+                del data[at:]
+        return RawInput(data.decode("utf-8", "replace"))
+
+    def near_valid(self, value, paths):
+        """One classic syntax slip, so the input just fails (or just passes) json.loads."""
+
+        text = json.dumps(value)
+        slip = random.choice(["truncate", "trailing_comma", "single_quotes", "unquoted_key",
+                              "missing_colon", "bom", "comment", "nan_literal", "trailing_garbage"])
+        if slip == "truncate":
+            text = text[:random.randint(0, max(len(text) - 1, 0))]
+        elif slip == "trailing_comma":
+            text = text[:-1] + ",}" if text.endswith("}") else text + ","
+        elif slip == "single_quotes":
+            text = text.replace('"', "'", 2)
+        elif slip == "unquoted_key":
+            text = re.sub(r'"(\w+)":', r"\1:", text, count=1)
+        elif slip == "missing_colon":
+            text = text.replace('":', '"', 1)
+        elif slip == "bom":
+            text = "\ufeff" + text
+        elif slip == "comment":
+            text = text.replace(",", ", // note\n", 1) if "," in text else "/* c */" + text
+        elif slip == "nan_literal":
+            # Not JSON, but Python's json.loads accepts it
+            text = re.sub(r"(:\s*)-?\d+(\.\d+)?", r"\1" + random.choice(["NaN", "Infinity", "-Infinity"]), text, count=1)
+        else:
+            text = text + random.choice(["}", "]", "x", "\x00", "{}", " null"])
+        return RawInput(text)
 
 
 # ============================================================================
@@ -217,7 +1200,7 @@ def traditional_mutate(json_data: dict) -> List[dict]:
 # ============================================================================
 
 def setup_ollama():
-    """Check if Ollama is installed and running."""
+    """Check if the Ollama HTTP API is reachable."""
 
     if not USE_REAL_LLM:
         if VERBOSE_MODE:
@@ -225,32 +1208,316 @@ def setup_ollama():
         return False
 
     if VERBOSE_MODE:
-        print("🔍 Checking for Ollama installation...")
+        print(f"🔍 Checking for Ollama at {OLLAMA_URL}...")
 
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        with urllib.request.urlopen(f"{OLLAMA_URL}/api/tags", timeout=5) as response:
+            if response.status == 200:
+                if VERBOSE_MODE:
+                    print("✅ Ollama is installed and running!\n")
+                return True
 
-        if result.returncode == 0:
-            if VERBOSE_MODE:
-                print("✅ Ollama is installed and running!\n")
-            return True
-        else:
-            if VERBOSE_MODE:
-                print("⚠️  Ollama command failed, using SIMULATED LLM\n")
-            return False
+        if VERBOSE_MODE:
+            print("⚠️  Ollama API call failed, using SIMULATED LLM\n")
+        return False
 
-    except (FileNotFoundError, subprocess.TimeoutExpired, Exception) as e:
+    except Exception:
         if VERBOSE_MODE:
             print(f"⚠️  Ollama not available, using SIMULATED LLM\n")
         return False
 
 
-def simulated_llm_mutate(json_data: dict) -> List[dict]:
+class AsyncHTTPPool:
+    """Minimal keep-alive HTTP/1.1 JSON client on asyncio streams (no extra dependencies)."""
+
+    def __init__(self, base_url: str, size: Optional[int] = None, timeout: Optional[float] = None):
+        """size / timeout default to LLM_POOL_SIZE / LLM_TIMEOUT (read now, not at import)."""
+
+        url = urllib.parse.urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.use_ssl = url.scheme == "https"
+        self.base_path = url.path.rstrip("/")
+        self.size = size if size is not None else LLM_POOL_SIZE
+        self.timeout = timeout if timeout is not None else LLM_TIMEOUT
+        self.idle = []  # Open keep-alive connections as (reader, writer)
+        self.slots = None  # Semaphore, created inside the event loop
+
+    async def post_json(self, path: str, payload: dict) -> dict:
+        """POST a JSON body and return the decoded JSON response."""
+
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.size)
+
+        body = json.dumps(payload).encode("utf-8")
+        async with self.slots:
+            reused = bool(self.idle)
+            conn = self.idle.pop() if reused else await self._connect()
+            try:
+                status, data, keep_alive = await asyncio.wait_for(
+                    self._request(conn, path, body), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError, OSError):
+                self._close(conn)
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection - retry once on a fresh one
+                conn = await self._connect()
+                status, data, keep_alive = await asyncio.wait_for(
+                    self._request(conn, path, body), self.timeout)
+            except BaseException:
+                self._close(conn)
+                raise
+
+            if keep_alive:
+                self.idle.append(conn)
+            else:
+                self._close(conn)
+
+        if status != 200:
+            raise ConnectionError(f"HTTP {status} from {path}")
+        return json.loads(data.decode("utf-8"))
+
+    def close(self):
+        for conn in self.idle:
+            self._close(conn)
+        self.idle = []
+
+    async def _connect(self):
+        ssl_context = None
+        if self.use_ssl:
+            import ssl
+            ssl_context = ssl.create_default_context()
+        return await asyncio.open_connection(self.host, self.port, ssl=ssl_context)
+
+    def _close(self, conn):
+        try:
+            conn[1].close()
+        except Exception:
+            pass
+
+    async def _request(self, conn, path: str, body: bytes) -> Tuple[int, bytes, bool]:
+        reader, writer = conn
+        writer.write(
+            f"POST {self.base_path}{path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: keep-alive\r\n\r\n".encode("ascii") + body
+        )
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = b""
+            while True:
+                chunk_size = int((await reader.readline()).split(b";")[0], 16)
+                if chunk_size == 0:
+                    await reader.readline()
+                    break
+                data += await reader.readexactly(chunk_size)
+                await reader.readline()
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await reader.read()
+            return status, data, False
+
+        return status, data, headers.get("connection", "").lower() != "close"
+
+
+def input_shape(json_data: dict) -> tuple:
+    """Normalized shape of an input (field names + value types) used as the LLM cache key."""
+    return tuple(sorted((key, type(value).__name__) for key, value in json_data.items()))
+
+
+def summarize_for_prompt(json_data: dict) -> dict:
+    """Shorten huge values so a 2000-char username doesn't blow up the prompt."""
+
+    summary = {}
+    for key, value in json_data.items():
+        if isinstance(value, str) and len(value) > 40:
+            summary[key] = f"{value[:20]}...({len(value)} chars)"
+        elif isinstance(value, list) and len(value) > 5:
+            summary[key] = value[:3] + [f"...({len(value)} items)"]
+        else:
+            summary[key] = value
+    return summary
+
+
+class LLMMutationBackend:
+    """
+    Real LLM mutations from the Ollama HTTP API without ever blocking the exec loop.
+
+    - Suggestions are field overrides ("patches") cached per input shape in an LRU.
+    - On a cache miss the parent is queued for a background asyncio thread and the
+      caller gets simulated mutations right away.
+    - The background thread batches up to LLM_BATCH_PARENTS queued parents into one
+      prompt and sends it through a pooled keep-alive HTTP client.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, model: Optional[str] = None):
+        # Defaults are read now, so they match what setup_ollama() checked
+        self.model = model or OLLAMA_MODEL
+        self.client = AsyncHTTPPool(base_url or OLLAMA_URL)
+        self.cache = collections.OrderedDict()  # shape -> list of patches
+        self.lock = threading.Lock()
+        self.in_flight = set()
+        self.backoff_until = 0.0
+        self.stats = {"hits": 0, "misses": 0, "requests": 0, "failures": 0}
+        self.pid = os.getpid()
+
+        self.loop = asyncio.new_event_loop()
+        self.pending = asyncio.Queue()  # (shape, parent) waiting to be sent
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+
+    def mutate(self, json_data: dict, batch_size: int = 5) -> Iterator[dict]:
+        """Yield LLM-suggested mutants, or simulated ones while suggestions are being fetched."""
+
+        shape = input_shape(json_data)
+        with self.lock:
+            patches = self.cache.get(shape)
+            if patches is not None:
+                self.cache.move_to_end(shape)
+
+        if not patches:
+            self.stats["misses"] += 1
+            self.prefetch(json_data)
+            yield from simulated_llm_mutate(json_data, batch_size)
+            return
+
+        self.stats["hits"] += 1
+        for _ in range(batch_size):
+            mutated = dict(json_data)
+            mutated.update(random.choice(patches))
+            yield mutated
+
+    def prefetch(self, json_data: dict):
+        """Queue a parent for the background fetcher (no-op if its shape is already in flight)."""
+
+        shape = input_shape(json_data)
+        with self.lock:
+            if shape in self.in_flight or shape in self.cache or time.time() < self.backoff_until:
+                return
+            self.in_flight.add(shape)
+        self.loop.call_soon_threadsafe(self.pending.put_nowait, (shape, json_data))
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.create_task(self._dispatch())
+        self.loop.run_forever()
+        # Stopped by close(): cancel the dispatcher and any request still in flight
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.client.close()
+        self.loop.close()
+
+    async def _dispatch(self):
+        while True:
+            batch = [await self.pending.get()]
+            deadline = self.loop.time() + LLM_BATCH_WAIT
+            while len(batch) < LLM_BATCH_PARENTS:
+                remaining = deadline - self.loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.pending.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Requests run concurrently, bounded by the connection pool size
+            self.loop.create_task(self._fetch(batch))
+
+    async def _fetch(self, batch: List[tuple]):
+        self.stats["requests"] += 1
+        try:
+            reply = await self.client.post_json("/api/generate", {
+                "model": self.model,
+                "prompt": self._build_prompt([parent for _, parent in batch]),
+                "stream": False,
+                "format": "json",
+                "options": {"temperature": 0.9}
+            })
+            suggestions = self._parse(reply.get("response", ""), len(batch))
+            with self.lock:
+                for (shape, _), patches in zip(batch, suggestions):
+                    if patches:
+                        self.cache[shape] = patches
+                        self.cache.move_to_end(shape)
+                while len(self.cache) > LLM_CACHE_SIZE:
+                    self.cache.popitem(last=False)
+        except Exception:
+            self.stats["failures"] += 1
+            self.backoff_until = time.time() + 5
+        finally:
+            with self.lock:
+                for shape, _ in batch:
+                    self.in_flight.discard(shape)
+
+    def _build_prompt(self, parents: List[dict]) -> str:
+        lines = [
+            "You are helping fuzz a JSON user-record parser.",
+            f"For each numbered input, suggest {LLM_SUGGESTIONS} edits likely to trigger crashes or edge cases",
+            "(very long strings, injection characters, negative or zero numbers, huge arrays, odd types).",
+            'Reply with JSON only: {"mutations": {"0": [{"field": "new value"}, ...], "1": [...]}}',
+            "where every edit is an object of fields to overwrite.",
+            ""
+        ]
+        for i, parent in enumerate(parents):
+            lines.append(f"Input {i}: {json.dumps(summarize_for_prompt(parent))}")
+        return "\n".join(lines)
+
+    def _parse(self, text: str, count: int) -> List[List[dict]]:
+        """Turn the model reply into one list of patches per parent (empty if unusable)."""
+
+        start, end = text.find("{"), text.rfind("}")
+        try:
+            mutations = json.loads(text[start:end + 1]).get("mutations", {})
+        except (ValueError, AttributeError):
+            return [[] for _ in range(count)]
+
+        if isinstance(mutations, list):
+            mutations = {str(i): patches for i, patches in enumerate(mutations)}
+
+        results = []
+        for i in range(count):
+            patches = mutations.get(str(i), []) if isinstance(mutations, dict) else []
+            if isinstance(patches, dict):
+                patches = [patches]
+            results.append([patch for patch in patches if isinstance(patch, dict) and patch][:20])
+        return results
+
+
+llm_backend = None
+
+
+def get_llm_backend() -> LLMMutationBackend:
+    """Shared backend for this process (forked workers get their own event loop thread)."""
+
+    global llm_backend
+    if llm_backend is None or llm_backend.pid != os.getpid():
+        llm_backend = LLMMutationBackend()
+    return llm_backend
+
+
+def simulated_llm_mutate(json_data: dict, batch_size: int = 5) -> Iterator[dict]:
     """Simulate LLM thinking with pattern-based mutations."""
 
     strategies = [
@@ -260,19 +1527,32 @@ def simulated_llm_mutate(json_data: dict) -> List[dict]:
         lambda: {"rating": 0},
         lambda: {"permissions": ["read"] * random.randint(101, 200)}
     ]
-
-    mutations = []
-    for strategy in random.sample(strategies, min(5, len(strategies))):
-        mutated = copy.deepcopy(json_data)
-        mutated.update(strategy())
-        mutations.append(mutated)
-
-    return mutations
-
-
-def llm_guided_mutate(json_data: dict, use_real_llm=False) -> List[dict]:
+    if AUTO_DICTIONARY and dictionary:
+        # What the target itself compares with, under the keys it looks up
+        key = lambda: dictionary.pick("keys") or random.choice(list(json_data) or FIELD_NAMES)
+        strategies += [
+            lambda: dict([dictionary.pick("fields") or (key(), dictionary.pick("values"))]),
+            lambda: {key(): random.choice(["A", ["read"]]) * (dictionary.pick("lengths") or random.randint(101, 1001))},
+        ]
+
+    # Every strategy once per round (in random order), as many rounds as needed
+    produced = 0
+    while produced < batch_size:
+        for strategy in random.sample(strategies, len(strategies)):
+            if produced >= batch_size:
+                return
+            mutated = dict(json_data)
+            mutated.update(strategy())
+            produced += 1
+            yield mutated
+
+
+def llm_guided_mutate(json_data: dict, use_real_llm=False, batch_size: int = 5) -> Iterator[dict]:
     """Use LLM to create smart, targeted mutations."""
-    return simulated_llm_mutate(json_data)
+
+    if use_real_llm:
+        return get_llm_backend().mutate(json_data, batch_size)
+    return simulated_llm_mutate(json_data, batch_size)
 
 
 # ============================================================================
@@ -289,7 +1569,7 @@ def generate_llm_seeds(base_data: dict, use_real_llm: bool = False) -> List[dict
 
     # Generate 3 batches of 5 seeds each = 15 total seeds
     for _ in range(3):
-        seeds = simulated_llm_mutate(base_data)
+        seeds = llm_guided_mutate(base_data, use_real_llm)
         all_seeds.extend(seeds)
 
     if VERBOSE_MODE:
@@ -298,9 +1578,12 @@ def generate_llm_seeds(base_data: dict, use_real_llm: bool = False) -> List[dict
     return all_seeds
 
 
-def rank_seeds(seeds: List[dict]) -> List[Tuple[dict, int]]:
+SPECIAL_CHARS = [';', '|', '&', '$', '\n', '\r', '\x00']
+
+
+def seed_score(seed: dict) -> int:
     """
-    Rank seeds based on their potential to find bugs.
+    Bug-finding potential of ONE seed (how GAPopulation ranks individuals).
 
     Scoring criteria:
     - Long strings (buffer overflow): +10 per long string
@@ -311,70 +1594,45 @@ def rank_seeds(seeds: List[dict]) -> List[Tuple[dict, int]]:
     - Field diversity: +5 per unique field
     """
 
-    scored_seeds = []
-
-    for seed in seeds:
-        score = 0
-
-        for key, value in seed.items():
-            # Long strings (buffer overflow potential)
-            if isinstance(value, str):
-                if len(value) > 1000:
-                    score += 10
-                elif len(value) > 100:
-                    score += 5
-
-                # Special characters (injection potential)
-                special_chars = [';', '|', '&', '$', '\n', '\r', '\x00']
-                for char in special_chars:
-                    if char in value:
-                        score += 15
-
-            # Negative numbers (logic error potential)
-            elif isinstance(value, int):
-                if value < 0:
-                    score += 8
-
-                # Zero values (division by zero potential)
-                if value == 0:
-                    score += 12
-
-            # Large arrays (array bounds potential)
-            elif isinstance(value, list):
-                if len(value) > 100:
-                    score += 10
-                elif len(value) > 50:
-                    score += 5
-
-        # Field diversity bonus
-        score += len(seed) * 5
-
-        scored_seeds.append((seed, score))
-
-    # Sort by score (highest first)
-    scored_seeds.sort(key=lambda x: x[1], reverse=True)
-
-    if VERBOSE_MODE:
-        print(f"  📊 Ranked {len(scored_seeds)} seeds")
-        if scored_seeds:
-            print(f"     Top score: {scored_seeds[0][1]}, Lowest score: {scored_seeds[-1][1]}")
-
-    return scored_seeds
-
-
-def select_top_seeds(ranked_seeds: List[Tuple[dict, int]], top_n: int = 10) -> List[dict]:
-    """Select only the top N ranked seeds for genetic algorithm."""
-
-    top_seeds = [seed for seed, score in ranked_seeds[:top_n]]
+    score = 0
 
-    if VERBOSE_MODE:
-        print(f"  ✂️  Selected top {len(top_seeds)} seeds for GA evolution")
+    for key, value in seed.items():
+        # Long strings (buffer overflow potential)
+        if isinstance(value, str):
+            if len(value) > 1000:
+                score += 10
+            elif len(value) > 100:
+                score += 5
+
+            # Special characters (injection potential)
+            for char in SPECIAL_CHARS:
+                if char in value:
+                    score += 15
+
+        # Negative numbers (logic error potential)
+        elif isinstance(value, int):
+            if value < 0:
+                score += 8
+
+            # Zero values (division by zero potential)
+            if value == 0:
+                score += 12
+
+        # Large arrays (array bounds potential)
+        elif isinstance(value, list):
+            if len(value) > 100:
+                score += 10
+            elif len(value) > 50:
+                score += 5
+
+    # Field diversity bonus
+    score += len(seed) * 5
 
-    return top_seeds
+    return score
 
 
-def fitness_function(candidate: dict, crashes: List[dict]) -> int:
-    """Calculate how 'good' a test case is for breeding."""
+def base_fitness(candidate: dict) -> int:
+    """The part of fitness_function that depends only on the candidate itself."""
 
     score = 0
 
@@ -393,27 +1651,41 @@ def fitness_function(candidate: dict, crashes: List[dict]) -> int:
     if has_lists:
         score += 5
 
+    return score
+
+
+def crash_fields(crash: dict) -> dict:
+    """Top-level fields of a crash's input ({} for raw, non-object reproducers)."""
+    crash_input = crash.get('input', {})
+    return crash_input if isinstance(crash_input, dict) else {}
+
+
+def fitness_function(candidate: dict, crashes: List[dict]) -> int:
+    """Calculate how 'good' a test case is for breeding."""
+
+    score = base_fitness(candidate)
+
     # Prefer inputs similar to past crashes
     for crash in crashes[-5:]:
-        similarity = sum(1 for k in candidate if k in crash.get('input', {}))
+        similarity = sum(1 for k in candidate if k in crash_fields(crash))
         score += similarity * 3
 
     return score
 
 
-def tournament_select(population: List[dict], scores: List[int], tournament_size=3) -> dict:
-    """Select a parent using tournament selection."""
+def tournament_select_many(population: List[dict], scores: List[int], n: int,
+                           tournament_size=3) -> List[dict]:
+    """n parents, each the fittest of tournament_size random individuals."""
 
-    tournament_indices = random.sample(range(len(population)),
-                                       min(tournament_size, len(population)))
-    best_idx = max(tournament_indices, key=lambda i: scores[i])
-    return population[best_idx]
+    size = min(tournament_size, len(population))
+    draws = [random.sample(range(len(population)), size) for _ in range(n)]
+    return [population[max(indices, key=lambda i: scores[i])] for indices in draws]
 
 
 def genetic_crossover(parent1: dict, parent2: dict) -> dict:
     """Combine two JSON files like breeding two parents."""
 
-    child = copy.deepcopy(parent1)
+    child = dict(parent1)
 
     # Randomly inherit some fields from parent 2
     for key in parent2:
@@ -422,17 +1694,141 @@ def genetic_crossover(parent1: dict, parent2: dict) -> dict:
 
     # Add genetic mutations
     if random.random() < 0.3:
-        if child:
+        field = dictionary_pick("fields")
+        if field is not None:
+            child[field[0]] = field[1]
+        elif child:
             key = random.choice(list(child.keys()))
             if isinstance(child[key], str):
-                child[key] = child[key] * random.randint(2, 10)
+                child[key] = dictionary_choice("strings", [child[key] * random.randint(2, 10)])
             elif isinstance(child[key], int):
-                child[key] = child[key] * random.choice([-1, 2, 10, 100])
+                child[key] = dictionary_choice("numbers", [child[key] * random.choice([-1, 2, 10, 100])])
 
     return child
 
 
-def genetic_evolve(corpus: List[dict], crashes: List[dict], use_real_llm: bool = False) -> List[dict]:
+class GAPopulation:
+    """
+    The GA population, kept across generations instead of rebuilt from scratch.
+
+    Individuals are keyed by a hash of their content, so seed_score and
+    base_fitness run once per distinct input.  The crash-similarity term of
+    fitness_function only depends on which fields the last 5 crashes share,
+    so it is kept per individual and patched through a field -> individuals
+    index when that window changes: each generation costs O(changed), not
+    O(population).
+    """
+
+    def __init__(self, max_size: int = GA_POPULATION_SIZE):
+        self.max_size = max_size
+        self.individuals = {}  # key -> {"data", "rank", "base", "similarity"}
+        self.ranking = []  # sorted (-rank, seq, key): best first, oldest first on ties
+        self.by_field = collections.defaultdict(set)  # field -> keys of individuals having it
+        self.key_weight = collections.Counter()  # field -> crashes in the window having it
+        self.window = []  # field sets of the last 5 crashes
+        self.seq = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(data: dict) -> str:
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def add(self, data: dict) -> str:
+        """Admit an individual (scored once), evicting the lowest-ranked if full."""
+        return self.add_many([data])[0]
+
+    def add_many(self, batch: List[dict]) -> List[str]:
+        """add() for a batch (duplicates, in the batch or already admitted, are scored once)."""
+
+        keys = [self.key(data) for data in batch]
+        new = {}
+        for key, data in zip(keys, batch):
+            if key in self.individuals or key in new:
+                self.hits += 1
+            else:
+                self.misses += 1
+                new[key] = data
+
+        for key, data in new.items():
+            rank = seed_score(data)
+            self.individuals[key] = {
+                "data": data,
+                "rank": rank,
+                "base": base_fitness(data),
+                "similarity": sum(self.key_weight[field] for field in data),
+            }
+            for field in data:
+                self.by_field[field].add(key)
+            bisect.insort(self.ranking, (-rank, self.seq, key))
+            self.seq += 1
+
+        while len(self.ranking) > self.max_size:
+            self.evict(self.ranking.pop()[2])
+        return keys
+
+    def evict(self, key: str):
+        for field in self.individuals.pop(key)["data"]:
+            keys = self.by_field[field]
+            keys.discard(key)
+            if not keys:
+                del self.by_field[field]
+
+    def update_crashes(self, crashes: List[dict]):
+        """Move the crash window to crashes[-5:], touching only individuals whose fields changed weight."""
+
+        window = [frozenset(crash_fields(crash)) for crash in crashes[-5:]]
+        if window == self.window:
+            return
+
+        delta = collections.Counter()
+        for fields in self.window:
+            delta.subtract(fields)
+        for fields in window:
+            delta.update(fields)
+        self.window = window
+
+        for field, change in delta.items():
+            if not change:
+                continue
+            self.key_weight[field] += change
+            for key in self.by_field.get(field, ()):
+                self.individuals[key]["similarity"] += change
+
+    def fitness(self, key: str) -> int:
+        """Equal to fitness_function(data, crashes) for the current crash window."""
+        individual = self.individuals[key]
+        return individual["base"] + individual["similarity"] * 3
+
+    def elite(self, n: int) -> List[str]:
+        return [key for _, _, key in self.ranking[:n]]
+
+    def __len__(self):
+        return len(self.individuals)
+
+
+def migration_targets(island: int, islands: List[int], topology: str = GA_TOPOLOGY) -> List[int]:
+    """
+    Islands that receive migrants from `island` (island-model GA).
+
+    ring: the next island; star: island 0 <-> every other; full: all others.
+    """
+
+    others = [i for i in islands if i != island]
+    if not others:
+        return []
+    if topology == "full":
+        return others
+    if topology == "star":
+        hub = min(islands)
+        return others if island == hub else [hub]
+    # ring
+    later = [i for i in others if i > island]
+    return [min(later) if later else min(others)]
+
+
+def genetic_evolve(corpus: List[dict], crashes: List[dict], use_real_llm: bool = False,
+                   batch_size: int = 5, population: Optional[GAPopulation] = None) -> Iterator[dict]:
     """
     ENHANCED GA: Run one generation with LLM seed generation + ranking.
 
@@ -441,7 +1837,7 @@ def genetic_evolve(corpus: List[dict], crashes: List[dict], use_real_llm: bool =
     2. Rank seeds by vulnerability potential (high to low)
     3. Select only top-ranked seeds
     4. Run traditional GA on top seeds (fitness + breeding)
-    5. Return evolved offspring
+    5. Yield evolved offspring (batch_size of them, lazily)
     """
 
     # STEP 1: Generate LLM seeds
@@ -452,189 +1848,2568 @@ def genetic_evolve(corpus: List[dict], crashes: List[dict], use_real_llm: bool =
 
     llm_seeds = generate_llm_seeds(base_data, use_real_llm)
 
-    # STEP 2: Rank the LLM seeds
-    ranked_seeds = rank_seeds(llm_seeds)
+    # STEP 2: Rank the LLM seeds (only new ones are scored; the rest is memoized)
+    if population is None:
+        population = GAPopulation()
+    population.add_many(llm_seeds)
+    population.update_crashes(crashes)
 
     # STEP 3: Select only top-ranked seeds
-    top_n = min(10, len(ranked_seeds))
-    elite_seeds = select_top_seeds(ranked_seeds, top_n)
+    elite_keys = population.elite(GA_ELITE_SIZE)
+    elite_seeds = [population.individuals[key]["data"] for key in elite_keys]
+
+    if VERBOSE_MODE:
+        print(f"  📊 Ranked {len(population)} seeds ({population.misses} scored, {population.hits} memoized)")
+        if elite_keys:
+            print(f"     Top score: {population.individuals[elite_keys[0]]['rank']}")
+        print(f"  ✂️  Selected top {len(elite_seeds)} seeds for GA evolution")
 
     # Edge case: If we got no seeds, fall back
     if not elite_seeds:
         if VERBOSE_MODE:
             print("  ⚠️  No elite seeds available, using traditional mutation fallback")
         if corpus:
-            return traditional_mutate(corpus[0])
-        else:
-            return []
+            yield from traditional_mutate(corpus[0])
+        return
 
     # STEP 4: Run GA on elite seeds
-    scores = [fitness_function(seed, crashes) for seed in elite_seeds]
-
-    # STEP 5: Breed the elite seeds
-    offspring = []
-    for _ in range(5):
-        parent1 = tournament_select(elite_seeds, scores)
-        parent2 = tournament_select(elite_seeds, scores)
-        child = genetic_crossover(parent1, parent2)
-        offspring.append(child)
+    scores = [population.fitness(key) for key in elite_keys]
 
+    # STEP 5: Breed the elite seeds; offspring join the population for later generations
     if VERBOSE_MODE:
-        print(f"  🧬 GA: Generated {len(offspring)} offspring from top seeds")
+        print(f"  🧬 GA: Breeding up to {batch_size} offspring from top seeds")
 
-    return offspring
+    parents = tournament_select_many(elite_seeds, scores, 2 * batch_size)
+    for parent1, parent2 in zip(parents[::2], parents[1::2]):
+        child = genetic_crossover(parent1, parent2)
+        population.add(child)
+        yield child
 
 
 # ============================================================================
 # PART 7: TEST EXECUTION
 # ============================================================================
 
-def test_input(json_file: str) -> Tuple[bool, str]:
-    """Run a test file through our vulnerable program."""
+# Hangs are reported as (False, output) with output starting with HANG_MARKER:
+# they are not crashes, and get their own bucket (see HangIndex).
+HANG_MARKER = "HANG:"
+HANG_OUTPUT = HANG_MARKER + " Timeout - possible infinite loop"
+
+
+def is_hang(output: str) -> bool:
+    return output.startswith(HANG_MARKER)
+
+
+def test_input(json_file: str, stdin_data: Optional[str] = None, pass_fds=(),
+               timeout: float = EXEC_TIMEOUT_MAX, command: Optional[List[str]] = None,
+               crash_detection: str = "exit", crash_marker: Optional[str] = "CRASH") -> Tuple[bool, str]:
+    """
+    Run a test file through our vulnerable program, or through `command`
+    with every "@@" argument replaced by json_file.
+
+    crash_detection "exit" counts any non-zero exit status as a crash,
+    "signal" only death by a signal (SIGSEGV, SIGABRT, ...); either way
+    crash_marker in the output is a crash too.
+    """
+
+    if command is None:
+        command = [sys.executable, "vulnerable_parser.py", "@@"]
 
     try:
         result = subprocess.run(
-            [sys.executable, "vulnerable_parser.py", json_file],
+            [json_file if arg == "@@" else arg for arg in command],
+            input=stdin_data,
             capture_output=True,
             text=True,
-            timeout=2
+            timeout=timeout,
+            pass_fds=pass_fds
         )
 
         output = result.stdout + result.stderr
-        crashed = "CRASH" in output or result.returncode != 0
+        if result.returncode < 0:
+            try:
+                name = signal.Signals(-result.returncode).name
+            except ValueError:
+                name = f"signal {-result.returncode}"
+            output += f"\nTarget killed by {name}\n"
+
+        crashed = (result.returncode < 0
+                   or (crash_detection == "exit" and result.returncode != 0)
+                   or (bool(crash_marker) and crash_marker in output))
 
         return crashed, output
 
     except subprocess.TimeoutExpired:
-        return True, "CRASH: Timeout - possible infinite loop"
+        return False, HANG_OUTPUT
     except Exception as e:
         return False, f"Error running test: {str(e)}"
 
 
-# ============================================================================
-# PART 8: COMPARATIVE FUZZER
-# ============================================================================
+class Target:
+    """
+    Something the fuzzer executes: it takes one input string per run, and
+    declares how it prefers to receive it (delivery) and how a crash is told
+    apart from a normal run (crash_detection):
+
+    - CallableTarget  a Python function, called in this process   "call"        / "exception"
+    - ModuleTarget    a Python module in a long-lived worker       "persistent" or "forkserver"
+                                                                  / "exception"
+    - CommandTarget   any external command, one process per run   "stdin", "file", "memfd", "argv"
+                                                                  / "exit" or "signal"
+
+    run() returns (crashed, output) and leaves the edge trace of that run in
+    last_trace (None if the target can't be traced).  A hang is returned as
+    (False, output starting with HANG_MARKER).  clone() makes an unstarted
+    copy with the same settings (parallel workers and the minimizer each need
+    their own).
+
+    For the dictionary, source_file() is the target's Python source (None if
+    it has none) and compare_log() runs one input and returns what it was
+    compared with (None if the target can't log comparisons).
+    """
 
-class ComparativeFuzzer:
-    """Runs three separate fuzzing campaigns to compare effectiveness."""
+    delivery = ""
+    crash_detection = ""
+    thread_timeouts = True  # Runs from a background thread are timed out too
 
-    def __init__(self, seed_files: List[str]):
-        """Initialize with seed files."""
+    def __init__(self, timeout: float = EXEC_TIMEOUT_MAX):
+        self.timeout = timeout
+        self.last_trace = None
+        self.restart_time = 0.0  # Seconds run() spent restarting the target since the caller last reset it
 
-        self.corpus = []
-        self.crashes = []
-        self.coverage_tracker = CoverageTracker()
+    def start(self) -> bool:
+        """Get ready to run inputs. Returns False if the target is unusable."""
+        return True
 
-        for seed_file in seed_files:
-            with open(seed_file, 'r') as f:
-                try:
-                    data = json.load(f)
-                    self.corpus.append(data)
-                except:
-                    pass
+    def run(self, content: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        raise NotImplementedError
 
-        print(f"✓ Fuzzer initialized with {len(self.corpus)} seed files")
-        self.use_real_llm = setup_ollama()
+    def stop(self):
+        """Release whatever start() acquired."""
 
-    def should_add_to_corpus(self, mutant: dict, output: str) -> bool:
-        """Decide if this input is interesting enough to save."""
+    def clone(self) -> "Target":
+        raise NotImplementedError
 
-        bugs_before = self.coverage_tracker.covered_bugs.copy()
-        self.coverage_tracker.analyze_output(output)
-        new_bugs = self.coverage_tracker.covered_bugs - bugs_before
+    def source_file(self) -> Optional[str]:
+        return None
 
-        return len(new_bugs) > 0
+    def compare_log(self, content: str) -> Optional[List[list]]:
+        """[kind, left, right] per distinct comparison one run made (see PERSISTENT_HARNESS_CODE)."""
+        return None
 
-    def run_campaign(self, method_name: str, mutation_func, max_tests=100):
-        """Run a fuzzing campaign with ONE specific method."""
+    def describe(self) -> str:
+        return f"{type(self).__name__} ({self.delivery} delivery, {self.crash_detection} crash detection)"
 
-        print(f"\n{'=' * 60}")
-        print(f"TESTING: {method_name} Fuzzing")
-        print(f"{'=' * 60}\n")
 
-        local_corpus = copy.deepcopy(self.corpus)
-        local_crashes = []
-        local_coverage = CoverageTracker()
-        tests_run = 0
+class CommandTarget(Target):
+    """
+    Hands an in-memory input to a fresh target process without creating a file per test.
 
-        start_time = time.time()
+    The command is an argv list; "@@" stands for where the input goes.  Delivery:
+    - "stdin": pipe the input in (and pass /dev/stdin for @@)
+    - "file":  overwrite ONE reused file (on tmpfs /dev/shm when available)
+    - "memfd": write into an anonymous memory file and pass /dev/fd/<n>
+    - "argv":  pass the input itself as the @@ argument
 
-        while tests_run < max_tests:
-            parent = random.choice(local_corpus)
+    By default a command with @@ gets "file" (any program can open a real
+    path) and one without gets "stdin".
+    """
 
-            # Generate mutations
-            if method_name == "GA":
-                mutations = mutation_func(local_corpus, local_crashes, self.use_real_llm)
-                if not mutations:
-                    continue
-            else:
-                mutations = mutation_func(parent)
+    def __init__(self, command: Optional[List[str]] = None, mode: Optional[str] = None,
+                 timeout: float = EXEC_TIMEOUT_MAX, crash_detection: str = "exit",
+                 crash_marker: Optional[str] = "CRASH"):
+        super().__init__(timeout)
+        self.command = command
+        if mode is None:
+            mode = "file" if command is None or "@@" in command else "stdin"
+        if mode == "memfd" and not hasattr(os, "memfd_create"):
+            mode = "file"
+
+        self.delivery = self.mode = mode
+        self.crash_detection = crash_detection
+        self.crash_marker = crash_marker
+        self.path = None
+        self.fd = None
+
+        if mode == "file":
+            tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            self.fd, self.path = tempfile.mkstemp(prefix="fuzz_input_", suffix=".json", dir=tmp_dir)
+        elif mode == "memfd":
+            self.fd = os.memfd_create("fuzz_input")
+
+    def run(self, content: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """Deliver one input to a new target process."""
+
+        timeout = timeout or self.timeout
+        checks = {"timeout": timeout, "command": self.command,
+                  "crash_detection": self.crash_detection, "crash_marker": self.crash_marker}
+        if self.mode == "stdin":
+            return test_input("/dev/stdin", stdin_data=content, **checks)
+        if self.mode == "argv":
+            return test_input(content, **checks)
+
+        data = content.encode("utf-8")
+        os.ftruncate(self.fd, 0)
+        os.pwrite(self.fd, data, 0)
+
+        if self.mode == "memfd":
+            return test_input(f"/dev/fd/{self.fd}", pass_fds=(self.fd,), **checks)
+        return test_input(self.path, **checks)
+
+    def stop(self):
+        """Release the reused file / memory buffer."""
+
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+    def clone(self) -> "CommandTarget":
+        return CommandTarget(self.command, self.mode, self.timeout, self.crash_detection, self.crash_marker)
+
+    def source_file(self) -> Optional[str]:
+        if self.command is None:
+            return "vulnerable_parser.py"
+        if self.command[:3] == [sys.executable, "-c", PYTHON_RUNNER_CODE]:
+            return module_source(self.command[3])
+        return None
+
+    def describe(self) -> str:
+        if not self.command:
+            what = "`python vulnerable_parser.py @@`"
+        elif self.command[:3] == [sys.executable, "-c", PYTHON_RUNNER_CODE]:
+            what = f"{self.command[3]}.{self.command[4]}() in a new Python per test"
+        else:
+            what = f"`{' '.join(self.command)[:60]}`"
+        return f"{what} ({self.delivery} delivery, {self.crash_detection} crash detection)"
 
-            # Test each mutation
-            for mutated in mutations:
-                if tests_run >= max_tests:
-                    break
 
-                test_file = f"test_files/test_{method_name}_{tests_run}.json"
+class TargetTimeout(BaseException):
+    """Raised into an in-process target by SIGALRM (BaseException: its "except Exception" can't swallow it)."""
+
+
+def raise_target_timeout(signum, frame):
+    raise TargetTimeout
+
+
+class CallableTarget(Target):
+    """
+    Calls a Python function directly in this process: no process or pipe in
+    the way at all, but also no isolation - a target that corrupts interpreter
+    state or calls os._exit() takes the fuzzer down with it.
+
+    Coverage is traced (like the persistent worker does) in the function's own
+    source file.  Timeouts use SIGALRM, so they're only enforced on the main
+    thread (crashes aren't minimized in the background).  Runs are serialized
+    across threads anyway: sys.stdout is redirected for each call.
+    """
+
+    delivery = "call"
+    crash_detection = "exception"
+    thread_timeouts = False
+    lock = threading.Lock()
+
+    def __init__(self, func: Callable[[str], object], timeout: float = EXEC_TIMEOUT_MAX,
+                 crash_marker: Optional[str] = "CRASH"):
+        super().__init__(timeout)
+        self.func = func
+        self.crash_marker = crash_marker
+        code = getattr(func, "__code__", None)
+        self.target_file = code.co_filename if code is not None else None
+        self.locations = {}
+        self.edges = {}
+        self.prev_location = 0
+
+    def _line_tracer(self, frame, event, arg):
+        if event == "line":
+            key = (frame.f_code, frame.f_lineno)
+            location = self.locations.get(key)
+            if location is None:
+                tag = f"{frame.f_code.co_name}:{frame.f_code.co_firstlineno}:{frame.f_lineno}"
+                location = self.locations[key] = zlib.crc32(tag.encode()) & (MAP_SIZE - 1)
+            edge = location ^ self.prev_location
+            self.edges[edge] = self.edges.get(edge, 0) + 1
+            self.prev_location = location >> 1
+        return self._line_tracer
+
+    def _call_tracer(self, frame, event, arg):
+        if frame.f_code.co_filename == self.target_file:
+            return self._line_tracer
+        return None
+
+    def run(self, content: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        timeout = timeout or self.timeout
+        alarm = threading.current_thread() is threading.main_thread()
+        captured = io.StringIO()
+        crashed = False
+        self.edges = {}
+        self.prev_location = 0
+
+        with self.lock:
+            try:
                 try:
-                    with open(test_file, 'w') as f:
-                        json.dump(mutated, f)
+                    with contextlib.redirect_stdout(captured):
+                        if alarm:
+                            previous = signal.signal(signal.SIGALRM, raise_target_timeout)
+                            signal.setitimer(signal.ITIMER_REAL, timeout)
+                        sys.settrace(self._call_tracer if self.target_file else None)
+                        try:
+                            result = self.func(content)
+                        finally:
+                            sys.settrace(None)
+                            if alarm:
+                                signal.setitimer(signal.ITIMER_REAL, 0)
+                                signal.signal(signal.SIGALRM, previous)
+                    output = captured.getvalue() + str(result) + "\n"
+                except SystemExit as e:
+                    crashed = e.code not in (None, 0)
+                    output = captured.getvalue()
+                except TargetTimeout:
+                    raise
+                except Exception as e:
+                    crashed = True
+                    # Skip this frame: the traceback should start in the target
+                    output = captured.getvalue() + "".join(
+                        traceback.format_exception(type(e), e, e.__traceback__.tb_next))
+            except TargetTimeout as e:
+                output = f"HANG: Timeout after {timeout:g}s\n" + "".join(
+                    traceback.format_exception(type(e), e, e.__traceback__.tb_next))
+
+        self.last_trace = list(self.edges.items()) if self.target_file else None
+        return crashed or (bool(self.crash_marker) and self.crash_marker in output), output
+
+    def clone(self) -> "CallableTarget":
+        return CallableTarget(self.func, self.timeout, self.crash_marker)
+
+    def source_file(self) -> Optional[str]:
+        return self.target_file
+
+    def describe(self) -> str:
+        name = getattr(self.func, "__qualname__", repr(self.func))
+        return f"{name}() in-process ({self.delivery} delivery, {self.crash_detection} crash detection)"
+
+
+# Code for the long-lived worker. It imports the target ONCE, then loops:
+# read a length-prefixed input from stdin, call the target, send back a
+# length-prefixed JSON verdict on the original stdout.  In fork-server mode
+# each input runs in a child forked from the warm worker instead, so a
+# target that corrupts its own state (or dies) only takes the child with it.
+PERSISTENT_HARNESS_CODE = '''
+import ast
+import contextlib
+import importlib
+import io
+import json
+import linecache
+import operator
+import os
+import select
+import signal
+import struct
+import sys
+import time
+import traceback
+import zlib
+
+module_name, func_name, target_dir = sys.argv[1], sys.argv[2], sys.argv[3]
+map_mask = int(sys.argv[4]) - 1
+crash_marker = sys.argv[5]
+fork_server = sys.argv[6] == "forkserver"
+sys.path.insert(0, target_dir)
+
+# Keep the protocol pipes private so target prints can't corrupt them
+proto_in = os.fdopen(os.dup(0), "rb", buffering=0)
+proto_out = os.fdopen(os.dup(1), "wb", buffering=0)
+os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+os.dup2(2, 1)
+
+
+def send(message):
+    send_raw(json.dumps(message).encode("utf-8"))
+
+
+def send_raw(data):
+    proto_out.write(struct.pack("<I", len(data)) + data)
+
+
+def read_exact(n):
+    data = b""
+    while len(data) < n:
+        chunk = proto_in.read(n - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+try:
+    module = importlib.import_module(module_name)
+    target = getattr(module, func_name)
+except BaseException as e:
+    send({"ready": False, "error": repr(e)})
+    sys.exit(1)
+
+send({"ready": True})
+
+# Edge coverage: every line transition inside the target module is one edge,
+# hashed AFL-style as (prev_location >> 1) ^ location into a fixed-size map.
+target_file = getattr(module, "__file__", None)
+locations = {}
+edges = {}
+prev_location = 0
+
+
+def line_tracer(frame, event, arg):
+    global prev_location
+    if event == "line":
+        key = (frame.f_code, frame.f_lineno)
+        location = locations.get(key)
+        if location is None:
+            # crc32 instead of hash(): stable across worker restarts
+            tag = f"{frame.f_code.co_name}:{frame.f_code.co_firstlineno}:{frame.f_lineno}"
+            location = locations[key] = zlib.crc32(tag.encode()) & map_mask
+        edge = location ^ prev_location
+        edges[edge] = edges.get(edge, 0) + 1
+        prev_location = location >> 1
+    return line_tracer
+
+
+def call_tracer(frame, event, arg):
+    if frame.f_code.co_filename == target_file:
+        return line_tracer
+    return None
+
+
+# Timeouts are enforced in here with an interval timer, so a hang comes back
+# as a traceback of where the target was stuck instead of a killed worker.
+# BaseException: the target's own "except Exception" can't swallow it.
+class HarnessTimeout(BaseException):
+    pass
+
+
+def on_alarm(signum, frame):
+    raise HarnessTimeout
+
+
+signal.signal(signal.SIGALRM, on_alarm)
+
+# Compare logging (CMPLOG): a second copy of the target module is compiled
+# with every single comparison turned into a __cmplog__ call that records
+# its operands before comparing.  Runs with flag 1 use that copy (untraced),
+# and the verdict brings back what the input was compared with.
+MAX_COMPARES = 256
+MAX_OPERAND = 64
+COMPARE_OPS = {"Eq": operator.eq, "NotEq": operator.ne, "Lt": operator.lt, "LtE": operator.le,
+               "Gt": operator.gt, "GtE": operator.ge, "Is": operator.is_, "IsNot": operator.is_not,
+               "In": lambda a, b: a in b, "NotIn": lambda a, b: a not in b}
+compares = {}  # [kind, left, right] -> None, in first-seen order
+cmp_target = None  # The instrumented target function (False: no source to instrument)
+
+
+def operand(value):
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None
+    if isinstance(value, str) and len(value) > MAX_OPERAND:
+        return None
+    return value
+
+
+def cmplog(kind, op, left, right):
+    if len(compares) < MAX_COMPARES:
+        # The len() side is the input's length; only what it's compared with is news
+        if kind == "len":
+            compares[("len", None, operand(right))] = None
+        elif kind == "rlen":
+            compares[("len", operand(left), None)] = None
+        else:
+            if op in ("In", "NotIn") and isinstance(right, dict):
+                kind = "key"
+            if isinstance(right, (tuple, list, set, frozenset)) and len(right) <= 16:
+                for item in right:
+                    compares[(kind, operand(left), operand(item))] = None
+            else:
+                compares[(kind, operand(left), operand(right))] = None
+    return COMPARE_OPS[op](left, right)
+
+
+def is_len_call(node):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "len"
+
+
+class CompareLogger(ast.NodeTransformer):
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) != 1:
+            return node  # a < b < c evaluates b once; a call can't
+        left, right = node.left, node.comparators[0]
+        kind = "len" if is_len_call(left) else "rlen" if is_len_call(right) else "cmp"
+        call = ast.Call(ast.Name("__cmplog__", ast.Load()),
+                        [ast.Constant(kind), ast.Constant(type(node.ops[0]).__name__), left, right], [])
+        return ast.copy_location(call, node)
+
+
+def load_cmp_target():
+    global cmp_target
+    cmp_target = False
+    try:
+        with open(target_file, encoding="utf-8") as f:
+            tree = ast.fix_missing_locations(CompareLogger().visit(ast.parse(f.read())))
+        namespace = {"__name__": module_name, "__file__": target_file, "__cmplog__": cmplog}
+        exec(compile(tree, target_file, "exec"), namespace)
+        cmp_target = namespace[func_name]
+    except BaseException:
+        pass
+
+
+def execute(payload, timeout, log_compares=False):
+    global prev_location
+    captured = io.StringIO()
+    crashed = False
+    edges.clear()
+    compares.clear()
+    prev_location = 0
+    function = cmp_target if log_compares and cmp_target else target
+    try:
+        try:
+            with contextlib.redirect_stdout(captured):
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+                sys.settrace(call_tracer if function is target else None)
+                try:
+                    result = function(payload.decode("utf-8", errors="replace"))
+                finally:
+                    sys.settrace(None)
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            output = captured.getvalue() + str(result) + "\\n"
+        except SystemExit as e:
+            crashed = e.code not in (None, 0)
+            output = captured.getvalue()
+        except HarnessTimeout:
+            raise
+        except BaseException:
+            crashed = True
+            output = captured.getvalue() + traceback.format_exc()
+    except HarnessTimeout:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        crashed = False
+        output = f"HANG: Timeout after {timeout:g}s\\n" + traceback.format_exc()
+
+    verdict = {"crashed": crashed or (crash_marker != "" and crash_marker in output), "output": output,
+               "trace": list(edges.items())}
+    if log_compares:
+        verdict["compares"] = list(compares)
+    return verdict
+
+
+children = []  # Forked children that sent their verdict but may not have exited yet
+
+
+def fork_execute(payload, timeout, log_compares=False):
+    """Run one input in a forked child; its length-prefixed verdict comes back over a pipe."""
+
+    # Reap the previous child now: waiting for it to exit would delay its verdict
+    while children:
+        os.waitpid(children.pop(), 0)
+
+    verdict_in, verdict_out = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(verdict_in)
+            data = json.dumps(execute(payload, timeout, log_compares)).encode("utf-8")
+            data = struct.pack("<I", len(data)) + data
+            while data:
+                data = data[os.write(verdict_out, data):]
+        finally:
+            os._exit(0)
+
+    # The child times itself out; this deadline only catches what its timer can't
+    os.close(verdict_out)
+    data = b""
+    needed = 4
+    killed = False
+    deadline = time.monotonic() + timeout * 2 + 0.25
+    while len(data) < needed:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([verdict_in], [], [], remaining)[0]:
+            os.kill(pid, signal.SIGKILL)
+            killed = True
+            break
+        chunk = os.read(verdict_in, max(needed - len(data), 1 << 16))
+        if not chunk:
+            break
+        data += chunk
+        if needed == 4 and len(data) >= 4:
+            needed = 4 + struct.unpack("<I", data[:4])[0]
+    os.close(verdict_in)
+
+    if len(data) >= needed and not killed:
+        children.append(pid)
+        return data[4:]
+    status = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+    if killed:
+        return {"crashed": False, "output": f"HANG: Timeout after {timeout:g}s (child killed)\\n", "trace": []}
+    # Died mid-run (os._exit, segfault, ...) - the worker itself is still fine
+    how = f"signal {-status}" if status < 0 else f"exit status {status}"
+    return {"crashed": True, "output": f"CRASH: Forked child died ({how})\\n", "trace": []}
+
+
+if fork_server:
+    # Children start from this image and never hand anything back, so warm
+    # what every crash report needs here, once: traceback reads the target's
+    # source lines (and needs ast, imported above, for its ^^^ markers) - per
+    # child that costs several times more than the fork itself
+    if target_file:
+        linecache.getlines(target_file)
+
+while True:
+    header = read_exact(13)
+    if header is None:
+        break
+    length, timeout, flags = struct.unpack("<IdB", header)
+    log_compares = bool(flags & 1)
+    payload = read_exact(length)
+    if payload is None:
+        break
+    if log_compares and cmp_target is None:
+        load_cmp_target()  # Here, so forked children inherit it
+
+    if fork_server:
+        verdict = fork_execute(payload, timeout, log_compares)
+        # The child's verdict is already encoded; just forward it
+        if isinstance(verdict, bytes):
+            send_raw(verdict)
+        else:
+            send(verdict)
+    else:
+        send(execute(payload, timeout, log_compares))
+'''
+
+
+class ModuleTarget(Target):
+    """
+    Runs tests inside one long-lived worker instead of one Python process per test.
+
+    mode "persistent" calls the target in the worker itself (fastest, but
+    state the target leaves behind carries over to the next test);
+    "forkserver" runs each test in a child forked from the warm worker, so
+    every test starts from the freshly imported state and a dying target
+    costs one child instead of a worker restart.
+    """
+
+    crash_detection = "exception"
+
+    def __init__(self, module_name: str = TARGET_MODULE, func_name: str = TARGET_FUNCTION,
+                 timeout: float = EXEC_TIMEOUT_MAX, crash_marker: Optional[str] = "CRASH",
+                 mode: str = "persistent"):
+        super().__init__(timeout)
+        self.module_name = module_name
+        self.func_name = func_name
+        self.crash_marker = crash_marker
+        self.delivery = self.mode = mode
+        self.proc = None
+        self.restarts = 0
+        # last_trace: edge trace of the most recent run (None if the worker died)
+
+    def start(self) -> bool:
+        """Launch the worker. Returns False if the target can't be imported."""
+
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", PERSISTENT_HARNESS_CODE,
+             self.module_name, self.func_name, os.getcwd(), str(MAP_SIZE), self.crash_marker or "", self.mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+
+        try:
+            ready = self._read_message(timeout=10)
+        except TimeoutError:
+            ready = None  # Import still running (or hung) after 10 s
+        if not ready or not ready.get("ready"):
+            self.stop()
+            return False
+        return True
+
+    def stop(self):
+        """Kill the worker (if any)."""
+
+        if self.proc is None:
+            return
+        try:
+            self.proc.kill()
+            self.proc.wait(timeout=1)
+        except Exception:
+            pass
+        for pipe in (self.proc.stdin, self.proc.stdout):
+            try:
+                pipe.close()
+            except Exception:
+                pass
+        self.proc = None
+
+    def restart(self):
+        """Replace a crashed or hung worker with a fresh one."""
+
+        started = time.perf_counter()
+        self.stop()
+        self.restarts += 1
+        self.start()
+        self.restart_time += time.perf_counter() - started
+
+    def run(self, content: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """Send one input to the worker and wait for its verdict."""
+
+        verdict = self._request(content, timeout or self.timeout)
+        self.last_trace = verdict.get("trace")
+        return verdict["crashed"], verdict["output"]
+
+    def compare_log(self, content: str) -> Optional[List[list]]:
+        return self._request(content, self.timeout, flags=1).get("compares")
+
+    def _request(self, content: str, timeout: float, flags: int = 0) -> dict:
+        """One input -> the worker's verdict (flags: 1 = log compares); failures come back as verdicts too."""
+
+        if self.proc is None and not self.start():
+            return {"crashed": False, "output": "Error running test: persistent worker unavailable"}
+
+        data = content.encode("utf-8")
+        try:
+            self.proc.stdin.write(struct.pack("<IdB", len(data), timeout, flags) + data)
+        except (BrokenPipeError, OSError):
+            self.restart()
+            return {"crashed": True, "output": "CRASH: Persistent worker died before reading input"}
+
+        try:
+            # The worker times the target out itself; this only catches hangs
+            # its timer can't interrupt (e.g. inside one long C call)
+            verdict = self._read_message(timeout * 2 + 0.5)
+        except TimeoutError:
+            self.restart()
+            return {"crashed": False, "output": HANG_OUTPUT}
+
+        if verdict is None:
+            # Worker died mid-test (os._exit, segfault, ...) - same as a crashing process
+            self.restart()
+            return {"crashed": True, "output": "CRASH: Persistent worker died while running input"}
+        return verdict
+
+    def _read_message(self, timeout: float) -> Optional[dict]:
+        """Read one length-prefixed JSON frame, or None if the worker is gone."""
+
+        header = self._read_exact(4, timeout)
+        if header is None:
+            return None
+        body = self._read_exact(struct.unpack("<I", header)[0], timeout)
+        if body is None:
+            return None
+        return json.loads(body.decode("utf-8"))
+
+    def _read_exact(self, n: int, timeout: float) -> Optional[bytes]:
+        fd = self.proc.stdout.fileno()
+        deadline = time.time() + timeout
+        data = b""
+
+        while len(data) < n:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                raise TimeoutError
+            chunk = os.read(fd, n - len(data))
+            if not chunk:
+                return None
+            data += chunk
+
+        return data
+
+    def clone(self) -> "ModuleTarget":
+        return ModuleTarget(self.module_name, self.func_name, self.timeout, self.crash_marker, self.mode)
+
+    def source_file(self) -> Optional[str]:
+        return module_source(self.module_name)
+
+    def describe(self) -> str:
+        where = "a child forked from a worker" if self.mode == "forkserver" else "a worker"
+        return (f"{self.module_name}.{self.func_name}() in {where}, imported once "
+                f"({self.delivery} delivery, {self.crash_detection} crash detection)")
+
+
+# Runs a Python target function once on the input file given as argv[3]
+PYTHON_RUNNER_CODE = (
+    "import importlib, sys; "
+    "print(getattr(importlib.import_module(sys.argv[1]), sys.argv[2])(open(sys.argv[3]).read()))"
+)
+
+
+def module_source(module_name: str) -> Optional[str]:
+    """Source (or sourceless .pyc) file of a Python target module (looked up like the workers do, from the working directory)."""
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    origin = spec.origin if spec is not None else None
+    return origin if origin and origin.endswith((".py", ".pyc")) else None
+
+
+def python_command(module_name: str = TARGET_MODULE, func_name: str = TARGET_FUNCTION) -> List[str]:
+    """argv that runs a Python target function in a fresh interpreter (subprocess mode)."""
+    return [sys.executable, "-c", PYTHON_RUNNER_CODE, module_name, func_name, "@@"]
+
+
+def make_target(timeout: float = EXEC_TIMEOUT_MAX) -> Target:
+    """The (unstarted) target set by TARGET_COMMAND, or TARGET_MODULE + EXECUTION_MODE."""
+
+    if TARGET_COMMAND:
+        return CommandTarget(list(TARGET_COMMAND), TARGET_DELIVERY, timeout, TARGET_CRASH_DETECTION)
+    # The Python runner open()s its @@ argument, so every input passed as one would "crash"
+    if INPUT_DELIVERY not in ("stdin", "file", "memfd"):
+        raise ValueError(f'INPUT_DELIVERY must be "stdin", "file" or "memfd", not {INPUT_DELIVERY!r}')
+    if EXECUTION_MODE == "inprocess":
+        # Python puts the script's directory on sys.path, not the working directory
+        if os.getcwd() not in sys.path:
+            sys.path.insert(0, os.getcwd())
+        module = importlib.import_module(TARGET_MODULE)
+        return CallableTarget(getattr(module, TARGET_FUNCTION), timeout)
+    if EXECUTION_MODE in ("persistent", "forkserver"):
+        return ModuleTarget(TARGET_MODULE, TARGET_FUNCTION, timeout, mode=EXECUTION_MODE)
+    return CommandTarget(python_command(), INPUT_DELIVERY, timeout)
+
+
+def start_target(target: Target) -> Target:
+    """Start a target. A module the worker can't import falls back to one subprocess per test."""
+
+    if target.start():
+        return target
+    if not isinstance(target, ModuleTarget):
+        raise RuntimeError(f"Can't start target {target.describe()}")
+
+    if VERBOSE_MODE:
+        print("⚠️  Target can't be imported, falling back to one subprocess per test\n")
+    fallback = CommandTarget(python_command(target.module_name, target.func_name), INPUT_DELIVERY,
+                             target.timeout, crash_marker=target.crash_marker)
+    fallback.start()
+    return fallback
+
+
+def builtin_target() -> bool:
+    """True if we fuzz the built-in vulnerable parser (which must be written out first)."""
+    return not TARGET_COMMAND and TARGET_MODULE == "vulnerable_parser"
+
+
+# ============================================================================
+# PART 8: CRASH MINIMIZATION
+# ============================================================================
+
+def shrink_candidates(value):
+    """Yield strictly simpler variants of a JSON value (dropped keys, shorter strings/lists, smaller numbers)."""
+
+    if isinstance(value, dict):
+        for key in value:
+            yield {k: v for k, v in value.items() if k != key}
+        for key, child in value.items():
+            for smaller in shrink_candidates(child):
+                reduced = dict(value)
+                reduced[key] = smaller
+                yield reduced
+
+    elif isinstance(value, list):
+        if value:
+            yield []
+        chunk = len(value) // 2
+        while chunk >= 1:
+            # ddmin-style: drop one chunk at a time, largest chunks first
+            for start in range(0, len(value), chunk):
+                yield value[:start] + value[start + chunk:]
+            chunk //= 2
+        for i, child in enumerate(value):
+            for smaller in shrink_candidates(child):
+                yield value[:i] + [smaller] + value[i + 1:]
+
+    elif isinstance(value, str):
+        if value:
+            yield ""
+        chunk = len(value) // 2
+        while chunk >= 1:
+            yield value[:-chunk]
+            yield value[chunk:]
+            chunk //= 2
+
+    elif isinstance(value, bool):
+        return
+
+    elif isinstance(value, float):
+        # inf/nan (structure-aware boundary values) have no int() - 0 is the simplest number
+        yield int(value) if math.isfinite(value) else 0
+
+    elif isinstance(value, int):
+        if value != 0:
+            yield 0
+        if value < -1:
+            yield -1
+        if abs(value) > 1:
+            yield int(value / 2)
+
+
+def minimize_input(data: dict, still_crashes: Callable[[dict], bool],
+                   max_execs: int = MINIMIZE_MAX_EXECS) -> dict:
+    """
+    Greedy structure-aware delta debugging (afl-tmin style).
+
+    Repeatedly applies the first shrink that keeps still_crashes() true until
+    no shrink works or the exec budget runs out.
+    """
+
+    best = data
+    execs = 0
+    improved = True
+
+    while improved and execs < max_execs:
+        improved = False
+        for candidate in shrink_candidates(best):
+            if execs >= max_execs:
+                break
+            execs += 1
+            if still_crashes(candidate):
+                best = candidate
+                improved = True
+                break
+
+    return best
+
+
+class CrashMinimizer:
+    """Shrinks new crash reproducers in a background thread on its own worker."""
+
+    def __init__(self, target: Target, max_execs: int = MINIMIZE_MAX_EXECS):
+        self.target = target
+        self.max_execs = max_execs
+        self.index = CrashIndex()  # Only used for signature()
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self._work, daemon=True)
+        self.thread.start()
+
+    def submit(self, sig: str, crash_input: dict):
+        """Queue one crash for minimization."""
+        self.jobs.put((sig, crash_input))
+
+    def drain(self) -> List[tuple]:
+        """Finished jobs as (signature, original input, minimized input, content, output)."""
+
+        done = []
+        while True:
+            try:
+                done.append(self.results.get_nowait())
+            except queue.Empty:
+                return done
+
+    def finish(self):
+        """Wait for queued jobs, then stop the thread and its worker."""
+
+        self.jobs.join()
+        self.jobs.put(None)
+        self.thread.join()
+        self.target.stop()
+
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+
+            sig, crash_input = job
+            kept = {}
+
+            def still_crashes(candidate):
+                content = json.dumps(candidate)
+                crashed, output = self.target.run(content)
+                if crashed and self.index.signature(output)[0] == sig:
+                    kept["content"], kept["output"] = content, output
+                    return True
+                return False
+
+            try:
+                minimized = minimize_input(crash_input, still_crashes, self.max_execs)
+                if minimized is not crash_input:
+                    self.results.put((sig, crash_input, minimized, kept["content"], kept["output"]))
+            finally:
+                self.jobs.task_done()
+
+
+# ============================================================================
+# PART 9: CORPUS STORE AND DISTILLATION
+# ============================================================================
+
+class CorpusStore:
+    """
+    Campaign corpus: entries serialized back to back in one buffer, indexed by content hash.
+
+    Reads like the List[dict] it replaces (len, indexing, iteration, random.choice)
+    but an entry is only decoded when it's read, so each entry costs its JSON
+    bytes, a 20-byte SHA-1 and a few array slots instead of a tree of Python
+    objects.  Adding content that is already stored is an O(1) no-op.
+
+    Slots are append-only; `order` holds the live slots in corpus order, so
+    distillation just rewrites that array (and compacts the buffer once most of
+    it is dead).  Per-slot metadata lives in typed columns: size, exec time,
+    hits (times picked as a parent), finds (children that found something new)
+    and whether the entry was found by this campaign rather than seeded/synced.
+
+    share() freezes a store: CorpusStore(base=shared) then reads the shared
+    entries in place and copies only the small columns, so every campaign
+    starts from the one seed corpus without copying it.
+    """
+
+    COMPACT_SLACK = 1 << 20  # Dead bytes tolerated on top of the live ones before compacting
+
+    def __init__(self, entries=(), base: Optional["CorpusStore"] = None):
+        self.base = base
+        self.first = base.slots if base is not None else 0  # Slots below this are read from base
+        self.arena = bytearray()  # Serialized entries of our own slots
+        self.offsets = array.array('Q')  # Own slot -> start in arena
+        self.digests = bytearray()  # Own slot -> SHA-1 of its content (20 bytes each)
+        self.table = array.array('I', bytes(4 * 64))  # Hash table over digests: own slot + 1, 0 = free
+        self.frozen = False
+
+        # Columns cover every slot, base slots included, so they're copied, not shared
+        def column(typecode, name):
+            return array.array(typecode, getattr(base, name) if base is not None else ())
+
+        self.size = column('I', "size")
+        self.exec_time = column('f', "exec_time")  # Seconds; 0 = never measured
+        self.hits = column('I', "hits")
+        self.finds = column('I', "finds")
+        self.found_new = column('B', "found_new")
+        self.order = column('I', "order")
+        self.total = base.total if base is not None else 0  # Bytes stored, dead slots included
+
+        self.extend(entries)
+
+    @property
+    def slots(self) -> int:
+        return self.first + len(self.offsets)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [json.loads(self._content(slot)) for slot in self.order[index]]
+        return json.loads(self._content(self.order[index]))
+
+    def __iter__(self):
+        for slot in self.order:
+            yield json.loads(self._content(slot))
+
+    def slot(self, index: int) -> int:
+        """Slot (row in the metadata columns) of the entry at corpus position index."""
+        return self.order[index]
+
+    def content(self, index: int) -> str:
+        """Serialized entry at corpus position index (what gets executed)."""
+        return self._content(self.order[index]).decode("utf-8")
+
+    def digest(self, index: int) -> bytes:
+        """SHA-1 of the serialized entry at corpus position index."""
+
+        store, own = self._owner(self.order[index])
+        return bytes(store.digests[own * 20:own * 20 + 20])
+
+    def add(self, entry, content: Optional[str] = None, exec_time: float = 0.0, found_new: bool = False) -> bool:
+        """Append an entry (content defaults to json.dumps(entry)). Returns False for a duplicate."""
+
+        slot, added = self._put((json.dumps(entry) if content is None else content).encode("utf-8"),
+                                exec_time, found_new)
+        if added:
+            self.order.append(slot)
+        return added
+
+    def extend(self, entries, found_new: bool = False) -> int:
+        """Append several entries. Returns how many weren't duplicates."""
+        return sum(self.add(entry, found_new=found_new) for entry in entries)
+
+    def find(self, content: str) -> Optional[int]:
+        """Corpus position of an entry by its serialized content, or None."""
+
+        slot = self._lookup(hashlib.sha1(content.encode("utf-8")).digest())
+        try:
+            return None if slot is None else self.order.index(slot)
+        except ValueError:
+            return None  # Stored, but distilled away
+
+    def replace(self, index: int, entry) -> bool:
+        """
+        Swap the entry at corpus position index for another one (e.g. a minimized crasher).
+        Returns False (and keeps the old entry) if the new one is already in the corpus:
+        positions never shift, so schedulers indexing the corpus stay valid.
+        """
+
+        old = self.order[index]
+        slot, added = self._put(json.dumps(entry).encode("utf-8"), self.exec_time[old], self.found_new[old])
+        if slot == old or (not added and slot in self.order):
+            return False
+        if added:
+            self.hits[slot], self.finds[slot] = self.hits[old], self.finds[old]
+        self.order[index] = slot
+        return True
+
+    def picked(self, index: int, finds: int):
+        """The entry at corpus position index was fuzzed as a parent; finds = children kept."""
+
+        slot = self.order[index]
+        self.hits[slot] += 1
+        self.finds[slot] += finds
+
+    def retain(self, positions: List[int]):
+        """Keep only the entries at these corpus positions (in this order)."""
+
+        self.order = array.array('I', (self.order[i] for i in positions))
+        if self.total > 2 * sum(self.size[slot] for slot in self.order) + self.COMPACT_SLACK:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the live entries into a fresh buffer, dropping dead slots and the base."""
+
+        fresh = CorpusStore()
+        for slot in self.order:
+            new, _ = fresh._put(bytes(self._content(slot)), self.exec_time[slot], self.found_new[slot])
+            fresh.hits[new], fresh.finds[new] = self.hits[slot], self.finds[slot]
+            fresh.order.append(new)
+        vars(self).update(vars(fresh))
+
+    def share(self) -> "CorpusStore":
+        """Freeze this store (no more adds) so other stores can use it as their base."""
+
+        self.arena = bytes(self.arena)
+        self.frozen = True
+        return self
+
+    def export(self) -> List[dict]:
+        """Per-entry metadata in corpus order, for checkpoints (see CampaignStore)."""
+
+        return [{"time": self.exec_time[slot] or None, "size": self.size[slot], "hits": self.hits[slot],
+                 "finds": self.finds[slot], "new": bool(self.found_new[slot])} for slot in self.order]
+
+    def restore(self, index: int, meta: Optional[dict]):
+        """Inverse of export() for one entry."""
+
+        if meta:
+            slot = self.order[index]
+            self.exec_time[slot] = meta.get("time") or 0.0
+            self.hits[slot] = meta.get("hits", meta.get("picks", 0))
+            self.finds[slot] = meta.get("finds", 0)
+            self.found_new[slot] = meta.get("new", False)
+
+    def found_count(self) -> int:
+        """Live entries this campaign found itself."""
+        return sum(self.found_new[slot] for slot in self.order)
+
+    def _owner(self, slot: int) -> Tuple["CorpusStore", int]:
+        store = self
+        while slot < store.first:
+            store = store.base
+        return store, slot - store.first
+
+    def _content(self, slot: int) -> bytes:
+        store, own = self._owner(slot)
+        start = store.offsets[own]
+        return store.arena[start:start + self.size[slot]]
+
+    def _lookup(self, digest: bytes) -> Optional[int]:
+        """Slot whose content has this SHA-1 (own table first, then the base's), or None."""
+
+        store = self
+        while store is not None:
+            mask = len(store.table) - 1
+            i = int.from_bytes(digest[:8], "little") & mask
+            while store.table[i]:
+                own = store.table[i] - 1
+                if store.digests[own * 20:own * 20 + 20] == digest:
+                    return store.first + own
+                i = (i + 1) & mask  # Linear probing
+            store = store.base
+        return None
+
+    def _index(self, own: int):
+        mask = len(self.table) - 1
+        i = int.from_bytes(self.digests[own * 20:own * 20 + 8], "little") & mask
+        while self.table[i]:
+            i = (i + 1) & mask
+        self.table[i] = own + 1
+
+    def _put(self, data: bytes, exec_time: float, found_new: bool) -> Tuple[int, bool]:
+        """Store serialized content unless it's known. Returns (slot, whether it was added)."""
+
+        digest = hashlib.sha1(data).digest()
+        slot = self._lookup(digest)
+        if slot is not None:
+            return slot, False
+        if self.frozen:
+            raise ValueError("CorpusStore is read-only after share()")
+
+        slot = self.slots
+        self.offsets.append(len(self.arena))
+        self.arena += data
+        self.digests += digest
+        if 2 * len(self.offsets) > len(self.table):
+            # Keep the load factor at or below 1/2: double and re-insert
+            self.table = array.array('I', bytes(8 * len(self.table)))
+            for own in range(len(self.offsets)):
+                self._index(own)
+        else:
+            self._index(len(self.offsets) - 1)
+        self.size.append(len(data))
+        self.exec_time.append(exec_time)
+        self.hits.append(0)
+        self.finds.append(0)
+        self.found_new.append(found_new)
+        self.total += len(data)
+        return slot, True
+
+
+class CorpusDistiller:
+    """
+    afl-cmin for JSON corpora: keep the smallest entry for every coverage feature.
+
+    Features are (edge, hit-count bucket) pairs when an edge trace is available,
+    otherwise the normalized output line, plus the crash signature for crashers.
+    Features are cached by content hash, so only never-seen entries are executed.
+    """
+
+    def __init__(self, run: Callable[[str], Tuple[bool, str, Optional[list]]]):
+        self.run = run
+        self.index = CrashIndex()  # Only used for signature()
+        self.cache = {}  # content hash -> frozenset of features
+
+    def remember(self, content: str, crashed: bool, output: str, trace: Optional[list]) -> frozenset:
+        """Cache (and return) the features of an execution that already happened."""
+
+        features = set()
+        if trace is not None:
+            features.update((edge, COUNT_CLASS[hits] if hits < 256 else 128) for edge, hits in trace)
+        else:
+            features.add(("output", output.strip().splitlines()[-1] if output.strip() else ""))
+        if crashed:
+            features.add(("crash", self.index.signature(output)[0]))
+
+        features = self.cache[hashlib.sha1(content.encode("utf-8")).digest()] = frozenset(features)
+        return features
+
+    def cached(self, content: str) -> Optional[frozenset]:
+        """Features of an input if known, without executing it."""
+        return self.cache.get(hashlib.sha1(content.encode("utf-8")).digest())
+
+    def learn(self, content: str, features: frozenset):
+        """Cache features computed elsewhere (another worker, a previous run)."""
+        self.cache[hashlib.sha1(content.encode("utf-8")).digest()] = features
+
+    def features(self, content: str) -> frozenset:
+        """Features of one serialized input, executing it only on a cache miss."""
+
+        key = hashlib.sha1(content.encode("utf-8")).digest()
+        if key not in self.cache:
+            self.remember(content, *self.run(content))
+        return self.cache[key]
+
+    def distill(self, contents: List[str]) -> List[int]:
+        """Indices of the minimal subset of serialized entries covering the same features (in order)."""
+
+        sized = [(len(content), content, self.features(content)) for content in contents]
+
+        # Smallest entry wins each feature; ties go to the earlier entry
+        best = {}
+        for i, (size, _, features) in enumerate(sized):
+            for feature in features:
+                j = best.get(feature)
+                if j is None or size < sized[j][0]:
+                    best[feature] = i
+
+        keep = sorted(set(best.values()))
+
+        # Drop cached features of evicted entries so the cache doesn't grow forever
+        kept_keys = {hashlib.sha1(sized[i][1].encode("utf-8")).digest() for i in keep}
+        self.cache = {k: v for k, v in self.cache.items() if k in kept_keys}
+
+        return keep
+
+
+def cmin_directory(in_dir: str, out_dir: str):
+    """Standalone corpus distillation: copy the minimal covering subset of in_dir/*.json to out_dir."""
+
+    target = start_target(make_target())
+
+    def run(content):
+        crashed, output = target.run(content)
+        return crashed, output, target.last_trace
+
+    names, entries = [], []
+    for name in sorted(os.listdir(in_dir)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(in_dir, name), 'r') as f:
+                entries.append(json.load(f))
+            names.append(name)
+        except (OSError, ValueError):
+            pass
+
+    kept = CorpusDistiller(run).distill([json.dumps(entry) for entry in entries])
+
+    os.makedirs(out_dir, exist_ok=True)
+    for i in kept:
+        with open(os.path.join(out_dir, names[i]), 'w') as f:
+            json.dump(entries[i], f)
+
+    target.stop()
+
+    print(f"✓ Distilled {len(entries)} inputs from {in_dir} down to {len(kept)} in {out_dir}")
+
+
+# ============================================================================
+# PART 10: POWER SCHEDULING
+# ============================================================================
+
+class SumTree:
+    """Fenwick tree of weights: O(log n) append, update and weighted sampling."""
+
+    def __init__(self):
+        self.tree = [0.0]  # 1-based
+        self.weights = []
+
+    def __len__(self):
+        return len(self.weights)
+
+    def append(self, weight: float):
+        self.weights.append(weight)
+        i = len(self.weights)
+        node = weight
+        # tree[i] covers (i - lowbit(i), i]: add the child ranges already in the tree
+        j = i - 1
+        while j > i - (i & -i):
+            node += self.tree[j]
+            j -= j & -j
+        self.tree.append(node)
+
+    def update(self, index: int, weight: float):
+        delta = weight - self.weights[index]
+        self.weights[index] = weight
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def total(self) -> float:
+        total, i = 0.0, len(self.weights)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, value: float) -> int:
+        """Index of the entry whose cumulative weight range contains value."""
+
+        pos = 0
+        step = 1 << (len(self.weights).bit_length() - 1) if self.weights else 0
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= value:
+                pos = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return min(pos, len(self.weights) - 1)
+
+
+class UniformScheduler:
+    """Original behaviour: every corpus entry is equally likely to be the next parent."""
+
+    def choose(self, corpus: CorpusStore) -> int:
+        return random.randrange(len(corpus))
+
+    def report(self, corpus: CorpusStore, index: int):
+        pass
+
+    def rebuild(self, corpus: CorpusStore):
+        pass
+
+
+class PowerScheduler:
+    """
+    Energy-based parent selection (AFLFast / Entropic flavoured).
+
+    Energy favours entries that are fast and small, boosts parents whose
+    children found new coverage or crashes, and decays with the number of
+    times an entry has already been picked. The inputs are the CorpusStore
+    metadata columns; weights live in a SumTree so picking a parent stays
+    O(log n) for very large corpora.
+    """
+
+    def __init__(self):
+        self.tree = SumTree()  # One weight per corpus position
+        self.time_sum = self.time_n = 0.0
+        self.size_sum = self.size_n = 0
+
+    def energy(self, corpus: CorpusStore, slot: int) -> float:
+        score = 1.0
+        exec_time, size = corpus.exec_time[slot], corpus.size[slot]
+        if exec_time and self.time_n:
+            score *= min(4.0, max(0.25, (self.time_sum / self.time_n) / exec_time))
+        if size and self.size_n:
+            score *= min(4.0, max(0.25, (self.size_sum / self.size_n) / size))
+        score *= min(16.0, 1.0 + 2.0 * corpus.finds[slot])
+        return score / math.sqrt(1.0 + corpus.hits[slot])
+
+    def choose(self, corpus: CorpusStore) -> int:
+        self._catch_up(corpus)
+        return self.tree.find(random.random() * self.tree.total())
+
+    def report(self, corpus: CorpusStore, index: int):
+        """Re-weigh a parent after it was fuzzed (see CorpusStore.picked)."""
+
+        if index < len(self.tree):
+            self.tree.update(index, self.energy(corpus, corpus.slot(index)))
+
+    def rebuild(self, corpus: CorpusStore):
+        """Re-index after the corpus order was rewritten (e.g. by distillation)."""
+
+        slots = [corpus.slot(i) for i in range(len(corpus))]
+        timed = [corpus.exec_time[slot] for slot in slots if corpus.exec_time[slot]]
+        self.time_sum, self.time_n = sum(timed), len(timed)
+        self.size_sum, self.size_n = sum(corpus.size[slot] for slot in slots), len(slots)
+
+        self.tree = SumTree()
+        for slot in slots:
+            self.tree.append(self.energy(corpus, slot))
+
+    def _catch_up(self, corpus: CorpusStore):
+        # Entries appended since the last pick: finds, seeds, entries synced from other workers
+        for index in range(len(self.tree), len(corpus)):
+            slot = corpus.slot(index)
+            if corpus.exec_time[slot]:
+                self.time_sum += corpus.exec_time[slot]
+                self.time_n += 1
+            self.size_sum += corpus.size[slot]
+            self.size_n += 1
+            self.tree.append(self.energy(corpus, slot))
+
+
+def make_scheduler():
+    """Create the parent scheduler selected by SCHEDULER."""
+    return PowerScheduler() if SCHEDULER == "power" else UniformScheduler()
+
+
+# ============================================================================
+# PART 11: CAMPAIGN STATE
+# ============================================================================
+
+class CampaignStore:
+    """
+    Durable state of one campaign in its own directory, so a killed run can be resumed.
+
+    Files (all JSON):
+    - entries.<gen>.jsonl   append-only queue: one serialized corpus entry + its coverage features per line
+    - crashes.jsonl         append-only crash bucket snapshots (newest per signature wins)
+    - hangs.jsonl           the same for hang buckets
+    - checkpoint.json       replaced atomically every CHECKPOINT_INTERVAL tests: tests run,
+                            live queue entries (byte offset and length of their lines), their
+                            CorpusStore metadata, bug types and the coverage bitmap
+
+    Loading is the checkpoint's index: only the live queue lines are read (by
+    position) and parsed, plus whatever was logged after the checkpoint - dead
+    lines are skipped and nothing is re-executed.  A torn last line (killed
+    mid-write) is ignored.  When most queue lines are dead (distilled away) a
+    checkpoint copies the live ones into the next entries generation and only
+    then switches the checkpoint to it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.generation = 0
+        self.index = {}  # content hash -> (byte offset, length) of its line in the current entries file
+        self.entries_file = None
+        self.crashes_file = None
+        self.hangs_file = None
+        # Filled by load()
+        self.tests = 0
+        self.contents = []  # Serialized corpus entries
+        self.features = []  # Aligned with contents: frozenset or None (unknown)
+        self.meta = []  # Aligned with contents: CorpusStore.export() metadata or None
+        self.crashes = []
+        self.hangs = []
+        self.bugs = set()
+        self.bits = None
+
+    @staticmethod
+    def key(content: str) -> str:
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def entries_path(self, generation: int) -> str:
+        return os.path.join(self.path, f"entries.{generation}.jsonl")
+
+    # -- loading ---------------------------------------------------------------
+
+    def load(self) -> bool:
+        """Read the campaign back from disk. Returns False if there is nothing to resume."""
+
+        checkpoint = {}
+        try:
+            with open(os.path.join(self.path, "checkpoint.json"), 'r') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        self.generation = checkpoint.get("generation", 0)
+        path = self.entries_path(self.generation)
+        live = checkpoint.get("corpus", [])
+        sizes = checkpoint.get("sizes")
+        meta = checkpoint.get("meta", [None] * len(live))
+        written = checkpoint.get("entries_size", 0)
+        if sizes is None:
+            live, written = [], 0  # Checkpoint without line lengths: replay the whole log
+
+        # Live entries at the checkpoint, read by position, then everything logged after it
+        records = []
+        try:
+            with open(path, 'rb') as f:
+                for offset, size, m in zip(live, sizes or (), meta):
+                    f.seek(offset)
+                    try:
+                        records.append((offset, size, json.loads(f.read(size)), m))
+                    except ValueError:
+                        pass
+        except OSError:
+            pass
+        records += [(offset, size, record, None) for offset, size, record in self._read_log(path, written)]
+        if not records and not checkpoint:
+            return False
+
+        self.index, self.contents, self.features, self.meta = {}, [], [], []
+        for offset, size, record, m in records:
+            content = record["content"] if "content" in record else json.dumps(record["input"])
+            self.index[self.key(content)] = (offset, size)
+            self.contents.append(content)
+            self.features.append(None if record.get("features") is None
+                                 else frozenset(tuple(f) for f in record["features"]))
+            self.meta.append(m)
+
+        self.crashes = self._latest_buckets(os.path.join(self.path, "crashes.jsonl"), checkpoint.get("crash_hits", {}))
+        self.hangs = self._latest_buckets(os.path.join(self.path, "hangs.jsonl"), checkpoint.get("hang_hits", {}))
+        self.tests = checkpoint.get("tests", 0)
+        self.bugs = set(checkpoint.get("bugs", []))
+        bits = checkpoint.get("bits")
+        self.bits = zlib.decompress(base64.b64decode(bits)) if bits else None
+        return True
+
+    @staticmethod
+    def _read_log(path: str, start: int = 0) -> List[tuple]:
+        """(byte offset, length, record) for every complete line of a JSON-lines log from byte start on."""
+
+        records = []
+        try:
+            with open(path, 'rb') as f:
+                f.seek(start)
+                data = f.read()
+        except OSError:
+            return records
+
+        offset = start
+        for line in data.split(b"\n"):
+            if line:
+                try:
+                    records.append((offset, len(line) + 1, json.loads(line)))
+                except ValueError:
+                    break  # Torn write at the tail
+            offset += len(line) + 1
+        return records
+
+    def _latest_buckets(self, path: str, hits: dict) -> List[dict]:
+        buckets = {}
+        for _, _, bucket in self._read_log(path):
+            known = buckets.get(bucket["signature"])
+            if known is None or bucket["size"] <= known["size"]:
+                buckets[bucket["signature"]] = bucket
+        for sig, bucket in buckets.items():
+            bucket["hits"] = max(bucket["hits"], hits.get(sig, 0))
+        return list(buckets.values())
+
+    # -- writing ---------------------------------------------------------------
+
+    def reset(self):
+        """Start a new campaign in this directory (drops any previous state)."""
+
+        self.close()
+        if os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.startswith(("entries.", "crashes.", "hangs.", "checkpoint.")):
+                    os.remove(os.path.join(self.path, name))
+        self.generation = 0
+        self.index = {}
+        self.tests = 0
+
+    def open(self):
+        os.makedirs(self.path, exist_ok=True)
+        self.entries_file = self._open_log(self.entries_path(self.generation))
+        self.crashes_file = self._open_log(os.path.join(self.path, "crashes.jsonl"))
+        self.hangs_file = self._open_log(os.path.join(self.path, "hangs.jsonl"))
+
+    @staticmethod
+    def _open_log(path: str):
+        """Open a log for appending, first cutting off a torn last line."""
+
+        f = open(path, 'ab+')
+        f.seek(0)
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+        f.seek(0, os.SEEK_END)
+        return f
+
+    @staticmethod
+    def _append(f, record: dict) -> Tuple[int, int]:
+        """Append one line; returns its (byte offset, length)."""
+
+        offset = f.tell()
+        line = json.dumps(record).encode("utf-8") + b"\n"
+        f.write(line)
+        f.flush()
+        return offset, len(line)
+
+    def add_entry(self, content: str, features: Optional[frozenset]) -> bool:
+        """Log a new (serialized) corpus entry. Returns False if it is already stored."""
+
+        key = self.key(content)
+        if key in self.index:
+            return False
+        self.index[key] = self._append(self.entries_file, {
+            "content": content,
+            "features": None if features is None else [list(f) for f in features]
+        })
+        return True
+
+    def add_crash(self, bucket: dict):
+        self._append(self.crashes_file, bucket)
+
+    def add_hang(self, bucket: dict):
+        self._append(self.hangs_file, bucket)
+
+    def checkpoint(self, tests: int, corpus: CorpusStore, crash_index: CrashIndex, hang_index: HangIndex,
+                   coverage: CoverageTracker):
+        """Atomically record the campaign as of now (the logs hold the entries themselves)."""
+
+        # Entries that joined without add_entry() (e.g. seeds) are logged now
+        keys = []
+        for i in range(len(corpus)):
+            key = corpus.digest(i).hex()
+            if key not in self.index:
+                self.add_entry(corpus.content(i), None)
+            keys.append(key)
+
+        if len(self.index) > 2 * len(keys) + 64:
+            self._compact(keys)
+        live = [self.index[key] for key in keys]
+
+        state = {
+            "generation": self.generation,
+            "entries_size": self.entries_file.tell(),
+            "tests": tests,
+            "corpus": [offset for offset, _ in live],
+            "sizes": [size for _, size in live],
+            "meta": corpus.export(),
+            "crash_hits": {sig: bucket["hits"] for sig, bucket in crash_index.buckets.items()},
+            "hang_hits": {sig: bucket["hits"] for sig, bucket in hang_index.buckets.items()},
+            "bugs": sorted(coverage.covered_bugs),
+            "bits": base64.b64encode(zlib.compress(bytes(coverage.virgin_bits))).decode("ascii")
+        }
+
+        tmp_path = os.path.join(self.path, "checkpoint.json.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(self.path, "checkpoint.json"))
+
+        if self.generation and os.path.exists(self.entries_path(self.generation - 1)):
+            os.remove(self.entries_path(self.generation - 1))
+
+    def _compact(self, keys: List[str]):
+        """Copy the live entries' lines (by content hash) into the next entries generation."""
+
+        self.entries_file.close()
+        with open(self.entries_path(self.generation), 'rb') as old:
+            self.generation += 1
+            self.entries_file = open(self.entries_path(self.generation), 'wb')
+            index = {}
+            for key in keys:
+                if key not in index:
+                    offset, size = self.index[key]
+                    old.seek(offset)
+                    index[key] = (self.entries_file.tell(), size)
+                    self.entries_file.write(old.read(size))
+            self.entries_file.flush()
+        self.index = index
+
+    def close(self):
+        for name in ("entries_file", "crashes_file", "hangs_file"):
+            f = getattr(self, name)
+            if f is not None:
+                f.close()
+                setattr(self, name, None)
+
+
+# ============================================================================
+# PART 12: CAMPAIGN STATS
+# ============================================================================
+
+STATS_PHASES = ("startup", "mutate", "serialize", "exec", "analyze", "other")
+PLOT_FIELDS = ("unix_time", "execs_done", "execs_per_sec", "corpus_count", "unique_crashes",
+               "unique_hangs", "edges_found", "bug_types")
+
+
+class FuzzerStats:
+    """
+    Live telemetry of one campaign, laid out like an afl-fuzz output directory:
+
+    - fuzzer_stats   "key : value" lines, replaced atomically every STATS_INTERVAL seconds
+    - plot_data      one CSV row (PLOT_FIELDS) per update, appended for the whole campaign
+
+    The fuzz loop calls lap(phase) at each phase boundary - one perf_counter()
+    call and a dict update - so the time split costs well under 1% of an exec.
+    "startup" is the time spent starting target workers, restarts of a dead
+    or hung one included (moved out of "exec" with shift()).
+    Without a path (parallel workers) it only accumulates phase times, which
+    the hub collects with drain() and folds in with merge().
+    """
+
+    def __init__(self, path: Optional[str] = None, method: str = "", execs: int = 0,
+                 timeout: float = EXEC_TIMEOUT_MAX, stability: Optional[float] = None):
+        self.path = path
+        self.method = method
+        self.timeout = timeout
+        self.stability = stability
+        self.times = dict.fromkeys(STATS_PHASES, 0.0)
+        self.last = {"find": 0, "crash": 0, "hang": 0}  # unix time of the latest of each
+        self.start_time = time.time()
+        self.mark = self.started = time.perf_counter()
+        self.next_update = self.started + STATS_INTERVAL
+        self.execs_start = execs  # A resumed campaign's rate only counts this session
+        self.previous = (self.started, execs)  # (perf_counter, execs) at the last update
+        self.plot_file = None
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            # A resumed campaign continues its plot; a new one starts it over
+            self.plot_file = open(os.path.join(path, "plot_data"), 'a' if execs else 'w')
+            if self.plot_file.tell() == 0:
+                self.plot_file.write("# " + ", ".join(PLOT_FIELDS) + "\n")
+
+    def lap(self, phase: str) -> float:
+        """Charge the time since the previous lap to phase. Returns that time."""
+
+        now = time.perf_counter()
+        elapsed = now - self.mark
+        self.times[phase] += elapsed
+        self.mark = now
+        return elapsed
+
+    def shift(self, source: str, phase: str, elapsed: float):
+        """Re-charge elapsed seconds already charged to source to phase."""
+
+        self.times[source] -= elapsed
+        self.times[phase] += elapsed
+
+    def found(self, kind: str):
+        """Note a new corpus entry ("find"), crash bucket or hang bucket."""
+        self.last[kind] = int(time.time())
+
+    def drain(self) -> dict:
+        """Return and reset the phase times (worker -> hub)."""
+
+        times = self.times
+        self.times = dict.fromkeys(STATS_PHASES, 0.0)
+        return times
+
+    def merge(self, times: dict):
+        for phase, elapsed in times.items():
+            self.times[phase] += elapsed
+
+    def tick(self, tests_run: int, corpus: CorpusStore, crash_index: CrashIndex,
+             hang_index: HangIndex, coverage: CoverageTracker):
+        """Update the files if STATS_INTERVAL has passed since the last update."""
+
+        if self.path is not None and time.perf_counter() >= self.next_update:
+            self.update(tests_run, corpus, crash_index, hang_index, coverage)
+
+    def update(self, tests_run: int, corpus: CorpusStore, crash_index: CrashIndex,
+               hang_index: HangIndex, coverage: CoverageTracker) -> dict:
+        """Write fuzzer_stats and a plot_data row now. Returns the stats."""
+
+        now = time.perf_counter()
+        run_time = now - self.started
+        previous_time, previous_execs = self.previous
+        total = sum(self.times.values()) or 1.0
+
+        stats = {
+            "start_time": int(self.start_time),
+            "last_update": int(time.time()),
+            "run_time": round(run_time, 2),
+            "fuzzer_pid": os.getpid(),
+            "method": self.method,
+            "workers": NUM_WORKERS,
+            "execs_done": tests_run,
+            "execs_per_sec": round((tests_run - self.execs_start) / run_time, 2) if run_time > 0 else 0.0,
+            "execs_per_sec_recent": (round((tests_run - previous_execs) / (now - previous_time), 2)
+                                     if now > previous_time else 0.0),
+            "corpus_count": len(corpus),
+            "corpus_found": corpus.found_count(),
+            "saved_crashes": crash_index.total_hits,
+            "unique_crashes": len(crash_index),
+            "saved_hangs": hang_index.total_hits,
+            "unique_hangs": len(hang_index),
+            "bug_types": coverage.get_coverage(),
+            "edges_found": coverage.get_edge_count(),
+            "bitmap_cvg": f"{coverage.get_edge_count() / MAP_SIZE * 100:.2f}%",
+            "stability": "n/a" if self.stability is None else f"{self.stability * 100:.2f}%",
+            "exec_timeout": f"{self.timeout * 1000:.0f}",
+            "last_find": self.last["find"],
+            "last_crash": self.last["crash"],
+            "last_hang": self.last["hang"]
+        }
+        for phase in STATS_PHASES:
+            stats[f"time_{phase}"] = f"{self.times[phase] / total * 100:.1f}%"
+
+        self.previous = (now, tests_run)
+        self.next_update = now + STATS_INTERVAL
+
+        if self.path is not None:
+            tmp_path = os.path.join(self.path, "fuzzer_stats.tmp")
+            with open(tmp_path, 'w') as f:
+                for key, value in stats.items():
+                    f.write(f"{key:<22}: {value}\n")
+            os.replace(tmp_path, os.path.join(self.path, "fuzzer_stats"))
+
+            row = [stats["last_update"], tests_run, stats["execs_per_sec_recent"], len(corpus),
+                   len(crash_index), len(hang_index), stats["edges_found"], stats["bug_types"]]
+            self.plot_file.write(", ".join(map(str, row)) + "\n")
+            self.plot_file.flush()
+
+        return stats
+
+    def close(self):
+        if self.plot_file is not None:
+            self.plot_file.close()
+            self.plot_file = None
+
+
+# ============================================================================
+# PART 13: COMPARATIVE FUZZER
+# ============================================================================
+
+class ComparativeFuzzer:
+    """Runs three separate fuzzing campaigns to compare effectiveness."""
+
+    def __init__(self, seed_files: List[str], target: Optional[Target] = None):
+        """Initialize with seed files and the target to fuzz (default: make_target())."""
+
+        self.corpus = CorpusStore()
+        self.crashes = []
+        self.coverage_tracker = CoverageTracker()
+
+        for seed_file in seed_files:
+            with open(seed_file, 'r') as f:
+                try:
+                    data = json.load(f)
+                    self.corpus.add(data)
                 except:
-                    continue
+                    pass
+        # Every campaign reads the seeds from this one store (see run_campaign)
+        self.corpus.share()
 
-                crashed, output = test_input(test_file)
-                tests_run += 1
+        print(f"✓ Fuzzer initialized with {len(self.corpus)} seed files")
+        self.use_real_llm = setup_ollama()
 
-                local_coverage.analyze_output(output)
+        # Only crashing and corpus-worthy inputs are written to disk
+        os.makedirs(os.path.join("test_files", "crashes"), exist_ok=True)
+        os.makedirs(os.path.join("test_files", "queue"), exist_ok=True)
+        os.makedirs(os.path.join("test_files", "hangs"), exist_ok=True)
+        self.timeout = EXEC_TIMEOUT_MAX
+        self.stability = None  # Measured by calibrate_timeout() when edge traces are available
 
-                if crashed:
-                    local_crashes.append({
-                        "test_number": tests_run,
-                        "input": mutated,
-                        "output": output
-                    })
+        self.target = start_target(target or make_target(self.timeout))
+        if VERBOSE_MODE:
+            print(f"🎯 Target: {self.target.describe()}\n")
+
+        self.calibrate_timeout()
+        if AUTO_DICTIONARY:
+            self.build_dictionary()
+
+        self.minimizer = None  # Started per campaign when MINIMIZE_CRASHES is on
+        self.store = None  # CampaignStore of the running campaign (parent process only)
+        self.stats = None  # FuzzerStats of the running campaign
+        self.distiller = CorpusDistiller(self.execute)
+        self.batch_size = MUTATION_BATCH_SIZE
+        self.ga_population = None  # Set by compare_all_methods; each parallel worker is an island
+
+    def calibrate_timeout(self):
+        """
+        Set the exec timeout to TIMEOUT_P99_FACTOR x the p99 exec time of the
+        seed corpus (within EXEC_TIMEOUT_MIN..EXEC_TIMEOUT_MAX), like afl-fuzz's
+        calibration stage.  The same runs measure stability: the share of
+        (edge, hit-count bucket) pairs every run of a seed agrees on.
+        """
+
+        samples = []
+        stable = varying = 0
+        for seed in self.corpus:
+            content = json.dumps(seed)
+            runs = []
+            for _ in range(CALIBRATION_RUNS):
+                exec_start = time.perf_counter()
+                _, _, trace = self.run_once(content, EXEC_TIMEOUT_MAX)
+                samples.append(time.perf_counter() - exec_start)
+                if trace is not None:
+                    runs.append({(edge, COUNT_CLASS[min(hits, 255)]) for edge, hits in trace})
+            if runs:
+                common = set.intersection(*runs)
+                stable += len(common)
+                varying += len(set.union(*runs)) - len(common)
+        if stable + varying:
+            self.stability = stable / (stable + varying)
+        if not samples:
+            return
+
+        samples.sort()
+        p99 = samples[min(len(samples) - 1, math.ceil(len(samples) * 0.99) - 1)]
+        self.timeout = min(max(p99 * TIMEOUT_P99_FACTOR, EXEC_TIMEOUT_MIN), EXEC_TIMEOUT_MAX)
+        self.target.timeout = self.timeout
 
-                    if VERBOSE_MODE:
-                        print(f"  🐛 Bug #{len(local_crashes)} found at test #{tests_run}")
+        if VERBOSE_MODE:
+            print(f"⏱️  Exec timeout: {self.timeout * 1000:.0f} ms (seed p99 {p99 * 1000:.2f} ms x {TIMEOUT_P99_FACTOR})")
+            if self.stability is not None:
+                print(f"🎯 Stability: {self.stability * 100:.2f}%")
+            print()
+
+    def build_dictionary(self):
+        """
+        Fill the mutators' dictionary from the target: the constants its source
+        compares with and the keys it looks up (bytecode constants if it only
+        has a .pyc), then what it compares each seed with at run time (CMPLOG).
+        """
+
+        global dictionary
+        dictionary = Dictionary()
+        source_file = self.target.source_file()
+        if source_file is not None:
+            try:
+                with open(source_file, "rb") as f:
+                    source = f.read()
+                if source_file.endswith(".pyc"):
+                    dictionary.learn_code(marshal.loads(source[16:]))  # After the 16-byte .pyc header
+                else:
+                    dictionary.learn_source(source.decode("utf-8"))
+            except (OSError, SyntaxError, ValueError, EOFError, TypeError):
+                pass
+        if CMPLOG:
+            for seed in self.corpus:
+                self.learn_compares(json.dumps(seed), seed)
 
-                    local_corpus.append(mutated)
+        if VERBOSE_MODE:
+            print(f"📖 Dictionary: {dictionary.summary()}\n")
+
+    def learn_compares(self, content: str, data):
+        """Add what one run of content compares with to the dictionary (if the target can log comparisons)."""
+
+        compares = self.target.compare_log(content)
+        if compares:
+            dictionary.learn_compares(compares, data)
+
+    def run_once(self, content: str, timeout: Optional[float] = None) -> Tuple[bool, str, Optional[list]]:
+        crashed, output = self.target.run(content, timeout)
+        return crashed, output, self.target.last_trace
+
+    def execute(self, content: str) -> Tuple[bool, str, Optional[list]]:
+        """
+        Run one input through the persistent worker, or a fresh subprocess as fallback.
+        Returns (crashed, output, edge trace) - the trace is None if the target can't be traced.
+
+        An input that times out is re-run with HANG_CONFIRM_FACTOR x the timeout:
+        if it finishes it was just slow and that result counts; if not, the
+        output is a confirmed hang (see is_hang).
+        """
+
+        crashed, output, trace = self.run_once(content)
+        if is_hang(output):
+            crashed, output, trace = self.run_once(content, self.timeout * HANG_CONFIRM_FACTOR)
+        return crashed, output, trace
+
+    def save_input(self, kind: str, name: str, content: str):
+        """Write an interesting input to test_files/<kind>/ (crashes, queue)."""
+
+        try:
+            with open(os.path.join("test_files", kind, f"{name}.json"), 'w') as f:
+                f.write(content)
+        except OSError:
+            pass
+
+    def apply_minimized(self, method_name: str, crash_index: CrashIndex, local_corpus: CorpusStore,
+                        scheduler=None):
+        """Swap finished minimizer results into the crash buckets, crash files and corpus (re-weighing them in scheduler)."""
+
+        if self.minimizer is None:
+            return
+
+        for sig, original, minimized, content, output in self.minimizer.drain():
+            if not crash_index.update_reproducer(sig, minimized, content, output):
+                continue
+            self.save_input("crashes", f"{method_name}_{sig}", content)
+            if self.store is not None:
+                self.store.add_crash(crash_index.buckets[sig])
+            index = local_corpus.find(json.dumps(original))
+            if index is not None and local_corpus.replace(index, minimized) and scheduler is not None:
+                scheduler.report(local_corpus, index)
+
+    def close(self):
+        """Shut down the target (persistent worker, delivery buffer, ...)."""
+
+        self.target.stop()
+
+        if llm_backend is not None and llm_backend.pid == os.getpid():
+            if VERBOSE_MODE:
+                stats = llm_backend.stats
+                print(f"🧠 LLM backend: {stats['requests']} requests, {stats['failures']} failed, "
+                      f"{stats['hits']} cache hits, {stats['misses']} misses")
+            llm_backend.close()
 
-                elif self.should_add_to_corpus(mutated, output):
-                    local_corpus.append(mutated)
+    def should_add_to_corpus(self, mutant: dict, output: str) -> bool:
+        """Decide if this input is interesting enough to save."""
 
-            if VERBOSE_MODE and tests_run % 20 == 0:
-                print(f"  Progress: {tests_run}/{max_tests} tests, "
-                      f"{len(local_crashes)} crashes, "
-                      f"{local_coverage.get_coverage()}/5 bug types")
+        bugs_before = self.coverage_tracker.covered_bugs.copy()
+        self.coverage_tracker.analyze_output(output)
+        new_bugs = self.coverage_tracker.covered_bugs - bugs_before
+
+        return len(new_bugs) > 0
+
+    def add_find(self, local_corpus: CorpusStore, data: dict, exec_time: float,
+                 crashed: bool, output: str, trace: Optional[list]) -> bool:
+        """Queue an interesting input (corpus, distiller cache, campaign log). False if already queued."""
+
+        if not local_corpus.add(data, exec_time=exec_time, found_new=True):
+            return False
+        # The canonical serialization, so later distillation hits the feature cache
+        content = local_corpus.content(-1)
+        features = self.distiller.remember(content, crashed, output, trace)
+        if self.store is not None:
+            self.store.add_entry(content, features)
+        if AUTO_DICTIONARY and CMPLOG:
+            self.learn_compares(content, data)
+        return True
+
+    def restore_campaign(self, store: CampaignStore, crash_index: CrashIndex, hang_index: HangIndex,
+                         local_coverage: CoverageTracker) -> CorpusStore:
+        """Rebuild the in-memory campaign from a loaded store. Returns the corpus."""
+
+        crash_index.merge([dict(bucket, new_hits=bucket["hits"]) for bucket in store.crashes])
+        crash_index.pending = {}
+        hang_index.merge([dict(bucket, new_hits=bucket["hits"]) for bucket in store.hangs])
+        hang_index.pending = {}
+        local_coverage.merge(store.bugs, store.bits)
+        corpus = CorpusStore()
+        for content, features, meta in zip(store.contents, store.features, store.meta):
+            if corpus.add(None, content):
+                corpus.restore(len(corpus) - 1, meta)
+            if features is not None:
+                self.distiller.learn(content, features)
+        return corpus
+
+    def import_queue(self, path: str, local_corpus: CorpusStore, local_coverage: CoverageTracker):
+        """
+        Add the entries of another campaign's queue that add coverage to this one
+        (and its coverage).  Entries logged with their features are judged by
+        those without running them; only the others are executed, once.
+        """
+
+        other = CampaignStore(path)
+        if not other.load():
+            print(f"⚠️  Nothing to import from {path}")
+            return
+
+        covered = set()
+        for i in range(len(local_corpus)):
+            covered |= self.distiller.features(local_corpus.content(i))
+
+        imported = executed = 0
+        for content, features in zip(other.contents, other.features):
+            if local_corpus.find(content) is not None:
+                continue
+            if features is None:
+                features = self.distiller.features(content)
+                executed += 1
+            else:
+                self.distiller.learn(content, features)
+            if features <= covered or not self.store.add_entry(content, features):
+                continue
+            covered |= features
+            local_corpus.add(None, content)
+            imported += 1
+        local_coverage.merge(other.bugs, other.bits)
+        print(f"📥 Imported {imported} of {len(other.contents)} queue entries from {path} "
+              f"({executed} run for their coverage)")
+
+    def checkpoint(self, tests_run: int, local_corpus: CorpusStore, crash_index: CrashIndex,
+                   hang_index: HangIndex, local_coverage: CoverageTracker):
+        """Write an atomic checkpoint of the running campaign (no-op outside the parent)."""
+
+        if self.store is not None:
+            self.store.checkpoint(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+
+    def run_campaign(self, method_name: str, mutation_func, max_tests=100):
+        """Run a fuzzing campaign with ONE specific method."""
 
+        print(f"\n{'=' * 60}")
+        print(f"TESTING: {method_name} Fuzzing")
+        print(f"{'=' * 60}\n")
+
+        # Reads the shared seed store in place; only this campaign's finds are stored anew
+        local_corpus = CorpusStore(base=self.corpus)
+        crash_index = CrashIndex()
+        hang_index = HangIndex()
+        local_coverage = CoverageTracker()
+
+        self.store = CampaignStore(os.path.join(CAMPAIGN_DIR, method_name))
+        if RESUME_CAMPAIGNS and self.store.load():
+            local_corpus = self.restore_campaign(self.store, crash_index, hang_index, local_coverage)
+            print(f"♻️  Resumed at test {self.store.tests}: {len(local_corpus)} corpus entries, "
+                  f"{len(crash_index)} unique crashes, {len(hang_index)} hangs")
+        else:
+            self.store.reset()
+        self.store.open()
+        if IMPORT_QUEUE_FROM:
+            self.import_queue(IMPORT_QUEUE_FROM, local_corpus, local_coverage)
+        self.stats = FuzzerStats(self.store.path, method_name, self.store.tests, self.timeout, self.stability)
+
+        start_time = time.time()
+
+        # The minimizer thread could get stuck in a hang it can't time out
+        if MINIMIZE_CRASHES and self.target.thread_timeouts:
+            self.minimizer = CrashMinimizer(start_target(self.target.clone()))
+        self.stats.lap("startup")
+
+        if NUM_WORKERS > 1:
+            tests_run = self.run_parallel(method_name, mutation_func, max_tests,
+                                          local_corpus, crash_index, hang_index, local_coverage)
+        else:
+            tests_run = self.fuzz_loop(method_name, mutation_func, max_tests,
+                                       local_corpus, crash_index, hang_index, local_coverage)
+
+        # The clock and the rate stop with the last test, not after the minimizer's backlog
         elapsed_time = time.time() - start_time
+        summary = self.stats.update(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+
+        if self.minimizer is not None:
+            pending = self.minimizer.jobs.unfinished_tasks
+            finish_start = time.time()
+            self.minimizer.finish()
+            self.apply_minimized(method_name, crash_index, local_corpus)
+            self.minimizer = None
+            if pending:
+                print(f"🔬 Finished {pending} pending crash minimizations in {time.time() - finish_start:.2f}s")
+
+        self.store.close()
+        self.store = None
+        self.stats.close()
+        self.stats = None
 
         print(f"\n{'=' * 60}")
         print(f"RESULTS: {method_name}")
         print(f"{'=' * 60}")
         print(f"⏱️  Time taken: {elapsed_time:.2f} seconds")
         print(f"🧪 Tests run: {tests_run}")
-        print(f"🐛 Crashes found: {len(local_crashes)}")
+        print(f"🐛 Crashes found: {crash_index.total_hits} ({len(crash_index)} unique)")
+        print(f"⏳ Hangs found: {hang_index.total_hits} ({len(hang_index)} unique)")
         print(f"📊 Unique bug types: {local_coverage.get_coverage()}/5")
-        print(f"💯 Success rate: {len(local_crashes) / tests_run * 100:.1f}%")
+        print(f"🗺️  Code edges covered: {local_coverage.get_edge_count()}")
+        print(f"💯 Success rate: {crash_index.total_hits / tests_run * 100:.1f}%")
+        print(f"⚡ Execs/sec: {summary['execs_per_sec']:.1f} ("
+              + ", ".join(f"{phase} {summary['time_' + phase]}" for phase in STATS_PHASES) + ")")
+
+        stats = getattr(mutation_func, "stats", None)
+        operators = stats.summary() if stats is not None else {}
+        # Workers adapt their own copies of the schedule, so only a serial run has final probabilities
+        schedule = getattr(mutation_func, "schedule", None) if NUM_WORKERS == 1 else None
+        if schedule is not None:
+            for op, probability in schedule.probabilities().items():
+                operators.setdefault(op, {"uses": 0, "finds": 0, "yield": 0.0})["probability"] = probability
+        if operators:
+            print("🔧 Operator yield (finds/uses):")
+            for op, counts in operators.items():
+                line = f"     {op:<20} {counts['finds']:>4}/{counts['uses']:<5} {counts['yield'] * 100:5.1f}%"
+                if "probability" in counts:
+                    line += f"   p={counts['probability']:.2f}"
+                print(line)
 
         return {
             "method": method_name,
             "time": elapsed_time,
             "tests": tests_run,
-            "crashes": len(local_crashes),
+            "crashes": crash_index.total_hits,
+            "unique_crashes": len(crash_index),
+            "hangs": len(hang_index),
             "bug_types": local_coverage.get_coverage(),
-            "crash_details": local_crashes
+            "edges": local_coverage.get_edge_count(),
+            "execs_per_sec": summary["execs_per_sec"],
+            "timings": {phase: summary[f"time_{phase}"] for phase in STATS_PHASES},
+            "crash_details": crash_index.entries(),
+            "operators": operators
         }
 
+    def fuzz_loop(self, method_name: str, mutation_func, max_tests: int,
+                  local_corpus: CorpusStore, crash_index: CrashIndex, hang_index: HangIndex,
+                  local_coverage: CoverageTracker, on_sync=None, file_prefix: str = "") -> int:
+        """Mutate/execute/analyze until max_tests inputs have run. Returns tests run."""
+
+        # A resumed campaign picks up its test count and parent scheduling
+        tests_run = self.store.tests if self.store is not None else 0
+        last_sync = last_cmin = last_checkpoint = tests_run
+        scheduler = make_scheduler()
+        stats = self.stats
+
+        while tests_run < max_tests:
+            # Syncs, distillation, checkpoints and the like since the last batch
+            stats.lap("other")
+            self.apply_minimized(method_name, crash_index, local_corpus, scheduler)
+            parent_index = scheduler.choose(local_corpus)
+            parent = local_corpus[parent_index]
+            finds = 0
+
+            # Generate mutations (lazily - see the mutator protocol in PART 4)
+            batch = {} if self.batch_size is None else {"batch_size": self.batch_size}
+            if method_name == "GA":
+                mutations = mutation_func(local_corpus, crash_index.entries(), self.use_real_llm, **batch)
+            else:
+                mutations = mutation_func(parent, **batch)
+
+            credit = getattr(mutation_func, "credit", None)
+
+            # Test each mutation
+            for mutated in mutations:
+                stats.lap("mutate")
+                try:
+                    data, content = serialize_input(mutated)
+                except:
+                    stats.lap("serialize")
+                    continue
+                stats.lap("serialize")
+
+                crashed, output, trace = self.execute(content)
+                exec_time = stats.lap("exec")
+                if self.target.restart_time:
+                    # A worker that died on this input isn't part of its exec time
+                    exec_time -= self.target.restart_time
+                    stats.shift("exec", "startup", self.target.restart_time)
+                    self.target.restart_time = 0.0
+                tests_run += 1
+                input_name = f"{method_name}_{file_prefix}{tests_run}"
+
+                local_coverage.analyze_output(output)
+                new_edges = trace is not None and local_coverage.analyze_trace(trace)
+
+                found = False
+                if is_hang(output):
+                    # Hangs never join the corpus: they'd only slow the campaign down
+                    sig, status = hang_index.add(mutated if data is None else data, content, output, tests_run)
+                    if status:
+                        self.save_input("hangs", f"{method_name}_{sig}", content)
+                        if self.store is not None:
+                            self.store.add_hang(hang_index.buckets[sig])
+                    if status == "new":
+                        if VERBOSE_MODE:
+                            print(f"  ⏳ Hang #{len(hang_index)} found at test #{tests_run}")
+                        stats.found("hang")
+                        found = True
+
+                elif crashed:
+                    sig, status = crash_index.add(mutated if data is None else data, content, output, tests_run)
+
+                    if status:
+                        # Only the smallest reproducer per bucket is kept on disk
+                        self.save_input("crashes", f"{method_name}_{sig}", content)
+                        if self.store is not None:
+                            self.store.add_crash(crash_index.buckets[sig])
+
+                    if status == "new":
+                        if VERBOSE_MODE:
+                            print(f"  🐛 Bug #{len(crash_index)} found at test #{tests_run}")
+                        stats.found("crash")
+                        found = True
+                        # Only JSON objects can be parents (see RawInput in PART 4)
+                        if data is not None and self.add_find(local_corpus, data, exec_time,
+                                                              crashed, output, trace):
+                            finds += 1
+                            if self.minimizer is not None:
+                                self.minimizer.submit(sig, data)
+
+                elif new_edges or self.should_add_to_corpus(data, output):
+                    found = True
+                    # The queue mirrors the corpus: no duplicates, no RawInput (see PART 4)
+                    if data is not None and self.add_find(local_corpus, data, exec_time, crashed, output, trace):
+                        self.save_input("queue", input_name, content)
+                        stats.found("find")
+                        finds += 1
+
+                if credit is not None:
+                    credit(found)
+                stats.lap("analyze")
+
+                # Stop pulling before the generator builds a mutant we'd never run
+                if tests_run >= max_tests:
+                    break
+
+            # GA offspring don't descend from the scheduled parent
+            if method_name != "GA":
+                local_corpus.picked(parent_index, finds)
+                scheduler.report(local_corpus, parent_index)
+
+            if CMIN_INTERVAL and tests_run - last_cmin >= CMIN_INTERVAL:
+                before = len(local_corpus)
+                local_corpus.retain(self.distiller.distill([local_corpus.content(i)
+                                                            for i in range(len(local_corpus))]))
+                scheduler.rebuild(local_corpus)
+                last_cmin = tests_run
+                if VERBOSE_MODE and len(local_corpus) < before:
+                    print(f"  🧹 Corpus distilled: {before} -> {len(local_corpus)} entries")
+
+            if tests_run - last_checkpoint >= CHECKPOINT_INTERVAL:
+                self.checkpoint(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+                last_checkpoint = tests_run
+
+            if on_sync is not None and tests_run - last_sync >= SYNC_INTERVAL:
+                on_sync(tests_run)
+                last_sync = tests_run
+
+            stats.tick(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+
+            if VERBOSE_MODE and tests_run % 20 == 0:
+                print(f"  Progress: {tests_run}/{max_tests} tests, "
+                      f"{crash_index.total_hits} crashes ({len(crash_index)} unique), "
+                      f"{local_coverage.get_coverage()}/5 bug types, "
+                      f"{local_coverage.get_edge_count()} edges")
+
+        # Final sync (its "done" flag must be the last message a worker sends)
+        if on_sync is not None and last_sync != tests_run:
+            on_sync(tests_run)
+
+        self.checkpoint(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+        return tests_run
+
+    def run_parallel(self, method_name: str, mutation_func, max_tests: int,
+                     local_corpus: CorpusStore, crash_index: CrashIndex, hang_index: HangIndex,
+                     local_coverage: CoverageTracker) -> int:
+        """
+        Fan the campaign out over NUM_WORKERS processes (AFL -M/-S style).
+
+        Each worker runs its own fuzz loop on its share of max_tests and every
+        SYNC_INTERVAL tests reports new corpus entries, crashes, bug types and phase times.
+        This process merges them into the shared corpus/crash list/coverage and
+        forwards new corpus entries, crash buckets and the global coverage map to
+        the other workers.  For the GA each worker is an island: its best
+        individuals are routed to neighbouring islands per GA_TOPOLOGY.
+        Only this process writes the campaign store and stats files.
+        """
+
+        # fork: workers inherit the fuzzer state (and lambda mutators) without pickling
+        ctx = multiprocessing.get_context("fork")
+        outbox = ctx.Queue()
+        inboxes = [ctx.Queue() for _ in range(NUM_WORKERS)]
+        tests_run = last_checkpoint = self.store.tests if self.store is not None else 0
+        remaining = max(0, max_tests - tests_run)
+        shares = [remaining // NUM_WORKERS + (1 if i < remaining % NUM_WORKERS else 0)
+                  for i in range(NUM_WORKERS)]
+
+        workers = []
+        for worker_id, share in enumerate(shares):
+            if share == 0:
+                continue
+            proc = ctx.Process(
+                target=self.campaign_worker,
+                args=(worker_id, method_name, mutation_func, share, inboxes[worker_id], outbox,
+                      local_corpus, local_coverage)
+            )
+            proc.start()
+            workers.append(proc)
+
+        if VERBOSE_MODE:
+            print(f"  🖥️  Started {len(workers)} workers (sync every {SYNC_INTERVAL} tests)")
+
+        running = set(range(len(workers)))
+
+        while running:
+            try:
+                msg = outbox.get(timeout=1)
+            except queue.Empty:
+                if not any(proc.is_alive() for proc in workers):
+                    break
+                continue
+
+            tests_run += msg["tests"]
+            local_corpus.extend(msg["corpus"], found_new=True)
+            self.stats.merge(msg["timings"])
+            if msg["corpus"]:
+                self.stats.found("find")
+            if self.store is not None:
+                for entry, features in zip(msg["corpus"], msg["features"]):
+                    self.store.add_entry(json.dumps(entry), features)
+            if msg["operators"]:
+                mutation_func.stats.merge(msg["operators"])
+            edges_before = local_coverage.get_edge_count()
+            bugs_before = len(local_coverage.covered_bugs)
+            local_coverage.merge(msg["bugs"], msg["bits"])
+            # Hits stay with the hub; the other workers only need the buckets themselves
+            crashes = [dict(update, new_hits=0) for update in msg["crashes"]]
+            sizes = {sig: bucket["size"] for sig, bucket in crash_index.buckets.items()}
+            for sig in hang_index.merge(msg["hangs"]):
+                self.stats.found("hang")
+                if self.store is not None:
+                    self.store.add_hang(hang_index.buckets[sig])
+            for sig in crash_index.merge(msg["crashes"]):
+                self.stats.found("crash")
+                if self.minimizer is not None and isinstance(crash_index.buckets[sig]["input"], dict):
+                    self.minimizer.submit(sig, crash_index.buckets[sig]["input"])
+            if self.store is not None:
+                # New buckets and smaller reproducers
+                for update in crashes:
+                    bucket = crash_index.buckets[update["signature"]]
+                    if bucket["size"] < sizes.get(bucket["signature"], float("inf")):
+                        self.store.add_crash(bucket)
+            self.apply_minimized(method_name, crash_index, local_corpus)
+
+            if tests_run - last_checkpoint >= CHECKPOINT_INTERVAL:
+                self.checkpoint(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+                last_checkpoint = tests_run
+            self.stats.tick(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+
+            if msg["done"]:
+                running.discard(msg["worker"])
+
+            coverage_grew = (local_coverage.get_edge_count() > edges_before
+                             or len(local_coverage.covered_bugs) > bugs_before)
+            if msg["corpus"] or crashes or coverage_grew:
+                update = {
+                    "corpus": msg["corpus"],
+                    "crashes": crashes,
+                    "bugs": local_coverage.covered_bugs,
+                    "bits": bytes(local_coverage.virgin_bits) if coverage_grew else None,
+                    "migrants": []
+                }
+                for worker_id in running:
+                    if worker_id != msg["worker"]:
+                        inboxes[worker_id].put(update)
+
+            if msg["migrants"]:
+                targets = migration_targets(msg["worker"], sorted(running | {msg["worker"]}))
+                for worker_id in targets:
+                    if worker_id in running:
+                        inboxes[worker_id].put({"corpus": [], "crashes": [], "bugs": set(), "bits": None,
+                                                "migrants": msg["migrants"]})
+                if VERBOSE_MODE and targets:
+                    print(f"  🏝️  Island {msg['worker']} -> {targets}: {len(msg['migrants'])} migrants")
+
+        for proc in workers:
+            proc.join(timeout=5)
+        for inbox in inboxes:
+            # Finished workers never drain their inbox; don't block on it at exit
+            inbox.cancel_join_thread()
+
+        self.checkpoint(tests_run, local_corpus, crash_index, hang_index, local_coverage)
+        return tests_run
+
+    def campaign_worker(self, worker_id: int, method_name: str, mutation_func,
+                        max_tests: int, inbox, outbox, start_corpus: CorpusStore,
+                        start_coverage: CoverageTracker):
+        """Body of one parallel worker process (see run_parallel)."""
+
+        # Forked children start with identical RNG state - give each its own stream
+        random.seed(os.getpid() ^ time.time_ns())
+
+        self.stats = FuzzerStats()  # Phase times only; the hub writes the stats files
+        # Don't share the parent's persistent worker pipes or delivery file - make private ones
+        self.target = start_target(self.target.clone())
+        self.stats.lap("startup")
+        self.minimizer = None  # Minimization runs in the parent process
+        self.store = None  # ... and so does persistence
+
+        # Start from the parent's campaign (it may have been resumed); the fork already made it ours
+        local_corpus = start_corpus
+        crash_index = CrashIndex()
+        hang_index = HangIndex()
+        local_coverage = CoverageTracker()
+        local_coverage.merge(start_coverage.covered_bugs, bytes(start_coverage.virgin_bits))
+        # Content hashes of corpus entries the parent already has (distillation rewrites
+        # the corpus order, so "new" can't be tracked as a position)
+        synced = {"keys": {local_corpus.digest(i) for i in range(len(local_corpus))}, "tests": 0, "migrated": 0}
+        island = self.ga_population if method_name == "GA" else None
+        stats = getattr(mutation_func, "stats", None)
+
+        def on_sync(tests_run):
+            # Pull what the other workers found first
+            while True:
+                try:
+                    update = inbox.get_nowait()
+                except queue.Empty:
+                    break
+                before = len(local_corpus)
+                local_corpus.extend(update["corpus"])
+                synced["keys"].update(local_corpus.digest(i) for i in range(before, len(local_corpus)))
+                crash_index.merge(update["crashes"])
+                local_coverage.merge(update["bugs"], update["bits"])
+                if island is not None and update["migrants"]:
+                    island.add_many(update["migrants"])
+
+            migrants = []
+            if (island is not None and len(island)
+                    and tests_run - synced["migrated"] >= GA_MIGRATION_INTERVAL):
+                migrants = [island.individuals[key]["data"] for key in island.elite(GA_MIGRANTS)]
+                synced["migrated"] = tests_run
+
+            new = [i for i in range(len(local_corpus)) if local_corpus.digest(i) not in synced["keys"]]
+            corpus = [local_corpus[i] for i in new]
+            outbox.put({
+                "worker": worker_id,
+                "done": tests_run >= max_tests,
+                "tests": tests_run - synced["tests"],
+                "corpus": corpus,
+                "features": [self.distiller.cached(local_corpus.content(i)) for i in new],
+                "crashes": crash_index.drain_updates(),
+                "hangs": hang_index.drain_updates(),
+                "bugs": local_coverage.covered_bugs,
+                "bits": bytes(local_coverage.virgin_bits),
+                "migrants": migrants,
+                "operators": stats.drain() if stats is not None else [],
+                "timings": self.stats.drain()
+            })
+            synced["keys"] = {local_corpus.digest(i) for i in range(len(local_corpus))}
+            synced["tests"] = tests_run
+
+        try:
+            self.fuzz_loop(method_name, mutation_func, max_tests, local_corpus,
+                           crash_index, hang_index, local_coverage, on_sync, file_prefix=f"w{worker_id}_")
+        finally:
+            self.close()
+
     def compare_all_methods(self, tests_per_method=100):
-        """Run all three methods and compare results."""
+        """Run all four methods and compare results."""
 
         print("\n" + "=" * 60)
         print("COMPARATIVE FUZZING EXPERIMENT")
         print("=" * 60)
         print(f"\nRunning {tests_per_method} tests with each method...")
-        print("This will compare Traditional vs LLM vs GA\n")
+        print("This will compare Traditional vs LLM vs GA vs Structured\n")
 
         results = []
 
@@ -645,7 +4420,7 @@ class ComparativeFuzzer:
             print("\n🔨 Traditional Fuzzing...", end=" ")
 
         results.append(
-            self.run_campaign("Traditional", traditional_mutate, tests_per_method)
+            self.run_campaign("Traditional", TraditionalMutator(), tests_per_method)
         )
 
         if not VERBOSE_MODE:
@@ -657,7 +4432,7 @@ class ComparativeFuzzer:
         else:
             print("🧠 LLM-Guided Fuzzing...", end=" ")
 
-        llm_func = lambda parent: llm_guided_mutate(parent, self.use_real_llm)
+        llm_func = lambda parent, **batch: llm_guided_mutate(parent, self.use_real_llm, **batch)
         results.append(
             self.run_campaign("LLM", llm_func, tests_per_method)
         )
@@ -671,8 +4446,24 @@ class ComparativeFuzzer:
         else:
             print("🧬 Genetic Algorithm Fuzzing...", end=" ")
 
+        self.ga_population = GAPopulation()
+        ga_func = lambda corpus, crashes, use_real_llm, **batch: genetic_evolve(
+            corpus, crashes, use_real_llm, population=self.ga_population, **batch)
         results.append(
-            self.run_campaign("GA", genetic_evolve, tests_per_method)
+            self.run_campaign("GA", ga_func, tests_per_method)
+        )
+
+        if not VERBOSE_MODE:
+            print(f"✅ Done! ({results[-1]['crashes']} crashes in {results[-1]['time']:.1f}s)")
+
+        # 4. Structure-aware fuzzing
+        if VERBOSE_MODE:
+            print("\n🌳 Starting Structure-Aware Fuzzing...")
+        else:
+            print("🌳 Structure-Aware Fuzzing...", end=" ")
+
+        results.append(
+            self.run_campaign("Structured", StructuredMutator(), tests_per_method)
         )
 
         if not VERBOSE_MODE:
@@ -689,49 +4480,751 @@ class ComparativeFuzzer:
         print("FINAL COMPARISON")
         print("=" * 60 + "\n")
 
-        print(f"{'Method':<15} {'Time (s)':<12} {'Crashes':<10} {'Bug Types':<12} {'Success %':<12}")
-        print("-" * 60)
+        print(f"{'Method':<15} {'Time (s)':<12} {'Crashes':<10} {'Unique':<8} {'Bug Types':<12} {'Success %':<12}")
+        print("-" * 68)
 
         for r in results:
             success_rate = (r['crashes'] / r['tests'] * 100) if r['tests'] > 0 else 0
-            print(f"{r['method']:<15} {r['time']:<12.2f} {r['crashes']:<10} "
+            print(f"{r['method']:<15} {r['time']:<12.2f} {r['crashes']:<10} {r['unique_crashes']:<8} "
                   f"{r['bug_types']}/5{'':<8} {success_rate:<12.1f}")
 
         print("\n" + "=" * 60)
 
-        best_method = max(results, key=lambda x: x['crashes'])
+        best_method = max(results, key=lambda x: x['unique_crashes'])
         fastest_method = min(results, key=lambda x: x['time'])
         most_coverage = max(results, key=lambda x: x['bug_types'])
 
         print("🏆 WINNERS:")
-        print(f"  Most crashes found: {best_method['method']} ({best_method['crashes']} crashes)")
+        print(f"  Most unique crashes: {best_method['method']} ({best_method['unique_crashes']} unique crashes)")
         print(f"  Fastest execution: {fastest_method['method']} ({fastest_method['time']:.2f}s)")
         print(f"  Best coverage: {most_coverage['method']} ({most_coverage['bug_types']} bug types)")
 
 
+# ============================================================================
+# PART 14: BENCHMARKS
+# ============================================================================
+
+BENCH_OUTPUTS = [
+    "Valid user data\n",
+    "Exception: CRASH: Buffer overflow detected!\n",
+    "Exception: CRASH: Command injection detected!\n",
+    "Exception: CRASH: Negative age logic error!\n",
+    "Exception: CRASH: Too many permissions!\n",
+    "ZeroDivisionError: division by zero\n"
+]
+
+
+class MilestoneCoverage(CoverageTracker):
+    """CoverageTracker that notes (exec, perf_counter) when all 5 bug types were first covered."""
+
+    def __init__(self):
+        super().__init__()
+        self.execs = 0
+        self.all_bugs = None
+
+    def analyze_output(self, output):
+        super().analyze_output(output)
+        self.execs += 1
+        if self.all_bugs is None and len(self.covered_bugs) == 5:
+            self.all_bugs = (self.execs, time.perf_counter())
+
+
+class MilestoneCrashIndex(CrashIndex):
+    """CrashIndex that notes (test number, perf_counter) of the first crash."""
+
+    def __init__(self):
+        super().__init__()
+        self.first_crash = None
+
+    def add(self, crash_input: dict, content: str, output: str, test_number: int) -> Tuple[str, str]:
+        if self.first_crash is None:
+            self.first_crash = (test_number, time.perf_counter())
+        return super().add(crash_input, content, output, test_number)
+
+
+def bench_reference() -> float:
+    """Seconds for a fixed slice of pure-Python work (dicts, strings, JSON): the machine's speed right now."""
+
+    start = time.perf_counter()
+    for i in range(200):
+        json.loads(json.dumps({"name": str(i) * 8, "values": list(range(i % 16)), "nested": {"id": i}}))
+    return time.perf_counter() - start
+
+
+def bench(func: Callable[[], object], iterations: int, ops_per_call: int = 1,
+          repeats: int = BENCH_REPEATS, setup: Optional[Callable[[], object]] = None) -> dict:
+    """
+    Time func() (median and best of `repeats` rounds) in ns per op, from a fixed RNG state.
+    setup() runs untimed before every round, for state func() builds up (so rounds stay comparable).
+    "noise" is the median's relative distance from the best round, which
+    compare_benchmarks() scales into that benchmark's regression tolerance.
+    Each round also times bench_reference(); "reference_ns" (its best) lets
+    runs on a machine whose speed drifts be compared relative to it.
+    """
+
+    random.seed(BENCH_SEED)
+    if setup is not None:
+        setup()
+    func()  # Warm-up: caches, lazy imports, first-call allocations
+    rounds = []
+    reference = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        reference.append(bench_reference())
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        rounds.append((time.perf_counter() - start) / (iterations * ops_per_call) * 1e9)
+    rounds.sort()
+    return {
+        "ns_per_op": round(rounds[len(rounds) // 2], 1),
+        "best_ns": round(rounds[0], 1),
+        "noise": round(rounds[len(rounds) // 2] / rounds[0] - 1, 4),
+        "reference_ns": round(min(reference) * 1e9, 1),
+        "ops": iterations * ops_per_call,
+        "repeats": repeats
+    }
+
+
+def bench_inputs(seeds: List[dict], n: int = 100) -> List[dict]:
+    """A fixed population: the seeds plus traditional mutants of them."""
+
+    random.seed(BENCH_SEED)
+    inputs = list(seeds)
+    while len(inputs) < n:
+        inputs.extend(traditional_mutate(random.choice(seeds), batch_size=n - len(inputs)))
+    return inputs
+
+
+def run_micro_benchmarks(fuzzer: "ComparativeFuzzer") -> dict:
+    """Hot paths in isolation: every mutator, the GA scoring/breeding steps, analysis and execution."""
+
+    population = bench_inputs(fuzzer.corpus)
+    crashes = [{"input": candidate} for candidate in population[-20:]]
+    parent = fuzzer.corpus[0]
+    coverage = CoverageTracker()
+    content = json.dumps(parent)
+    input_file = os.path.join("test_files", "bench_input.json")
+    with open(input_file, 'w') as f:
+        f.write(content)
+
+    traditional, structured = TraditionalMutator(), StructuredMutator()
+    ga = {}  # The GA case's population, rebuilt for every round (it grows as it breeds)
+    corpus = CorpusStore(population)
+
+    results = {
+        "mutate.traditional": bench(lambda: list(traditional(parent, batch_size=10)), 200, 10),
+        "mutate.llm": bench(lambda: list(llm_guided_mutate(parent, False, batch_size=10)), 200, 10),
+        "mutate.ga": bench(lambda: list(genetic_evolve(population, crashes, False, batch_size=10,
+                                                       population=ga["population"])), 50, 10,
+                           setup=lambda: ga.update(population=GAPopulation())),
+        "mutate.structured": bench(lambda: list(structured(parent, batch_size=10)), 200, 10),
+        "genetic_crossover": bench(lambda: genetic_crossover(random.choice(population),
+                                                             random.choice(population)), 10000),
+        "ga.rank": bench(lambda: GAPopulation().add_many(population), 50, len(population)),
+        "fitness_function": bench(lambda: [fitness_function(c, crashes) for c in population], 50, len(population)),
+        "corpus.add": bench(lambda: CorpusStore(population), 50, len(population)),
+        "corpus.get": bench(lambda: [corpus[i] for i in range(len(corpus))], 200, len(corpus)),
+        "analyze_output": bench(lambda: [coverage.analyze_output(o) for o in BENCH_OUTPUTS], 2000, len(BENCH_OUTPUTS)),
+        "test_input": bench(lambda: test_input(input_file, timeout=fuzzer.timeout,
+                                               command=TARGET_COMMAND or python_command(),
+                                               crash_detection=TARGET_CRASH_DETECTION), 20)
+    }
+    results["target.run"] = bench(lambda: fuzzer.target.run(content), 2000)
+    return results
+
+
+def method_mutators(fuzzer: "ComparativeFuzzer") -> dict:
+    """Method name -> factory of a fresh mutation function, for quiet fuzz_loop() campaigns."""
+
+    return {
+        "Traditional": lambda: TraditionalMutator(),
+        "LLM": lambda: lambda parent, **batch: llm_guided_mutate(parent, fuzzer.use_real_llm, **batch),
+        "GA": lambda: lambda corpus, crashes, use_real_llm, **batch: genetic_evolve(
+            corpus, crashes, use_real_llm, population=fuzzer.ga_population, **batch),
+        "Structured": lambda: StructuredMutator()
+    }
+
+
+def macro_campaign(fuzzer: "ComparativeFuzzer", method_name: str, max_tests: int, results):
+    """Body of one end-to-end benchmark process: a quiet campaign from BENCH_SEED, reported on results."""
+
+    random.seed(BENCH_SEED)
+    # Don't share the parent's persistent worker pipes or delivery file - make private ones
+    fuzzer.target = start_target(fuzzer.target.clone())
+    fuzzer.store = None
+    fuzzer.stats = FuzzerStats()
+    fuzzer.minimizer = None
+    fuzzer.coverage_tracker = CoverageTracker()
+    fuzzer.distiller = CorpusDistiller(fuzzer.execute)
+    fuzzer.ga_population = GAPopulation()
+    crash_index = MilestoneCrashIndex()
+    coverage = MilestoneCoverage()
+
+    try:
+        start = time.perf_counter()
+        tests_run = fuzzer.fuzz_loop(method_name, method_mutators(fuzzer)[method_name](), max_tests,
+                                     CorpusStore(base=fuzzer.corpus), crash_index, HangIndex(), coverage)
+        elapsed = time.perf_counter() - start
+    finally:
+        fuzzer.close()
+
+    def milestone(mark):
+        return None if mark is None else {"tests": mark[0], "seconds": round(mark[1] - start, 4)}
+
+    results.put({
+        "tests": tests_run,
+        "seconds": round(elapsed, 3),
+        "execs_per_sec": round(tests_run / elapsed, 1),
+        "unique_crashes": len(crash_index),
+        "edges": coverage.get_edge_count(),
+        "first_crash": milestone(crash_index.first_crash),
+        "all_bugs": milestone(coverage.all_bugs)
+    })
+
+
+def run_macro_benchmarks(fuzzer: "ComparativeFuzzer", max_tests: int = BENCH_MACRO_TESTS,
+                         repeats: int = BENCH_MACRO_REPEATS) -> dict:
+    """
+    `repeats` quiet max_tests campaigns per method from the same RNG seed: the
+    best execs/sec, and the median tests (and that run's seconds) until the
+    first crash and until all 5 bug types (None if no run got there), each
+    with the "noise" of its test count (None if the median run never got
+    there, and then from the run that did in the fewest tests).
+    Nothing is persisted and no crashes are minimized.  Each campaign runs in
+    its own forked process, so all of them start from the same state (the
+    dictionary, coverage and target worker are never carried over).  Power
+    scheduling still weighs measured exec times, so with SCHEDULER = "power"
+    the test counts can drift between runs; "noise" is measured as in bench(),
+    on campaign time.
+    """
+
+    # fork: campaigns inherit the fuzzer state (and lambda mutators) without pickling
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    report = {}
+    for method_name in method_mutators(fuzzer):
+        runs = []
+        for _ in range(repeats):
+            proc = ctx.Process(target=macro_campaign, args=(fuzzer, method_name, max_tests, results))
+            proc.start()
+            while True:
+                try:
+                    runs.append(results.get(timeout=1))
+                    break
+                except queue.Empty:
+                    if proc.exitcode not in (None, 0):
+                        raise RuntimeError(f"{method_name} benchmark campaign died with exit code {proc.exitcode}")
+            proc.join()
+
+        runs.sort(key=lambda run: run["seconds"])
+        result = dict(runs[0])
+        result["noise"] = round(runs[len(runs) // 2]["seconds"] / runs[0]["seconds"] - 1, 4)
+        for name in ("first_crash", "all_bugs"):
+            marks = sorted((run[name] for run in runs if run[name] is not None), key=lambda mark: mark["tests"])
+            if not marks:
+                result[name] = None
+                continue
+            # A milestone the median run never reached has no usable noise figure
+            if len(marks) > len(runs) // 2:
+                median = marks[len(runs) // 2]
+                result[name] = dict(median, noise=round(median["tests"] / marks[0]["tests"] - 1, 4))
+            else:
+                result[name] = dict(marks[0], noise=None)
+        report[method_name] = result
+    return report
+
+
+def compare_benchmarks(current: dict, baseline: dict) -> List[str]:
+    """
+    Regressions of current vs baseline results beyond the configured thresholds.
+    A benchmark only regresses past BENCH_NOISE_FACTOR times the noise either
+    run measured for it (and at least BENCH_REGRESSION_THRESHOLD, or
+    BENCH_MACRO_THRESHOLD end to end); micro-benchmarks are compared in units
+    of bench_reference() when both runs timed it.  Milestones are compared in
+    tests, as their seconds only add the execs/sec already compared.
+    """
+
+    regressions = []
+    # Best-of-rounds is the least noisy estimate of the real cost (as timeit advises)
+    for name, result in current["micro"].items():
+        old = baseline.get("micro", {}).get(name)
+        if not old:
+            continue
+        tolerance = max(BENCH_REGRESSION_THRESHOLD,
+                        BENCH_NOISE_FACTOR * max(result.get("noise", 0.0), old.get("noise", 0.0)))
+        slowdown = result["best_ns"] / old["best_ns"]
+        if result.get("reference_ns") and old.get("reference_ns"):
+            slowdown /= result["reference_ns"] / old["reference_ns"]
+        if slowdown > 1 + tolerance:
+            regressions.append(f"{name}: {old['best_ns']:.0f} -> {result['best_ns']:.0f} ns/op (best), "
+                               f"{(slowdown - 1) * 100:.0f}% slower vs a {tolerance * 100:.0f}% tolerance")
+
+    for method, result in current["macro"].items():
+        old = baseline.get("macro", {}).get(method)
+        if not old:
+            continue
+        tolerance = max(BENCH_MACRO_THRESHOLD,
+                        BENCH_NOISE_FACTOR * max(result.get("noise", 0.0), old.get("noise", 0.0)))
+        if result["execs_per_sec"] * (1 + tolerance) < old["execs_per_sec"]:
+            regressions.append(f"{method} execs/sec: {old['execs_per_sec']} -> {result['execs_per_sec']}")
+        for milestone in ("first_crash", "all_bugs"):
+            if old[milestone] is None:
+                continue
+            noises = [old[milestone].get("noise", 0.0)]
+            if result[milestone] is None:
+                if noises[0] is not None:
+                    regressions.append(f"{method} {milestone}: reached at test {old[milestone]['tests']} -> never")
+                continue
+            noises.append(result[milestone].get("noise", 0.0))
+            if None in noises:
+                continue  # Reached only now and then: no reliable test count to compare
+            tolerance = max(BENCH_MACRO_THRESHOLD, BENCH_NOISE_FACTOR * max(noises))
+            # A handful of tests either way is luck of the draw
+            if (result[milestone]["tests"] > old[milestone]["tests"] * (1 + tolerance)
+                    and result[milestone]["tests"] - old[milestone]["tests"] > 10):
+                regressions.append(f"{method} {milestone}: test {old[milestone]['tests']} -> "
+                                   f"{result[milestone]['tests']} ({old[milestone]['seconds']}s -> "
+                                   f"{result[milestone]['seconds']}s)")
+    return regressions
+
+
+def run_benchmarks(out_path: str = "bench.json", baseline_path: Optional[str] = None) -> int:
+    """
+    Run the benchmark suite, write the results to out_path as JSON and, given a
+    baseline (an earlier out_path), report regressions. Returns the exit status:
+    1 if anything regressed.
+
+    Mutant streams only repeat exactly with a fixed string hash seed too, so
+    run it as PYTHONHASHSEED=0 python <this file> bench ...
+    """
+
+    global VERBOSE_MODE
+    VERBOSE_MODE = False
+
+    if os.environ.get("PYTHONHASHSEED") is None:
+        print("⚠️  PYTHONHASHSEED is not set: set iteration order (and so mutants) will vary between runs\n")
+
+    if builtin_target():
+        create_vulnerable_json_parser()
+    fuzzer = ComparativeFuzzer(find_seed_files())
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    print("⏱️  Micro-benchmarks...")
+    micro = run_micro_benchmarks(fuzzer)
+    print("⏱️  End-to-end campaigns...")
+    macro = run_macro_benchmarks(fuzzer)
+    target = fuzzer.target.describe()
+    fuzzer.close()
+
+    results = {
+        "meta": {
+            "commit": commit,
+            "time": int(time.time()),
+            "python": sys.version.split()[0],
+            "seed": BENCH_SEED,
+            "hash_seed": os.environ.get("PYTHONHASHSEED"),
+            "execution_mode": EXECUTION_MODE,
+            "target": target,
+            "macro_tests": BENCH_MACRO_TESTS,
+            "macro_repeats": BENCH_MACRO_REPEATS
+        },
+        "micro": micro,
+        "macro": macro
+    }
+    with open(out_path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'Benchmark':<22} {'ns/op':>12} {'best':>12} {'noise':>7}")
+    for name, result in micro.items():
+        print(f"{name:<22} {result['ns_per_op']:>12.0f} {result['best_ns']:>12.0f} {result['noise'] * 100:>6.1f}%")
+    print(f"\n{'Method':<13} {'execs/s':>9} {'1st crash':>16} {'all 5 bugs':>16}")
+    for method, result in macro.items():
+        cells = [f"#{m['tests']} {m['seconds']:.3f}s" if m else "-"
+                 for m in (result["first_crash"], result["all_bugs"])]
+        print(f"{method:<13} {result['execs_per_sec']:>9.0f} {cells[0]:>16} {cells[1]:>16}")
+    print(f"\n✓ Results written to {out_path}")
+
+    if baseline_path is None:
+        return 0
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    regressions = compare_benchmarks(results, baseline)
+    for regression in regressions:
+        print(f"  ❌ {regression}")
+    print(f"{len(regressions)} regression(s) vs {baseline_path} (commit {baseline['meta'].get('commit')})")
+    return 1 if regressions else 0
+
+
+# ============================================================================
+# PART 15: EXPERIMENTS
+# ============================================================================
+
+# Compared metrics: +1 = higher is better, -1 = lower is better (tests until a milestone)
+EXPERIMENT_METRICS = {
+    "edges": 1,
+    "bug_types": 1,
+    "unique_crashes": 1,
+    "execs_per_sec": 1,
+    "first_crash": -1,
+    "all_bugs": -1
+}
+
+
+class TrialCoverage(MilestoneCoverage):
+    """MilestoneCoverage that also samples a coverage curve and notes when each bug type was first seen."""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self.start = time.perf_counter()
+        self.curve = []  # [tests, seconds, edges, bug types]
+        self.first_seen = {}  # bug type -> [tests, seconds]
+
+    def sample(self):
+        self.curve.append([self.execs, round(time.perf_counter() - self.start, 4),
+                           self.get_edge_count(), len(self.covered_bugs)])
+
+    def analyze_output(self, output):
+        # Sampled before the exec: fuzz_loop folds in its edges only after analyze_output()
+        if self.execs % self.every == 0:
+            self.sample()
+        super().analyze_output(output)
+        for bug in self.covered_bugs.difference(self.first_seen):
+            self.first_seen[bug] = [self.execs, round(time.perf_counter() - self.start, 4)]
+
+
+def experiment_trial(fuzzer: "ComparativeFuzzer", method_name: str, seed: int, max_tests: int, results):
+    """Body of one trial process: a quiet campaign from its own RNG seed, reported on results."""
+
+    random.seed(seed)
+    # Don't share the parent's persistent worker pipes or delivery file - make private ones
+    fuzzer.target = start_target(fuzzer.target.clone())
+    fuzzer.store = None
+    fuzzer.stats = FuzzerStats()
+    fuzzer.minimizer = None
+    fuzzer.coverage_tracker = CoverageTracker()
+    fuzzer.distiller = CorpusDistiller(fuzzer.execute)
+    fuzzer.ga_population = GAPopulation()
+    crash_index = MilestoneCrashIndex()
+    coverage = TrialCoverage(max(1, max_tests // EXPERIMENT_SAMPLES))
+
+    try:
+        tests_run = fuzzer.fuzz_loop(method_name, method_mutators(fuzzer)[method_name](), max_tests,
+                                     CorpusStore(base=fuzzer.corpus), crash_index, HangIndex(), coverage)
+        coverage.sample()
+        elapsed = time.perf_counter() - coverage.start
+    finally:
+        fuzzer.close()
+
+    results.put({
+        "method": method_name,
+        "seed": seed,
+        "tests": tests_run,
+        "seconds": round(elapsed, 3),
+        "execs_per_sec": round(tests_run / elapsed, 1),
+        "edges": coverage.get_edge_count(),
+        "bug_types": len(coverage.covered_bugs),
+        "unique_crashes": len(crash_index),
+        "first_crash": crash_index.first_crash[0] if crash_index.first_crash else None,
+        "all_bugs": coverage.all_bugs[0] if coverage.all_bugs else None,
+        "bugs": coverage.first_seen,
+        "curve": coverage.curve
+    })
+
+
+def confidence_interval(values: List[float], rng: random.Random) -> Tuple[float, float]:
+    """Bootstrap percentile interval of the median (EXPERIMENT_CONFIDENCE, EXPERIMENT_BOOTSTRAP resamples)."""
+
+    medians = sorted(statistics.median(rng.choices(values, k=len(values))) for _ in range(EXPERIMENT_BOOTSTRAP))
+    tail = (1 - EXPERIMENT_CONFIDENCE) / 2
+    return medians[int(tail * len(medians))], medians[min(len(medians) - 1, int((1 - tail) * len(medians)))]
+
+
+def u_distribution(n1: int, n2: int) -> List[int]:
+    """Number of orderings of n1 + n2 distinct values giving each U of sample 1 (index = U)."""
+
+    # counts[j][u] for samples of size (i, j): the largest value is either sample 1's
+    # (it beats all j others) or sample 2's (it beats none)
+    previous = [[1] for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        counts = [[1]]
+        for j in range(1, n2 + 1):
+            row = [0] * (i * j + 1)
+            for u, count in enumerate(previous[j]):
+                row[u + j] += count
+            for u, count in enumerate(counts[j - 1]):
+                row[u] += count
+            counts.append(row)
+        previous = counts
+    return previous[n2]
+
+
+def mann_whitney(a: List[float], b: List[float]) -> Tuple[float, float]:
+    """
+    Mann-Whitney U of a against b and its two-sided p-value: exact for small
+    samples without ties, else the normal approximation with tie and
+    continuity correction (scipy's "auto" method).
+    """
+
+    pooled = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    n1, n2, n = len(a), len(b), len(pooled)
+    rank_sum, ties = 0.0, 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        # Tied values share the average of their ranks i+1 .. j+1
+        rank_sum += (i + j + 2) / 2 * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        ties += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    if not ties and min(n1, n2) <= 8:
+        counts = u_distribution(n1, n2)
+        extreme = int(max(u, n1 * n2 - u))
+        return u, min(1.0, 2 * sum(counts[extreme:]) / sum(counts))
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0  # Every value tied
+    z = max(0.0, abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return u, min(1.0, math.erfc(z / math.sqrt(2)))
+
+
+def vargha_delaney(u: float, n1: int, n2: int) -> Tuple[float, str]:
+    """A12 effect size from the U of sample 1 (P(sample 1 > sample 2), ties count half) and its magnitude."""
+
+    a12 = u / (n1 * n2)
+    distance = abs(a12 - 0.5)
+    magnitude = ("negligible" if distance < 0.06 else "small" if distance < 0.14
+                 else "medium" if distance < 0.21 else "large")
+    return a12, magnitude
+
+
+def finite(value: float) -> Optional[float]:
+    """JSON has no infinity: never-reached milestones are reported as None."""
+    return None if value == float("inf") else value
+
+
+def summarize_trials(trials: List[dict], rng: random.Random) -> dict:
+    """Median and confidence interval of every metric, coverage curves and time-to-bug curves of one method."""
+
+    def stat(values):
+        low, high = confidence_interval(values, rng)
+        return {"median": finite(statistics.median(values)), "low": finite(low), "high": finite(high)}
+
+    summary = {metric: stat([float("inf") if trial[metric] is None else trial[metric] for trial in trials])
+               for metric in EXPERIMENT_METRICS}
+
+    points = min(len(trial["curve"]) for trial in trials)
+    summary["curve"] = []
+    for k in range(points):
+        samples = [trial["curve"][k] for trial in trials]
+        summary["curve"].append({
+            "tests": samples[0][0],
+            "seconds": round(statistics.median(sample[1] for sample in samples), 4),
+            "edges": stat([sample[2] for sample in samples]),
+            "bug_types": stat([sample[3] for sample in samples])
+        })
+
+    # Time to bug: per bug type the fraction of trials that had found it by each curve point
+    summary["bugs"] = {}
+    for bug in sorted({bug for trial in trials for bug in trial["bugs"]}):
+        found = [trial["bugs"][bug] for trial in trials if bug in trial["bugs"]]
+        summary["bugs"][bug] = {
+            "found": len(found) / len(trials),
+            "tests": stat([trial["bugs"][bug][0] if bug in trial["bugs"] else float("inf") for trial in trials]),
+            "seconds": round(statistics.median(seconds for _, seconds in found), 4),
+            "found_by": [sum(1 for tests, _ in found if tests <= point["tests"]) / len(trials)
+                         for point in summary["curve"]]
+        }
+    return summary
+
+
+def compare_methods(trials: dict) -> List[dict]:
+    """Pairwise Mann-Whitney U / Vargha-Delaney A12 of every metric (A12 > 0.5 = the first method is better)."""
+
+    comparisons = []
+    methods = [method for method in trials if trials[method]]
+    for i, first in enumerate(methods):
+        for second in methods[i + 1:]:
+            for metric, sign in EXPERIMENT_METRICS.items():
+                # Unreached milestones rank worst; the sign makes "better" always "bigger"
+                a, b = ([sign * (float("inf") if trial[metric] is None else trial[metric]) for trial in trials[method]]
+                        for method in (first, second))
+                u, p = mann_whitney(a, b)
+                a12, magnitude = vargha_delaney(u, len(a), len(b))
+                comparisons.append({
+                    "a": first, "b": second, "metric": metric, "u": u, "p": round(p, 6),
+                    "a12": round(a12, 4), "effect": magnitude,
+                    "significant": p < 1 - EXPERIMENT_CONFIDENCE
+                })
+    return comparisons
+
+
+def run_experiment(report_path: str = "experiment.json") -> int:
+    """
+    Compare the methods statistically: EXPERIMENT_TRIALS independent trials of
+    EXPERIMENT_TESTS tests per method, EXPERIMENT_PROCESSES at a time in forked
+    processes.  Trial i of every method starts from seed EXPERIMENT_SEED + i.
+    Writes the raw trials, per-method medians with bootstrap confidence
+    intervals, coverage and time-to-bug curves and the pairwise tests to
+    report_path as JSON.  Returns the exit status (1 if a trial died).
+
+    Trials fuzz serially (NUM_WORKERS is ignored) and persist nothing.
+    """
+
+    global VERBOSE_MODE
+    VERBOSE_MODE = False
+
+    if builtin_target():
+        create_vulnerable_json_parser()
+    fuzzer = ComparativeFuzzer(find_seed_files())
+    unknown = set(EXPERIMENT_METHODS) - set(method_mutators(fuzzer))
+    if unknown:
+        raise ValueError(f"Unknown EXPERIMENT_METHODS: {sorted(unknown)}")
+
+    pending = collections.deque((method, EXPERIMENT_SEED + i)
+                                for i in range(EXPERIMENT_TRIALS) for method in EXPERIMENT_METHODS)
+    processes = EXPERIMENT_PROCESSES or os.cpu_count() or 1
+    print(f"🧪 {len(pending)} trials of {EXPERIMENT_TESTS} tests, {processes} at a time...")
+
+    # fork: trials inherit the fuzzer state (and lambda mutators) without pickling
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    running = {}  # (method, seed) -> process
+    trials = {method: [] for method in EXPERIMENT_METHODS}
+    failed = []
+    start = time.time()
+
+    while pending or running:
+        while pending and len(running) < processes:
+            method, seed = pending.popleft()
+            proc = ctx.Process(target=experiment_trial, args=(fuzzer, method, seed, EXPERIMENT_TESTS, results))
+            proc.start()
+            running[method, seed] = proc
+
+        try:
+            trial = results.get(timeout=1)
+        except queue.Empty:
+            # A trial that exited without reporting died (its result can't still be in flight)
+            for key, proc in list(running.items()):
+                if proc.exitcode not in (None, 0):
+                    print(f"  ❌ {key[0]} trial (seed {key[1]}) died with exit code {proc.exitcode}")
+                    failed.append({"method": key[0], "seed": key[1], "exitcode": proc.exitcode})
+                    del running[key]
+            continue
+
+        running.pop((trial["method"], trial["seed"])).join()
+        trials[trial["method"]].append(trial)
+        print(f"  ✓ {trial['method']} seed {trial['seed']}: {trial['edges']} edges, "
+              f"{trial['unique_crashes']} unique crashes, {trial['bug_types']}/5 bug types")
+
+    fuzzer.close()
+    elapsed = time.time() - start
+
+    rng = random.Random(EXPERIMENT_SEED)  # Bootstrap resampling is reproducible too
+    for method_trials in trials.values():
+        method_trials.sort(key=lambda trial: trial["seed"])
+    summaries = {method: summarize_trials(method_trials, rng) for method, method_trials in trials.items() if method_trials}
+    comparisons = compare_methods(trials)
+
+    report = {
+        "meta": {
+            "time": int(start),
+            "seconds": round(elapsed, 1),
+            "python": sys.version.split()[0],
+            "execution_mode": EXECUTION_MODE,
+            "target": fuzzer.target.describe(),
+            "scheduler": SCHEDULER,
+            "trials": EXPERIMENT_TRIALS,
+            "tests": EXPERIMENT_TESTS,
+            "seed": EXPERIMENT_SEED,
+            "confidence": EXPERIMENT_CONFIDENCE,
+            "bootstrap": EXPERIMENT_BOOTSTRAP,
+            "hash_seed": os.environ.get("PYTHONHASHSEED")
+        },
+        "summary": summaries,
+        "comparisons": comparisons,
+        "trials": trials,
+        "failed": failed
+    }
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    def cell(stat):
+        if stat["median"] is None:
+            return "never"
+        high = "∞" if stat["high"] is None else f"{stat['high']:g}"
+        return f"{stat['median']:g} [{stat['low']:g}, {high}]"
+
+    columns = ("edges", "bug_types", "unique_crashes", "first_crash", "all_bugs")
+    print(f"\n{'Method':<13}" + "".join(f"{column:>20}" for column in columns))
+    for method, summary in summaries.items():
+        print(f"{method:<13}" + "".join(f"{cell(summary[column]):>20}" for column in columns))
+    print(f"median [{EXPERIMENT_CONFIDENCE:.0%} CI] of each method's trials ({elapsed:.1f}s in total); "
+          f"first_crash and all_bugs are tests until reached")
+
+    significant = [c for c in comparisons if c["significant"]]
+    print(f"\nSignificant differences (Mann-Whitney U, p < {1 - EXPERIMENT_CONFIDENCE:.2f}; Vargha-Delaney A12):")
+    for c in significant:
+        better, worse = (c["a"], c["b"]) if c["a12"] > 0.5 else (c["b"], c["a"])
+        print(f"  {better} > {worse} on {c['metric']}: p={c['p']:.4f}, "
+              f"A12={max(c['a12'], 1 - c['a12']):.2f} ({c['effect']})")
+    if not significant:
+        print("  none")
+    print(f"\n✓ Report written to {report_path}")
+    return 1 if failed else 0
+
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
 
 if __name__ == "__main__":
+    # Standalone corpus distillation: python <this file> cmin <in_dir> <out_dir>
+    if len(sys.argv) == 4 and sys.argv[1] == "cmin":
+        if builtin_target():
+            create_vulnerable_json_parser()
+        cmin_directory(sys.argv[2], sys.argv[3])
+        sys.exit(0)
+
+    # Benchmarks: python <this file> bench [results.json] [baseline.json]
+    if len(sys.argv) >= 2 and sys.argv[1] == "bench":
+        sys.exit(run_benchmarks(*sys.argv[2:4]))
+
+    # Statistical method comparison: python <this file> experiment [report.json]
+    if len(sys.argv) >= 2 and sys.argv[1] == "experiment":
+        sys.exit(run_experiment(*sys.argv[2:3]))
+
     print("\n" + "=" * 60)
     print("AI-POWERED FUZZER DEMONSTRATION STARTING...")
     print("=" * 60 + "\n")
 
-    # 1️⃣ Create the vulnerable program
-    create_vulnerable_json_parser()
+    # 1️⃣ Create the vulnerable program (unless we're fuzzing your own target)
+    if builtin_target():
+        create_vulnerable_json_parser()
 
-    # 2️⃣ Create seed files
-    seed_files = create_seed_files()
+    # 2️⃣ Create seed files (or use yours from SEED_DIR)
+    seed_files = find_seed_files()
 
     # 3️⃣ Initialize and run the comparative fuzzer
     fuzzer = ComparativeFuzzer(seed_files)
 
     # 4️⃣ Run the full experiment
     results = fuzzer.compare_all_methods(TESTS_PER_METHOD)
+    fuzzer.close()
 
     # 5️⃣ Display summary
     print("\n✅ Experiment complete!")
     print(f"\nTotal methods tested: {len(results)}")
     for r in results:
-        print(f"  {r['method']}: {r['crashes']} crashes, {r['bug_types']}/5 bug types")
\ No newline at end of file
+        print(f"  {r['method']}: {r['unique_crashes']} unique crashes ({r['crashes']} total), "
+              f"{r['bug_types']}/5 bug types")
\ No newline at end of file
@@ -1,7 +1,49 @@
 import type { Express } from "express";
 import { createServer, type Server } from "http";
+import fs from "fs/promises";
+import path from "path";
 import { storage } from "./storage";
 
+// Campaign directories the fuzzer writes fuzzer_stats / plot_data into
+// (CAMPAIGN_DIR in attached_assets/tst_1759732713798.py, relative to where it runs)
+const campaignDir = path.resolve(process.env.FUZZER_CAMPAIGN_DIR ?? "test_files/campaigns");
+
+async function readOptional(file: string): Promise<string | undefined> {
+  try {
+    return await fs.readFile(file, "utf-8");
+  } catch {
+    return undefined;
+  }
+}
+
+// "key : value" lines -> object
+function parseFuzzerStats(text: string): Record<string, string> {
+  const stats: Record<string, string> = {};
+  for (const line of text.split("\n")) {
+    const sep = line.indexOf(":");
+    if (sep > 0) {
+      stats[line.slice(0, sep).trim()] = line.slice(sep + 1).trim();
+    }
+  }
+  return stats;
+}
+
+// "# field, ..." header + CSV rows -> objects, optionally only rows after `since` (execs_done).
+// Several rows can share a unix_time second, but execs_done only grows within a campaign.
+function parsePlotData(text: string, since: number): Record<string, number>[] {
+  const [header, ...rows] = text.split("\n");
+  const fields = header.replace(/^#\s*/, "").split(",").map((field) => field.trim());
+  const points: Record<string, number>[] = [];
+  for (const row of rows) {
+    const values = row.split(",").map(Number);
+    // Skip blank lines and a row the fuzzer is still writing
+    if (values.length !== fields.length || values.some(Number.isNaN)) continue;
+    const point = Object.fromEntries(fields.map((field, i) => [field, values[i]]));
+    if (point.execs_done > since) points.push(point);
+  }
+  return points;
+}
+
 export async function registerRoutes(app: Express): Promise<Server> {
   // put application routes here
   // prefix all routes with /api
@@ -9,6 +51,38 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // use storage to perform CRUD operations on the storage interface
   // e.g. storage.insertUser(user) or storage.getUserByUsername(username)
 
+  // Live fuzzer telemetry for a dashboard: every campaign's latest stats and
+  // its plot_data series. Poll with ?since[<method>]=<last execs_done> (or one
+  // ?since=<execs_done> for every campaign) for new points only.
+  app.get("/api/fuzzer/stats", async (req, res) => {
+    const since = req.query.since;
+    const sinceFor = (method: string) => {
+      const value = typeof since === "object" && since !== null && !Array.isArray(since)
+        ? since[method]
+        : since;
+      return Number(value ?? 0) || 0;
+    };
+    let methods: string[];
+    try {
+      methods = await fs.readdir(campaignDir);
+    } catch {
+      return res.json({ campaigns: [] });
+    }
+
+    const campaigns = [];
+    for (const method of methods.sort()) {
+      const stats = await readOptional(path.join(campaignDir, method, "fuzzer_stats"));
+      if (stats === undefined) continue;
+      const plot = await readOptional(path.join(campaignDir, method, "plot_data"));
+      campaigns.push({
+        method,
+        stats: parseFuzzerStats(stats),
+        plot: plot === undefined ? [] : parsePlotData(plot, sinceFor(method)),
+      });
+    }
+    res.json({ campaigns });
+  });
+
   const httpServer = createServer(app);
 
   return httpServer;